@@ -2,11 +2,97 @@
 # 🧠 Unified AI Assistant – LoanMVP 2025 Architecture
 # =========================================================
 
+import hashlib
 import os
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from openai import OpenAI
 from datetime import datetime
 
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+from LoanMVP.utils.ttl_cache import TTLCache
+
+# Built on first use and shared by every AIAssistant, so constructing an
+# assistant stays cheap and importing this module never opens a client.
+_client = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> OpenAI:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return _client
+
+
+AI_ERROR_REPLY = "⚠️ The AI assistant encountered a problem generating a reply."
+
+# ---------------------------------------------------------
+# Outbound throttling
+# ---------------------------------------------------------
+# Batch jobs can fan out many prompts at once; cap in-flight calls and pace
+# them under the account's request rate so we wait locally instead of burning
+# round-trips on 429 responses.
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "10"))
+LLM_REQUESTS_PER_MINUTE = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "500"))
+
+
+class _RequestRateLimiter:
+    """Token bucket refilled continuously at ``per_minute`` requests/minute."""
+
+    def __init__(self, per_minute: int):
+        self.rate = max(per_minute, 1) / 60.0
+        self.capacity = float(max(per_minute, 1))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Reserve the slot now; a negative balance is the queue ahead of us.
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+_llm_slots = threading.BoundedSemaphore(max(LLM_MAX_CONCURRENCY, 1))
+_llm_rate_limiter = _RequestRateLimiter(LLM_REQUESTS_PER_MINUTE)
+
+# ---------------------------------------------------------
+# Reply cache
+# ---------------------------------------------------------
+# Dashboard summaries are rebuilt from the same prompt on every page view, so
+# replies are cached per (role, prompt) for a few minutes. A per-key lock keeps
+# concurrent misses for one prompt down to a single OpenAI call; the locks are
+# held weakly, so one lives exactly as long as some caller is using it. Expired
+# replies are kept a while longer and served if a refresh attempt fails.
+REPLY_CACHE_TTL_SECONDS = 300
+REPLY_CACHE_STALE_SECONDS = 3600
+REPLY_CACHE_MAX_ENTRIES = 1024
+_reply_cache = TTLCache(
+    REPLY_CACHE_TTL_SECONDS,
+    max_entries=REPLY_CACHE_MAX_ENTRIES,
+    stale_ttl=REPLY_CACHE_STALE_SECONDS,
+)
+_reply_key_locks = weakref.WeakValueDictionary()
+_reply_locks_guard = threading.Lock()
+
+
+def _reply_cache_key(message: str, role: str) -> str:
+    # Prompts built from multi-line f-strings differ only in indentation and
+    # spacing; collapse whitespace so they share one cached reply.
+    canonical = " ".join((message or "").split())
+    digest = hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+    return f"v1:llm:{role}:{digest}"
+
 
 # ---------------------------------------------------------
 # Context Map
@@ -84,9 +170,13 @@ class AIAssistant:
     """Unified assistant for all roles — contextual replies and summaries."""
 
     def __init__(self):
-        self.client = client
         self.default_model = "gpt-4o-mini"
-        self.history = []
+        # Bounded so long-lived shared instances don't grow without limit.
+        self.history = deque(maxlen=50)
+
+    @property
+    def client(self) -> OpenAI:
+        return _get_client()
 
     # -----------------------------------------------------
     def generate_reply(self, message: str, role: str = "general") -> str:
@@ -94,15 +184,17 @@ class AIAssistant:
         try:
             print("DEBUG AIAssistant.self.client:", type(self.client), repr(self.client))
             context = ROLE_CONTEXT.get(role, ROLE_CONTEXT["general"])
-            response = self.client.chat.completions.create(
-                model=self.default_model,
-                messages=[
-                    {"role": "system", "content": context},
-                    {"role": "user", "content": message}
-                ],
-                temperature=0.7,
-                max_tokens=400,
-            )
+            _llm_rate_limiter.acquire()
+            with _llm_slots:
+                response = self.client.chat.completions.create(
+                    model=self.default_model,
+                    messages=[
+                        {"role": "system", "content": context},
+                        {"role": "user", "content": message}
+                    ],
+                    temperature=0.7,
+                    max_tokens=400,
+                )
             reply = response.choices[0].message.content.strip()
             self.history.append({
                 "timestamp": datetime.now(),
@@ -113,7 +205,44 @@ class AIAssistant:
             return reply
         except Exception as e:
             print(f"⚠️ OpenAI error: {e}")
-            return "⚠️ The AI assistant encountered a problem generating a reply."
+            return AI_ERROR_REPLY
+
+    # -----------------------------------------------------
+    def cached_reply(self, message: str, role: str = "general", ttl: int = REPLY_CACHE_TTL_SECONDS) -> str:
+        """
+        ``generate_reply`` behind the short-lived reply cache. Errors are not
+        cached; if a refresh fails, the last good reply is returned instead.
+        """
+        key = _reply_cache_key(message, role)
+        reply = _reply_cache.get(key)
+        if reply is not None:
+            return reply
+
+        with _reply_locks_guard:
+            lock = _reply_key_locks.setdefault(key, threading.Lock())
+        with lock:
+            reply = _reply_cache.get(key)
+            if reply is None:
+                reply = self.generate_reply(message, role)
+                if reply != AI_ERROR_REPLY:
+                    _reply_cache.set(key, reply, ttl=ttl)
+                else:
+                    reply = _reply_cache.get(key, allow_stale=True) or reply
+        return reply
+
+    # -----------------------------------------------------
+    def generate_replies(self, prompts) -> list:
+        """
+        Run independent ``(message, role)`` prompts concurrently and return the
+        replies in the same order. Each call is network-bound, so the total
+        wait is roughly the slowest prompt rather than their sum.
+        """
+        prompts = list(prompts)
+        if len(prompts) <= 1:
+            return [self.generate_reply(message, role) for message, role in prompts]
+        with ThreadPoolExecutor(max_workers=len(prompts)) as pool:
+            futures = [pool.submit(self.generate_reply, message, role) for message, role in prompts]
+            return [future.result() for future in futures]
 
     # -----------------------------------------------------
     def evaluate_preapproval(self, credit_score, revenue, time_in_business, loan_amount, collateral):
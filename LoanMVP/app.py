@@ -21,6 +21,7 @@ from flask import (
 )
 from sqlalchemy.exc import SQLAlchemyError
 from flask_cors import CORS
+from jinja2 import FileSystemBytecodeCache
 from flask_socketio import SocketIO
 from flask_migrate import Migrate
 from flask_login import LoginManager, current_user, login_required, user_logged_in
@@ -722,6 +723,11 @@ def create_app():
 
     app.jinja_env.globals["safe_url_for"] = safe_url_for
 
+    bytecode_cache_dir = app.config.get("JINJA_BYTECODE_CACHE_DIR")
+    if bytecode_cache_dir:
+        os.makedirs(bytecode_cache_dir, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+
     @app.before_request
     def make_session_permanent():
         session.permanent = True
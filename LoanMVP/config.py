@@ -151,6 +151,8 @@ class Config:
     STRIPE_PRICE_EXPLORER = os.environ.get("STRIPE_PRICE_EXPLORER", "price_1TKozE5qeUQ54SvQULWgWqyT")
     STRIPE_PRICE_ACADEMY_PRO = os.environ.get("STRIPE_PRICE_ACADEMY_PRO", "price_1TbNb85qeUQ54SvQsEQADWXi")
     STRIPE_PRICE_ACADEMY_STARTER = os.environ.get("STRIPE_PRICE_ACADEMY_STARTER", "price_1TbNYf5qeUQ54SvQ2k1TiBJh")
+    # One-off payment products by payment_type: "Appraisal Fee:prod_123,Credit Report:prod_456"
+    STRIPE_PAYMENT_PRODUCTS = os.environ.get("STRIPE_PAYMENT_PRODUCTS", "")
     # White-label Academy access codes: "CODE1:tier,CODE2:tier" (e.g. "REMAX-TEAM:elite,ACME-LO:lending")
     ACADEMY_ACCESS_CODES = os.environ.get("ACADEMY_ACCESS_CODES", "")
     INVESTOR_GRANDFATHERED_CUTOFF = os.environ.get("INVESTOR_GRANDFATHERED_CUTOFF", "2026-05-12T00:00:00")
@@ -239,6 +241,9 @@ class Config:
     BETA_SUBSCRIPTION_BYPASS = _env_bool("BETA_SUBSCRIPTION_BYPASS", False)
     BETA_ACCESS_AUTO_APPROVE = _env_bool("BETA_ACCESS_AUTO_APPROVE", False)
 
+    # Compiled template bytecode survives worker restarts when set.
+    JINJA_BYTECODE_CACHE_DIR = os.environ.get("JINJA_BYTECODE_CACHE_DIR")
+
     @classmethod
     def validate(cls):
         return
@@ -268,6 +273,10 @@ class ProductionConfig(Config):
     DEBUG = False
     SOCKETIO_ASYNC_MODE = os.environ.get("SOCKETIO_ASYNC_MODE", "threading").strip().lower()
     ENABLE_DEVELOPER_TOOLS = False
+    TEMPLATES_AUTO_RELOAD = False
+    JINJA_BYTECODE_CACHE_DIR = os.environ.get(
+        "JINJA_BYTECODE_CACHE_DIR", os.path.join(INSTANCE_PATH, "jinja_cache")
+    )
 
     @classmethod
     def validate(cls):
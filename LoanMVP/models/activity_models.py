@@ -15,5 +15,9 @@ class BorrowerActivity(db.Model):
     borrower = db.relationship("BorrowerProfile", backref=db.backref("activities", lazy=True))
     investor_profile = db.relationship("InvestorProfile", backref=db.backref("activities", lazy=True))
 
+    __table_args__ = (
+        db.Index("ix_borrower_activity_investor_ts", investor_profile_id, timestamp.desc()),
+    )
+
     def __repr__(self):
         return f"<BorrowerActivity {self.action} @ {self.timestamp:%Y-%m-%d}>"
@@ -23,6 +23,12 @@ class CallLog(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        db.Index("ix_call_log_user_created", user_id, created_at.desc()),
+    )
+
+    user = db.relationship("User")
+
     def __repr__(self):
         return f"<CallLog {self.id} - {self.direction} - {self.contact_name}>"
 
@@ -23,6 +23,11 @@ class Lead(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        db.Index("ix_lead_officer_created", assigned_officer_id, created_at.desc()),
+        db.Index("ix_lead_status_created", status, created_at.desc()),
+    )
+
     # Relationships
     property = db.relationship("Property", backref="leads")
     calls = db.relationship("CallLog", backref="lead", lazy="dynamic")
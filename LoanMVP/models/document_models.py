@@ -35,6 +35,11 @@ class LoanDocument(db.Model):
     loan_application = db.relationship("LoanApplication", back_populates="loan_documents")
     investor_profile = db.relationship("InvestorProfile", back_populates="documents")
 
+    __table_args__ = (
+        db.Index("ix_loan_document_investor_status", investor_profile_id, status),
+        db.Index("ix_loan_document_borrower_created", borrower_profile_id, created_at.desc()),
+    )
+
     def __repr__(self):
         return f"<LoanDocument {self.file_name} Loan:{self.loan_id}>"
 
@@ -143,6 +148,10 @@ class ESignedDocument(db.Model):
     loan_document = db.relationship("LoanDocument", backref="esign_record")
     investor_profile = db.relationship("InvestorProfile", back_populates="esigned_documents")
 
+    __table_args__ = (
+        db.Index("ix_esigned_document_investor", investor_profile_id),
+    )
+
     def __repr__(self):
         return f"<ESignedDocument {self.document_name} status={self.status}>"
 
@@ -182,6 +182,12 @@ class LoanApplication(db.Model):
          cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        db.Index("ix_loan_application_investor_active", investor_profile_id, is_active),
+        db.Index("ix_loan_application_borrower_created", borrower_profile_id, created_at.desc()),
+        db.Index("ix_loan_application_investor_created", investor_profile_id, created_at.desc()),
+    )
+
     def calculate_ltv(self):
         """Calculate Loan-to-Value Ratio."""
         if self.amount and self.property_value:
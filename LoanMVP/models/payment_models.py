@@ -34,3 +34,7 @@ class PaymentRecord(db.Model):
     borrower = db.relationship("BorrowerProfile", backref="payments")
     loan = db.relationship("LoanApplication", backref="payments")
     investor_profile = db.relationship("InvestorProfile", backref="payments")
+
+    __table_args__ = (
+        db.Index("ix_payment_record_user_ts", user_id, timestamp.desc()),
+    )
@@ -2,6 +2,7 @@
 from LoanMVP.extensions import db
 from datetime import datetime
 from sqlalchemy import Text
+from sqlalchemy.dialects.postgresql import JSONB
 
 # ====================================
 # 🏠 PROPERTY MODEL
@@ -82,18 +83,37 @@ class SavedProperty(db.Model):
 
     property_id = db.Column(db.String(50))
     address = db.Column(db.String(255))
+    # Stored lowercase copy of address maintained by the database, so
+    # duplicate checks compare with a plain ``=`` against a btree index.
+    address_lower = db.Column(db.String(255), db.Computed("lower(address)", persisted=True))
     price = db.Column(db.String(50))
     sqft = db.Column(db.Integer, nullable=True)
     saved_at = db.Column(db.DateTime, default=datetime.utcnow)
     zipcode = db.Column(db.String(20))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
-    resolved_json = db.Column(db.Text, nullable=True)
+    # JSONB on Postgres so the resolver payload is stored pre-parsed and
+    # assigned as a dict; plain JSON (text) on other dialects.
+    resolved_json = db.Column(db.JSON().with_variant(JSONB, "postgresql"), nullable=True)
     resolved_at = db.Column(db.DateTime, nullable=True)
 
     investor_profile = db.relationship("InvestorProfile", back_populates="saved_properties")
     borrower = db.relationship("BorrowerProfile", back_populates="saved_properties")
 
+    # Duplicate checks in the save/search routes match on
+    # (investor_profile_id, address_lower); without this index every lookup
+    # is a seq scan over the investor's saved inventory. It's unique so the
+    # save routes can upsert with INSERT ... ON CONFLICT against it.
+    __table_args__ = (
+        db.Index(
+            "uq_saved_properties_investor_address_lower",
+            investor_profile_id,
+            address_lower,
+            unique=True,
+        ),
+        db.Index("ix_saved_properties_investor_created", investor_profile_id, created_at.desc()),
+    )
+
 @property
 def rehab_before_url(self):
     payload = self.resolved_json or {}
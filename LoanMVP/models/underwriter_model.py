@@ -98,6 +98,16 @@ class UnderwritingCondition(db.Model):
     loan = db.relationship("LoanApplication", back_populates="underwriting_conditions")
     investor_profile = db.relationship("InvestorProfile", back_populates="conditions")
 
+    __table_args__ = (
+        db.Index("ix_underwriting_condition_investor_loan", investor_profile_id, loan_id),
+        db.Index(
+            "ix_underwriting_condition_borrower_loan_created",
+            borrower_profile_id,
+            loan_id,
+            created_at.desc(),
+        ),
+    )
+
     def __repr__(self):
         return f"<UnderwritingCondition ID={self.id} InvestorProfile={self.investor_profile_id} Status={self.status}>"
 
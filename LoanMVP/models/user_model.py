@@ -208,10 +208,8 @@ class User(UserMixin, db.Model):
 
     @full_name.expression
     def full_name(cls):
+        # String "+" compiles to || (or CONCAT on MySQL), which every
+        # backend supports; func.concat is missing on SQLite before 3.44.
         return func.trim(
-            func.concat(
-                func.coalesce(cls.first_name, ""),
-                " ",
-                func.coalesce(cls.last_name, "")
-            )
+            func.coalesce(cls.first_name, "") + " " + func.coalesce(cls.last_name, "")
         )
@@ -2,10 +2,10 @@
 # 🏛 ADMIN ROUTES — LoanMVP 2025 (Stabilized Version)
 # =========================================================
 
-from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, send_file, current_app, abort
+from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, current_app, abort
 from flask_login import current_user, login_required
 from collections import defaultdict
-from sqlalchemy import func, desc, inspect, text
+from sqlalchemy import func, desc, inspect, select, text
 from sqlalchemy.orm import aliased
 from datetime import datetime, timedelta
 import json
@@ -13,6 +13,7 @@ from LoanMVP.extensions import db, csrf
 from werkzeug.security import generate_password_hash
 
 from LoanMVP.ai.base_ai import AIAssistant     # ✅ Unified AI import
+from LoanMVP.utils.csv_stream import csv_download
 from LoanMVP.utils.decorators import role_required
 from LoanMVP.utils.emailer import send_email  # or wherever you saved it
 from LoanMVP.utils.role_helpers import is_admin, company_billing_hold_reason
@@ -38,8 +39,6 @@ from LoanMVP.models.contractor_models import ContractorBidOpportunity
 from LoanMVP.services.notify_service import notify
 from LoanMVP.services.notification_service import create_notification
 
-import io
-import csv
 import stripe
 import time
 
@@ -1002,26 +1001,27 @@ def dashboard():
     if current_user.role == "master_admin":
         company = Company.query.order_by(Company.id.asc()).first()
 
-    stats = {
-        "total_users": User.query.count(),
-        "total_loans": LoanApplication.query.count() if LoanApplication else 0,
-        "total_docs": LoanDocument.query.count() if LoanDocument else 0,
-        "pending_tasks": (
-            Task.query.filter(db.func.lower(Task.status) == "pending").count()
-            if Task and hasattr(Task, "status")
-            else 0
+    # Every tile count in one round-trip: one scalar subquery per counter.
+    stat_counts = {
+        "total_users": select(func.count(User.id)),
+        "total_loans": select(func.count(LoanApplication.id)),
+        "total_docs": select(func.count(LoanDocument.id)),
+        "pending_tasks": select(func.count(Task.id)).where(func.lower(Task.status) == "pending"),
+        "pending_requests": select(func.count(AccessRequest.id)).where(
+            func.lower(AccessRequest.status) == "pending"
+        ),
+        "approved_requests": select(func.count(AccessRequest.id)).where(
+            func.lower(AccessRequest.status) == "approved"
+        ),
+        "total_companies": select(func.count(Company.id)),
+        "pending_invites": select(func.count(UserInvite.id)).where(
+            func.lower(UserInvite.status) == "pending"
         ),
-        "pending_requests": AccessRequest.query.filter(
-            db.func.lower(AccessRequest.status) == "pending"
-        ).count(),
-        "approved_requests": AccessRequest.query.filter(
-            db.func.lower(AccessRequest.status) == "approved"
-        ).count(),
-        "total_companies": Company.query.count(),
-        "pending_invites": UserInvite.query.filter(
-            db.func.lower(UserInvite.status) == "pending"
-        ).count(),
     }
+    stats = dict(zip(
+        stat_counts,
+        db.session.query(*(stmt.scalar_subquery() for stmt in stat_counts.values())).one(),
+    ))
 
     recent_requests = (
         AccessRequest.query
@@ -1049,8 +1049,6 @@ def dashboard():
         .order_by(Lead.created_at.desc())
         .limit(5)
         .all()
-        if Lead and hasattr(Lead, "created_at")
-        else []
     )
 
     logs = (
@@ -1058,8 +1056,6 @@ def dashboard():
         .order_by(SystemLog.created_at.desc())
         .limit(8)
         .all()
-        if SystemLog and hasattr(SystemLog, "created_at")
-        else []
     )
 
     def last_n_months(n=6):
@@ -1091,16 +1087,20 @@ def dashboard():
         series = [counts.get((year, month), 0) for year, month in month_keys]
         return labels, series
 
-    if LoanApplication and hasattr(LoanApplication, "created_at"):
-        loan_records = LoanApplication.query.all()
-        loan_volume_labels, loan_volume_series = monthly_series(
-            loan_records, "created_at", 6
-        )
-    else:
-        loan_volume_labels = ["Jan", "Feb", "Mar", "Apr", "May", "Jun"]
-        loan_volume_series = [0, 0, 0, 0, 0, 0]
+    # The charts only bucket created_at over the last six months.
+    series_year, series_month = last_n_months(6)[0]
+    series_start = datetime(series_year, series_month, 1)
 
-    user_records = User.query.all()
+    loan_records = (
+        LoanApplication.query
+        .with_entities(LoanApplication.created_at)
+        .filter(LoanApplication.created_at >= series_start)
+    )
+    loan_volume_labels, loan_volume_series = monthly_series(
+        loan_records, "created_at", 6
+    )
+
+    user_records = User.query.with_entities(User.created_at).filter(User.created_at >= series_start)
     user_growth_labels, user_growth_series = monthly_series(
         user_records, "created_at", 6
     )
@@ -1598,7 +1598,7 @@ def approve_subscription_request(request_id):
         if plan == "investor_upgrade":
             user = User.query.get(sub_request.user_id)
             user.role = "investor"
-            if not InvestorProfile.query.filter_by(user_id=user.id).first():
+            if db.session.query(InvestorProfile.id).filter_by(user_id=user.id).first() is None:
                 db.session.add(InvestorProfile(
                     user_id=user.id,
                     full_name=f"{user.first_name or ''} {user.last_name or ''}".strip() or None,
@@ -2280,6 +2280,11 @@ def company_finances_delete(entry_id):
 # =========================================================
 # 📊 SYSTEM REPORTS (CSV EXPORT)
 # =========================================================
+# Exports walk whole tables once: rows are read in batches instead of .all()
+# and the CSV is streamed out in small chunks rather than built in memory.
+REPORT_EXPORT_BATCH_SIZE = 500
+
+
 @admin_bp.route("/reports", methods=["GET", "POST"])
 @login_required
 @role_required("admin_group")
@@ -2299,42 +2304,39 @@ def reports():
     total_invites = UserInvite.query.filter_by(company_id=company.id).count() if company else UserInvite.query.count()
 
     if request.method == "POST" and report_type:
-        output = io.StringIO()
-        writer = csv.writer(output)
-
         if report_type == "users":
-            writer.writerow(["ID", "Username", "Email", "Role", "Created"])
-            for u in users_query.all():
-                writer.writerow([u.id, u.username, u.email, u.role, u.created_at])
+            header = ["ID", "Username", "Email", "Role", "Created"]
+            rows = (
+                [u.id, u.username, u.email, u.role, u.created_at]
+                for u in users_query.yield_per(REPORT_EXPORT_BATCH_SIZE)
+            )
 
         elif report_type == "invites":
             invite_query = UserInvite.query.filter_by(company_id=company.id) if company else UserInvite.query
-            writer.writerow(["ID", "Email", "Role", "Status", "Expires", "Created"])
-            for invite in invite_query.all():
-                writer.writerow([invite.id, invite.email, invite.role, invite.status, invite.expires_at, invite.created_at])
+            header = ["ID", "Email", "Role", "Status", "Expires", "Created"]
+            rows = (
+                [invite.id, invite.email, invite.role, invite.status, invite.expires_at, invite.created_at]
+                for invite in invite_query.yield_per(REPORT_EXPORT_BATCH_SIZE)
+            )
 
         elif report_type == "loans" and not company:
-            writer.writerow(["ID", "Borrower ID", "Type", "Amount", "Status", "Created"])
-            for l in LoanApplication.query.all():
-                writer.writerow([l.id, l.borrower_profile_id, l.loan_type, l.amount, l.status, l.created_at])
+            header = ["ID", "Borrower ID", "Type", "Amount", "Status", "Created"]
+            rows = (
+                [l.id, l.borrower_profile_id, l.loan_type, l.amount, l.status, l.created_at]
+                for l in LoanApplication.query.yield_per(REPORT_EXPORT_BATCH_SIZE)
+            )
 
         elif report_type == "documents" and not company:
-            writer.writerow(["ID", "Borrower ID", "Name", "Status", "Created"])
-            for d in LoanDocument.query.all():
-                writer.writerow([d.id, d.borrower_profile_id, d.document_name, d.status, d.created_at])
+            header = ["ID", "Borrower ID", "Name", "Status", "Created"]
+            rows = (
+                [d.id, d.borrower_profile_id, d.document_name, d.status, d.created_at]
+                for d in LoanDocument.query.yield_per(REPORT_EXPORT_BATCH_SIZE)
+            )
         else:
             flash("That report is not available for this admin workspace.", "warning")
             return redirect(url_for("admin.reports"))
 
-        output.seek(0)
-        csv_data = output.getvalue()
-
-        return send_file(
-            io.BytesIO(csv_data.encode("utf-8")),
-            as_attachment=True,
-            download_name=f"{report_type}_report.csv",
-            mimetype="text/csv"
-        )
+        return csv_download(f"{report_type}_report.csv", header, rows)
 
     return render_template(
         "admin/reports.html",
@@ -2557,8 +2559,17 @@ def analytics():
         total_loans = LoanApplication.query.filter_by(company_id=company.id).count() if hasattr(LoanApplication, "company_id") else 0
         total_docs = LoanDocument.query.filter_by(company_id=company.id).count() if hasattr(LoanDocument, "company_id") else 0
         active_borrowers = BorrowerProfile.query.filter_by(company_id=company.id).count() if hasattr(BorrowerProfile, "company_id") else 0
-        loan_rows = LoanApplication.query.filter_by(company_id=company.id).all() if hasattr(LoanApplication, "company_id") else []
-        user_rows = users_query.all()
+        loan_status_rows = (
+            db.session.query(LoanApplication.status, func.count(LoanApplication.id))
+            .filter(LoanApplication.company_id == company.id)
+            .group_by(LoanApplication.status)
+            .all()
+        ) if hasattr(LoanApplication, "company_id") else []
+        role_rows = (
+            users_query.with_entities(User.role, func.count(User.id))
+            .group_by(User.role)
+            .all()
+        )
         ai_summary = (
             f"{company.name} analytics: {total_users} team user(s), "
             f"{total_loans} loan file(s), {total_docs} document(s), and "
@@ -2570,20 +2581,30 @@ def analytics():
         total_loans = LoanApplication.query.count()
         total_docs = LoanDocument.query.count()
         active_borrowers = User.query.filter_by(role="borrower").count()
-        loan_rows = LoanApplication.query.all()
-        user_rows = users_query.all()
+        loan_status_rows = (
+            db.session.query(LoanApplication.status, func.count(LoanApplication.id))
+            .group_by(LoanApplication.status)
+            .all()
+        )
+        role_rows = (
+            db.session.query(User.role, func.count(User.id))
+            .group_by(User.role)
+            .all()
+        )
         ai_summary = (
             f"Platform analytics: {total_users} total user(s), {total_loans} loan file(s), "
             f"{total_docs} document(s), and {active_borrowers} borrower account(s)."
         )
 
+    # Counts are grouped in SQL; raw values that share a display label
+    # (e.g. "in_review" / "In Review") are merged here.
     loan_status_counts = defaultdict(int)
-    for loan in loan_rows:
-        loan_status_counts[(getattr(loan, "status", None) or "unknown").replace("_", " ").title()] += 1
+    for status, count in loan_status_rows:
+        loan_status_counts[(status or "unknown").replace("_", " ").title()] += count
 
     role_counts = defaultdict(int)
-    for user in user_rows:
-        role_counts[(getattr(user, "role", None) or "unknown").replace("_", " ").title()] += 1
+    for role, count in role_rows:
+        role_counts[(role or "unknown").replace("_", " ").title()] += count
 
     return render_template(
         "admin/analytics.html",
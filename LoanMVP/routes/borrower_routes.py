@@ -37,6 +37,7 @@ from LoanMVP.models.processor_model import ProcessorProfile
 from LoanMVP.models.admin import SubscriptionRequest
 
 borrower_bp = Blueprint("borrower", __name__, url_prefix="/borrower")
+assistant = AIAssistant()
 
 RENTCAST_API_KEY = os.getenv("RENTCAST_API_KEY", "").strip()
 RENTCAST_BASE_URL = "https://api.rentcast.io/v1"
@@ -173,13 +174,13 @@ def dashboard():
         flash("Please complete your borrower profile first.", "warning")
         return redirect(url_for("borrower.create_profile"))
 
-    loan = get_active_loan(borrower)
-
     loans = (
         LoanApplication.query.filter_by(borrower_profile_id=borrower.id)
         .order_by(LoanApplication.created_at.desc())
         .all()
     )
+    # Same row get_active_loan() would fetch: the newest active loan.
+    loan = next((l for l in loans if l.is_active), None)
 
     documents = (
         LoanDocument.query.filter_by(borrower_profile_id=borrower.id)
@@ -187,47 +188,7 @@ def dashboard():
         .all()
     )
 
-    conditions = []
-    if loan:
-        conditions = (
-            UnderwritingCondition.query.filter_by(
-                borrower_profile_id=borrower.id,
-                loan_id=loan.id
-            )
-            .order_by(UnderwritingCondition.created_at.desc())
-            .all()
-        )
-
-    open_conditions = [
-        c for c in conditions
-        if (c.status or "").lower() not in ["cleared", "completed", "waived"]
-    ]
-
-    progress_percent = 0
-    if conditions:
-        cleared = len([
-            c for c in conditions
-            if (c.status or "").lower() in ["cleared", "completed"]
-        ])
-        progress_percent = int((cleared / len(conditions)) * 100)
-
-    ai_message = None
-    try:
-        assistant = AIAssistant()
-        if loan and open_conditions:
-            prompt = (
-                f"Write a short, clear next-step message for a borrower. "
-                f"They have {len(open_conditions)} open conditions. "
-                f"The next item is: {open_conditions[0].description}."
-            )
-        elif loan:
-            prompt = "Write a short borrower message saying their file is in review and they should monitor conditions and messages."
-        else:
-            prompt = "Write a short borrower message encouraging them to start their first funding application."
-
-        ai_message = assistant.generate_reply(prompt, "borrower_next_step")
-    except Exception:
-        ai_message = None
+    conditions, open_conditions, progress_percent = _loan_conditions(borrower, loan)
 
     checklist_items = []
     if loan and open_conditions:
@@ -256,7 +217,6 @@ def dashboard():
         conditions=conditions,
         open_conditions=open_conditions,
         progress_percent=progress_percent,
-        ai_message=ai_message,
         checklist_items=checklist_items,
         active_tab="dashboard",
         title="Borrower Dashboard",
@@ -335,7 +295,6 @@ def apply():
             borrower.ssn = ssn
 
         try:
-            assistant = AIAssistant()
             ai_summary = assistant.generate_reply(
                 f"Create a short summary for a borrower applying for a {loan_type} loan on {property_address}.",
                 "borrower_apply",
@@ -703,6 +662,67 @@ def documents():
     )
 
 
+@borrower_bp.route("/dashboard/next-step")
+@login_required
+@role_required("borrower")
+def dashboard_next_step():
+    """AJAX: AI next-step message, loaded after the dashboard renders."""
+    borrower = get_current_borrower()
+    loan = get_active_loan(borrower)
+    _conditions, open_conditions, _progress = _loan_conditions(borrower, loan)
+
+    if loan and open_conditions:
+        prompt = (
+            f"Write a short, clear next-step message for a borrower. "
+            f"They have {len(open_conditions)} open conditions. "
+            f"The next item is: {open_conditions[0].description}."
+        )
+    elif loan:
+        prompt = "Write a short borrower message saying their file is in review and they should monitor conditions and messages."
+    else:
+        prompt = "Write a short borrower message encouraging them to start their first funding application."
+
+    try:
+        ai_message = assistant.cached_reply(prompt, "borrower_next_step")
+    except Exception:
+        ai_message = None
+
+    if not ai_message:
+        return jsonify({"html": None})
+    return jsonify({"html": str(current_app.jinja_env.filters["md"](ai_message))})
+
+
+_CLEARED_CONDITION_STATUSES = frozenset(("cleared", "completed"))
+
+
+def _loan_conditions(borrower, loan):
+    """The active loan's conditions, the still-open ones, and percent cleared."""
+    if not borrower or not loan:
+        return [], [], 0
+
+    conditions = (
+        UnderwritingCondition.query.filter_by(
+            borrower_profile_id=borrower.id,
+            loan_id=loan.id
+        )
+        .order_by(UnderwritingCondition.created_at.desc())
+        .all()
+    )
+
+    # One pass over the conditions for both the open list and progress.
+    open_conditions = []
+    cleared = 0
+    for c in conditions:
+        condition_status = (c.status or "").lower()
+        if condition_status in _CLEARED_CONDITION_STATUSES:
+            cleared += 1
+        elif condition_status != "waived":
+            open_conditions.append(c)
+
+    progress_percent = int((cleared / len(conditions)) * 100) if conditions else 0
+    return conditions, open_conditions, progress_percent
+
+
 @borrower_bp.route("/upload-document", methods=["GET", "POST"])
 @login_required
 @role_required("borrower")
@@ -1017,7 +1037,6 @@ def ai_suggest_description():
     )
 
     try:
-        assistant = AIAssistant()
         suggestion = assistant.generate_reply(prompt, "deal_summary_assist")
         return jsonify({"suggestion": suggestion})
     except Exception:
@@ -2,20 +2,20 @@
 # 💼 LoanMVP CRM Routes — 2025 Unified Final Version
 # =========================================================
 
-from flask import Blueprint, render_template, request, jsonify, flash, redirect, url_for, make_response
+from flask import Blueprint, render_template, request, jsonify, flash, redirect, url_for
 from flask_login import current_user
 from datetime import datetime
-from sqlalchemy import func, case, or_
+from sqlalchemy import func, case, extract, or_, select
+from sqlalchemy.orm import defer, joinedload
 from random import choice
+from collections import Counter
 import json
 import re
-import csv
 
 import os, requests
-from io import StringIO
 from LoanMVP.app import socketio
 from LoanMVP.extensions import db, csrf
-from LoanMVP.ai.base_ai import AIAssistant
+from LoanMVP.ai.base_ai import AI_ERROR_REPLY, AIAssistant
 from LoanMVP.models.crm_models import Lead, Task, Message, Partner, LeadSource, CRMNote, PartnerNote
 from LoanMVP.models.call_model import CallLog
 from LoanMVP.models.loan_models import LoanApplication, BorrowerProfile
@@ -23,6 +23,10 @@ from LoanMVP.models.campaign_model import Campaign
 from LoanMVP.models.loan_officer_model import LoanOfficerProfile
 from LoanMVP.models.user_model import User
 from LoanMVP.utils.decorators import role_required
+from LoanMVP.utils.background import run_in_background
+from LoanMVP.utils.csv_stream import csv_download
+from LoanMVP.utils.safe_http import safe_call
+from LoanMVP.utils.ttl_cache import TTLCache
 
 # ---------------------------------------------------------
 # Blueprint Setup
@@ -30,6 +34,36 @@ from LoanMVP.utils.decorators import role_required
 crm_bp = Blueprint("crm", __name__, url_prefix="/crm")
 assistant = AIAssistant()
 
+DASHBOARD_LEAD_LIMIT = 50
+CALL_REPORT_BATCH_SIZE = 1000
+CALL_REPORT_HEADERS = (
+    "ID",
+    "User",
+    "Contact Name",
+    "Phone",
+    "Sentiment",
+    "Direction",
+    "Duration (sec)",
+    "Outcome",
+    "Notes",
+    "AI Summary",
+    "Created At",
+)
+LEADS_PAGE_SIZE = 50
+LEAD_SEARCH_LIMIT = 200
+
+# Quick tips are short-lived; page summaries use the default reply TTL.
+AI_TIP_CACHE_TTL_SECONDS = 60
+
+CALL_INSIGHT_LABELS = ("Total", "Success", "Voicemail", "Follow-Up", "Positive", "Neutral", "Negative")
+
+DASHBOARD_SUMMARY_PROMPT = (
+    "Summarize {role_view} with stats: "
+    "total_leads={total_leads} active_leads={active_leads} recent_leads={recent_leads} "
+    "contacted_leads={contacted_leads} tasks_due={tasks_due} calls={calls} "
+    "messages={messages} conversion={conversion}."
+)
+
 
 
 def _crm_company_loan_officers():
@@ -81,6 +115,29 @@ def _choose_auto_assignee(officers):
     return ranked[0][1]
 
 
+# The call insights role filter lists every distinct user role; roles change
+# rarely, so the list is reused for a minute instead of scanning users per view.
+USER_ROLES_CACHE_TTL_SECONDS = 60
+_user_roles_cache = TTLCache(USER_ROLES_CACHE_TTL_SECONDS)
+
+
+def _user_roles():
+    roles = _user_roles_cache.get("roles")
+    if roles is not None:
+        return roles
+
+    roles = [r[0] for r in db.session.query(User.role).distinct() if r[0]]
+    _user_roles_cache.set("roles", roles)
+    return roles
+
+
+# call_table_refresh is polled by open dialer pages; keep the rendered table
+# until a new call is logged, and for at most CALL_TABLE_CACHE_TTL_SECONDS so
+# edits such as AI summaries still show up.
+CALL_TABLE_CACHE_TTL_SECONDS = 30
+_call_table_cache = TTLCache(CALL_TABLE_CACHE_TTL_SECONDS)
+
+
 def _company_scoped_lead_or_404(lead_id):
     return _company_scoped_leads_query().filter(Lead.id == lead_id).first_or_404()
 
@@ -129,6 +186,50 @@ def _parse_ai_leads(raw_text):
         })
     return leads
 
+
+POSITIVE_FEEDBACK_WORDS = frozenset({"great", "positive", "happy", "satisfied", "good"})
+NEGATIVE_FEEDBACK_WORDS = frozenset({"angry", "upset", "negative", "bad", "unhappy"})
+
+
+def _review_dialer_note(note):
+    """AI feedback on a dialer call note plus a keyword sentiment label."""
+    try:
+        ai_feedback = assistant.generate_reply(
+            f"Analyze call sentiment and summarize outcome for: {note}. "
+            f"Respond briefly with tone summary and key feedback.",
+            "crm_dialer_ai"
+        )
+
+        # simple keyword classification fallback
+        words = set(re.findall(r"[a-z]+", ai_feedback.lower()))
+        if words & POSITIVE_FEEDBACK_WORDS:
+            sentiment = "Positive"
+        elif words & NEGATIVE_FEEDBACK_WORDS:
+            sentiment = "Negative"
+        else:
+            sentiment = "Neutral"
+    except Exception:
+        ai_feedback = "AI feedback unavailable."
+        sentiment = "Neutral"
+
+    return ai_feedback, sentiment
+
+
+def _summarize_lead_call(call_id, note):
+    call = db.session.get(CallLog, call_id)
+    if not call:
+        return
+
+    try:
+        call.ai_summary = assistant.generate_reply(
+            f"Summarize this call note and key insights: {note}",
+            "crm_lead_call_summary"
+        )
+    except Exception:
+        call.ai_summary = "⚠️ AI summary unavailable."
+
+    db.session.commit()
+
 # ---------------------------------------------------------
 # 🧭 CRM Dashboard
 # ---------------------------------------------------------
@@ -145,8 +246,11 @@ def dashboard():
     # ----------------------------------------
     # Role-based lead & task visibility
     # ----------------------------------------
+    # Loan officers and processors work their whole lead list from here, so
+    # only the company-wide overview and the basic view are capped.
+    lead_limit = None
     if role == "loan_officer":
-        leads_list = _company_scoped_leads_query().order_by(Lead.created_at.desc()).all()
+        leads_query = _company_scoped_leads_query()
         tasks_list = (
             Task.query.filter_by(assigned_to=current_user.id)
             .order_by(Task.due_date.asc())
@@ -155,11 +259,9 @@ def dashboard():
         role_view = "Loan Officer CRM"
 
     elif role == "processor":
-        leads_list = (
+        leads_query = (
             _company_scoped_leads_query()
             .filter(Lead.status.in_(["submitted", "processing"]))
-            .order_by(Lead.created_at.desc())
-            .all()
         )
         tasks_list = (
             Task.query.filter_by(assigned_to=current_user.id)
@@ -169,15 +271,27 @@ def dashboard():
         role_view = "Processor CRM"
 
     elif role in ["executive", "admin", "crm"]:
-        leads_list = _company_scoped_leads_query().order_by(Lead.created_at.desc()).limit(50).all()
+        leads_query = _company_scoped_leads_query()
+        lead_limit = DASHBOARD_LEAD_LIMIT
         tasks_list = Task.query.order_by(Task.due_date.asc()).limit(50).all()
         role_view = "Executive CRM Overview"
 
     else:
-        leads_list = _company_scoped_leads_query().filter_by(status="active").limit(10).all()
+        leads_query = _company_scoped_leads_query().filter_by(status="active")
+        lead_limit = 10
         tasks_list = []
         role_view = "Basic CRM View"
 
+    # Count in SQL; only the rows the page shows are loaded.
+    total_leads, active_leads = leads_query.with_entities(
+        func.count(Lead.id),
+        func.coalesce(
+            func.sum(case((func.lower(Lead.status).in_(["active", "new"]), 1), else_=0)),
+            0,
+        ),
+    ).one()
+    leads_list = leads_query.order_by(Lead.created_at.desc()).limit(lead_limit).all()
+
     # ----------------------------------------
     # Additional Data Sets
     # ----------------------------------------
@@ -194,15 +308,14 @@ def dashboard():
         .all()
     )
 
-    total_calls = CallLog.query.count()
-    total_messages = Message.query.count()
+    total_calls, total_messages = db.session.query(
+        select(func.count(CallLog.id)).scalar_subquery(),
+        select(func.count(Message.id)).scalar_subquery(),
+    ).one()
 
     stats = {
-        "total_leads": len(leads_list),
-        "active_leads": sum(
-            1 for l in leads_list
-            if l.status and l.status.lower() in ["active", "new"]
-        ),
+        "total_leads": total_leads,
+        "active_leads": int(active_leads or 0),
         "recent_leads": len(leads_recent),
         "contacted_leads": len(contacted_leads),
         "tasks_due": len(tasks_list),
@@ -215,8 +328,8 @@ def dashboard():
     # AI Summary
     # ----------------------------------------
     try:
-        ai_summary = assistant.generate_reply(
-            f"Summarize {role_view} with stats: {stats}.",
+        ai_summary = assistant.cached_reply(
+            DASHBOARD_SUMMARY_PROMPT.format_map({"role_view": role_view, **stats}),
             f"crm_{role}_dashboard"
         )
     except Exception as e:
@@ -253,25 +366,9 @@ def dialer():
         status = request.form.get("status")
         direction = "outbound"
 
-        try:
-           ai_feedback = assistant.generate_reply(
-               f"Analyze call sentiment and summarize outcome for: {note}. "
-               f"Respond briefly with tone summary and key feedback.",
-               "crm_dialer_ai"
-           )
-
-           # simple keyword classification fallback
-           sentiment = "Neutral"
-           if any(word in ai_feedback.lower() for word in ["great", "positive", "happy", "satisfied", "good"]):
-               sentiment = "Positive"
-           elif any(word in ai_feedback.lower() for word in ["angry", "upset", "negative", "bad", "unhappy"]):
-              sentiment = "Negative"
-
-        except Exception:
-           ai_feedback = "AI feedback unavailable."
-           sentiment = "Neutral"
+        # The results page shows the AI review, so it is generated inline.
+        ai_feedback, sentiment = _review_dialer_note(note)
 
-        # Save call to DB
         call_log = CallLog(
            user_id=current_user.id,
            contact_name="Unknown",
@@ -279,8 +376,7 @@ def dialer():
            direction="outbound",
            notes=note,
            ai_summary=ai_feedback,
-           sentiment=sentiment,
-           created_at=datetime.utcnow()
+           sentiment=sentiment
         )
         db.session.add(call_log)
         db.session.commit()
@@ -289,16 +385,17 @@ def dialer():
 
         # refresh call list
         calls = CallLog.query.order_by(CallLog.created_at.desc()).limit(10).all()
+        outcomes = Counter(c.outcome for c in calls)
 
         return render_template(
             "crm/dialer_result.html",
             calls=calls,
             ai_feedback=ai_feedback,
             summary={
-                "connected": len([c for c in calls if c.outcome == "Success"]),
-                "voicemail": len([c for c in calls if c.outcome == "Voicemail"]),
-                "noanswer": len([c for c in calls if c.outcome == "No Answer"]),
-                "failed": len([c for c in calls if c.outcome not in ["Success", "Voicemail", "No Answer"]]),
+                "connected": outcomes["Success"],
+                "voicemail": outcomes["Voicemail"],
+                "noanswer": outcomes["No Answer"],
+                "failed": len(calls) - outcomes["Success"] - outcomes["Voicemail"] - outcomes["No Answer"],
             },
             agent_labels=["Letoya", "Jamaine", "Jonathan"],
             agent_data=[4, 3, 2],
@@ -414,25 +511,43 @@ def call_insights():
 
     leaderboard = query.order_by(func.count(CallLog.id).desc()).limit(5).all()
 
-    total_calls = CallLog.query.count()
-    success_calls = CallLog.query.filter(CallLog.outcome == "Success").count()
-    voicemail_calls = CallLog.query.filter(CallLog.outcome == "Voicemail").count()
-    followup_calls = CallLog.query.filter(CallLog.outcome == "Follow-Up Scheduled").count()
-    avg_duration = db.session.query(func.avg(CallLog.duration_seconds)).scalar() or 0
+    # Outcome and sentiment distribution in a single pass over call_log
+    def _tally(condition):
+        return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
 
-    # Sentiment distribution
-    positive_calls = CallLog.query.filter(CallLog.sentiment == "Positive").count()
-    neutral_calls = CallLog.query.filter(CallLog.sentiment == "Neutral").count()
-    negative_calls = CallLog.query.filter(CallLog.sentiment == "Negative").count()
+    (
+        total_calls,
+        success_calls,
+        voicemail_calls,
+        followup_calls,
+        avg_duration,
+        positive_calls,
+        neutral_calls,
+        negative_calls,
+    ) = db.session.query(
+        func.count(CallLog.id),
+        _tally(CallLog.outcome == "Success"),
+        _tally(CallLog.outcome == "Voicemail"),
+        _tally(CallLog.outcome == "Follow-Up Scheduled"),
+        func.avg(CallLog.duration_seconds),
+        _tally(CallLog.sentiment == "Positive"),
+        _tally(CallLog.sentiment == "Neutral"),
+        _tally(CallLog.sentiment == "Negative"),
+    ).one()
+    avg_duration = avg_duration or 0
 
     # AI Feedback log
     ai_feedbacks = [
-        {"id": c.id, "ai_summary": c.ai_summary or ""}
-        for c in CallLog.query.order_by(CallLog.created_at.desc()).limit(5)
+        {"id": call_id, "ai_summary": ai_summary or ""}
+        for call_id, ai_summary in (
+            db.session.query(CallLog.id, CallLog.ai_summary)
+            .order_by(CallLog.created_at.desc())
+            .limit(5)
+        )
     ]
 
     # Role list for filter
-    roles = [r[0] for r in db.session.query(User.role).distinct() if r[0]]
+    roles = _user_roles()
 
     # === 🧠 AI Leaderboard Summary ===
     try:
@@ -444,7 +559,7 @@ def call_insights():
                 f"{round((top_user.avg_sentiment or 0)*100)}% average sentiment score."
             )
 
-            ai_summary = assistant.generate_reply(
+            ai_summary = assistant.cached_reply(
                 f"Write a concise one-line performance summary for CRM leaderboard: {ai_text}",
                 "crm_leaderboard_summary"
             )
@@ -457,16 +572,15 @@ def call_insights():
         ])
 
     # ✅ Chart data for template
-    labels = ["Total", "Success", "Voicemail", "Follow-Up", "Positive", "Neutral", "Negative"]
-    values = [
+    values = (
         total_calls,
         success_calls,
         voicemail_calls,
         followup_calls,
         positive_calls,
         neutral_calls,
-        negative_calls
-    ]
+        negative_calls,
+    )
 
     # ✅ Must pass labels and values to render_template
     return render_template(
@@ -484,8 +598,8 @@ def call_insights():
         roles=roles,
         selected_role=selected_role,
         ai_summary=ai_summary,
-        labels=labels,        # ✅ added
-        values=values,        # ✅ added
+        labels=CALL_INSIGHT_LABELS,
+        values=values,
         title="Call Intelligence Dashboard"
     )
 
@@ -524,7 +638,7 @@ def refresh_ai_summary():
             f"{round((top_user.avg_sentiment or 0)*100)}% average sentiment."
         )
 
-        ai_summary = assistant.generate_reply(
+        ai_summary = assistant.cached_reply(
             f"Write a concise, motivational leaderboard insight based on: {text}",
             "crm_leaderboard_refresh"
         )
@@ -538,15 +652,36 @@ def refresh_ai_summary():
 @role_required("crm", "loan_officer", "processor", "executive", "admin", "partners")
 def call_table_refresh():
     """Return updated HTML table of recent calls (for async refresh)."""
-    recent_calls = CallLog.query.order_by(CallLog.created_at.desc()).limit(20).all()
-    return render_template("crm/_call_table.html", calls=recent_calls)
+    # MAX(id) is answered from the primary key index, so checking it is far
+    # cheaper than the table query; a new call bumps it, and the TTL covers
+    # edits and deletes.
+    version = db.session.query(func.max(CallLog.id)).scalar()
+    cached = _call_table_cache.get("table")
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    recent_calls = (
+        db.session.query(
+            CallLog.contact_name,
+            CallLog.contact_phone,
+            CallLog.direction,
+            CallLog.outcome,
+            CallLog.notes,
+            CallLog.ai_summary,
+            CallLog.created_at,
+        )
+        .order_by(CallLog.created_at.desc())
+        .limit(20)
+        .all()
+    )
+    html = render_template("crm/_call_table.html", calls=recent_calls)
+    _call_table_cache.set("table", (version, html))
+    return html
 
 @crm_bp.route("/generate_ai_summaries_async", methods=["POST"])
 @role_required("crm", "loan_officer", "processor", "executive", "admin", "partners")
 def generate_ai_summaries_async():
     """Asynchronous AI summary generation (AJAX version)."""
-    from LoanMVP.ai.assistant import assistant
-
     recent_calls = (
         CallLog.query
         .filter((CallLog.ai_summary == None) | (CallLog.ai_summary == ""))
@@ -555,22 +690,28 @@ def generate_ai_summaries_async():
         .all()
     )
 
-    processed_count = 0
+    prompts = []
     for call in recent_calls:
         base_text = f"Call with {call.contact_name or 'client'} on {call.created_at.strftime('%b %d, %Y')} — "
         notes = call.notes or "No detailed notes provided."
-        prompt = f"Summarize this call and suggest next follow-up actions: {base_text} {notes}"
-        socketio.emit("ai_summary_update", {"processed": processed_count}, namespace="/crm")
+        prompts.append((
+            f"Summarize this call and suggest next follow-up actions: {base_text} {notes}",
+            "crm_call_summary",
+        ))
 
-        try:
-            ai_summary = assistant.generate_reply(prompt, "crm_call_summary")
+    # The calls are independent, so request them concurrently.
+    replies = assistant.generate_replies(prompts)
+
+    processed_count = 0
+    for call, ai_summary in zip(recent_calls, replies):
+        if ai_summary == AI_ERROR_REPLY:
+            call.ai_summary = "AI summary unavailable."
+        else:
             call.ai_summary = ai_summary
             processed_count += 1
-        except Exception as e:
-            print(f" AI summary failed for call {call.id}: {e}")
-            call.ai_summary = "AI summary unavailable."
 
     db.session.commit()
+    socketio.emit("ai_summary_update", {"processed": processed_count}, namespace="/crm")
     return jsonify({"processed": processed_count})
 
 @crm_bp.route("/export_call_report", methods=["POST"])
@@ -580,51 +721,37 @@ def export_call_report():
     user_filter = request.form.get("user_filter", "All")
     sentiment_filter = request.form.get("sentiment_filter", "All")
 
-    query = CallLog.query
+    # Select exactly the report columns, with null handling and newline
+    # cleanup done in SQL, so rows stream as plain tuples.
+    query = (
+        db.session.query(
+            CallLog.id,
+            func.coalesce(func.nullif(User.full_name, ""), User.username, User.email, "N/A"),
+            func.coalesce(CallLog.contact_name, ""),
+            func.coalesce(CallLog.contact_phone, ""),
+            CallLog.sentiment,
+            func.coalesce(CallLog.direction, ""),
+            func.coalesce(CallLog.duration_seconds, 0),
+            func.coalesce(CallLog.outcome, ""),
+            func.replace(func.coalesce(CallLog.notes, ""), "\n", " "),
+            func.replace(func.replace(func.coalesce(CallLog.ai_summary, ""), "\n", " "), "\r", " "),
+            CallLog.created_at,
+        )
+        .outerjoin(User, User.id == CallLog.user_id)
+    )
     if user_filter != "All":
         query = query.filter(CallLog.user_id == int(user_filter))
     if sentiment_filter != "All":
         query = query.filter(CallLog.sentiment == sentiment_filter)
 
-    calls = query.order_by(CallLog.created_at.desc()).all()
-
-    # === Create CSV in memory ===
-    output = StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "ID",
-        "User",
-        "Contact Name",
-        "Phone",
-        "Sentiment",
-        "Direction",
-        "Duration (sec)",
-        "Outcome",
-        "Notes",
-        "AI Summary",
-        "Created At"
-    ])
-
-    for call in calls:
-        writer.writerow([
-            call.id,
-            getattr(call.user, "full_name", "N/A") if hasattr(call, "user") else "N/A",
-            call.contact_name or "",
-            call.contact_phone or "",
-            getattr(call, "sentiment", "N/A"),
-            call.direction or "",
-            call.duration_seconds or 0,
-            call.outcome or "",
-            (call.notes or "").replace("\n", " "),
-            (call.ai_summary or "").replace("\n", " ").replace("\r", " "),
-            call.created_at.strftime("%Y-%m-%d %H:%M:%S") if call.created_at else ""
-        ])
+    rows = query.order_by(CallLog.created_at.desc()).yield_per(CALL_REPORT_BATCH_SIZE)
+
+    def report_rows():
+        for *values, created_at in rows:
+            values.append(created_at.strftime("%Y-%m-%d %H:%M:%S") if created_at else "")
+            yield values
 
-    output.seek(0)
-    response = make_response(output.getvalue())
-    response.headers["Content-Disposition"] = "attachment; filename=call_report.csv"
-    response.headers["Content-Type"] = "text/csv"
-    return response
+    return csv_download("call_report.csv", CALL_REPORT_HEADERS, report_rows())
 # ---------------------------------------------------------
 # 💬 Message Center
 # ---------------------------------------------------------
@@ -632,8 +759,6 @@ def export_call_report():
 @role_required("crm", "loan_officer", "processor", "executive", "admin", "partners")
 def messages():
     """Unified message thread across email/SMS/chat."""
-    all_messages = Message.query.order_by(Message.created_at.desc()).limit(50).all()
-
     if request.method == "POST":
         content = request.form.get("message", "")
         lead_id = request.form.get("lead_id")
@@ -641,32 +766,32 @@ def messages():
         if not content:
             return jsonify({"reply": "⚠️ No message provided."}), 400
 
-        new_message = Message(
-            sender_id=current_user.id,
-            receiver_id=current_user.id,
-            content=content,
-            sender_role=(current_user.role or "user"),
-        )
-        db.session.add(new_message)
-        db.session.commit()
-
         try:
             ai_reply = assistant.generate_reply(f"Generate appropriate response to: {content}", "crm_message_ai")
         except Exception:
             ai_reply = "AI response unavailable."
 
-        ai_message = Message(
-            sender_id=current_user.id,
-            receiver_id=current_user.id,
-            content=ai_reply,
-            sender_role="ai",
-            system_generated=True,
-        )
-        db.session.add(ai_message)
+        # Store the message and its AI reply in one transaction.
+        db.session.add_all([
+            Message(
+                sender_id=current_user.id,
+                receiver_id=current_user.id,
+                content=content,
+                sender_role=(current_user.role or "user"),
+            ),
+            Message(
+                sender_id=current_user.id,
+                receiver_id=current_user.id,
+                content=ai_reply,
+                sender_role="ai",
+                system_generated=True,
+            ),
+        ])
         db.session.commit()
 
         return jsonify({"reply": ai_reply})
 
+    all_messages = Message.query.order_by(Message.created_at.desc()).limit(50).all()
     return render_template("crm/messages.html", messages=all_messages, title="Message Center")
 
 # ---------------------------------------------------------
@@ -678,7 +803,7 @@ def partners():
     """Displays and manages partner contacts and referral networks."""
     partner_list = Partner.query.order_by(Partner.name.asc()).all()
     try:
-        ai_summary = assistant.generate_reply(
+        ai_summary = assistant.cached_reply(
             f"Summarize partner network performance for {len(partner_list)} partners.",
             "crm_partner_ai"
         )
@@ -694,11 +819,12 @@ def partners():
 def campaigns():
     """Show all campaigns created by current user."""
     campaign_list = Campaign.query.filter_by(created_by_id=current_user.id).order_by(Campaign.created_at.desc()).all()
+    statuses = Counter(c.status for c in campaign_list)
     stats = {
         "total": len(campaign_list),
-        "sent": len([c for c in campaign_list if c.status == "sent"]),
-        "draft": len([c for c in campaign_list if c.status == "draft"]),
-        "scheduled": len([c for c in campaign_list if c.status == "scheduled"]),
+        "sent": statuses["sent"],
+        "draft": statuses["draft"],
+        "scheduled": statuses["scheduled"],
     }
     return render_template("crm/campaigns.html", campaigns=campaign_list, stats=stats, title="CRM Campaigns")
 
@@ -708,9 +834,14 @@ def campaigns():
 @crm_bp.route("/leads/<int:lead_id>", methods=["GET", "POST"])
 @role_required("crm", "loan_officer", "processor", "executive", "admin", "partners")
 def view_lead(lead_id):
-    lead = _company_scoped_lead_or_404(lead_id)
+    # The page renders the lead's source; load it with the lead.
+    lead = (
+        _company_scoped_leads_query()
+        .options(joinedload(Lead.source))
+        .filter(Lead.id == lead_id)
+        .first_or_404()
+    )
     calls = CallLog.query.filter_by(related_lead_id=lead.id).order_by(CallLog.created_at.desc()).all()
-    ai_followup = None
 
     if request.method == "POST":
         # ----- New Call Logging -----
@@ -730,44 +861,17 @@ def view_lead(lead_id):
         db.session.add(call)
         db.session.commit()
 
-        # Auto AI summary for the call
-        try:
-            call.ai_summary = assistant.generate_reply(
-                f"Summarize this call note and key insights: {note}",
-                "crm_lead_call_summary"
-            )
-            db.session.commit()
-        except Exception:
-            call.ai_summary = "⚠️ AI summary unavailable."
-
-        # Auto AI follow-up
-        try:
-            ai_followup = assistant.generate_reply(
-                f"Generate next actions and follow-up plan for this lead based on recent call: {note}",
-                "crm_lead_followup"
-            )
-        except Exception:
-            ai_followup = "⚠️ AI follow-up unavailable."
+        # Auto AI summary for the call, generated after the redirect; it shows
+        # in the lead's call table once it has been saved.
+        run_in_background(_summarize_lead_call, call.id, note)
 
         flash("📞 Call logged and AI insights updated.", "success")
         return redirect(url_for("crm.view_lead", lead_id=lead.id))
 
-    # Auto-generate follow-up for the latest call (view only)
-    if calls:
-        latest_note = calls[0].notes or ""
-        try:
-            ai_followup = assistant.generate_reply(
-                f"Provide actionable next steps for follow-up based on call note: {latest_note}",
-                "crm_lead_followup"
-            )
-        except Exception:
-            ai_followup = "⚠️ AI follow-up unavailable."
-
     return render_template(
         "crm/view_lead.html",
         lead=lead,
         calls=calls,
-        ai_followup=ai_followup,
         title=f"Lead • {lead.name}"
     )
 
@@ -782,7 +886,7 @@ def lead_ai_followup(lead_id):
         return {"message": "No recent call notes found."}
 
     try:
-        ai_text = assistant.generate_reply(
+        ai_text = assistant.cached_reply(
             f"Provide actionable next steps for follow-up based on call note: {latest_call.notes}",
             "crm_lead_followup"
         )
@@ -827,7 +931,6 @@ def add_lead():
         assigned_officer_id=selected_officer.id if selected_officer else None,
         assigned_to=selected_officer.user_id if selected_officer else None,
         status=status,
-        created_at=datetime.utcnow()
     )
     db.session.add(new_lead)
     db.session.commit()
@@ -867,9 +970,6 @@ def ai_leads():
         # -----------------------------
         # Call the Backend Lead Engine
         # -----------------------------
-        import os, requests
-        from LoanMVP.utils.safe_http import safe_call
-
         ENGINE_URL = os.getenv("RENOVATION_ENGINE_URL")
         api_key = (os.getenv("RENOVATION_API_KEY") or "").strip()
         headers = {"X-API-Key": api_key} if api_key else {}
@@ -927,7 +1027,6 @@ def ai_leads():
                     assigned_officer_id=selected_officer.id if selected_officer else None,
                     assigned_to=selected_officer.user_id if selected_officer else None,
                     status="New",
-                    created_at=datetime.utcnow(),
                 )
                 db.session.add(lead)
 
@@ -983,7 +1082,7 @@ def hub():
         {"source": "Partner CRM", "target": "Executive", "volume": 9},
     ]
     try:
-        ai_summary = assistant.generate_reply(f"Summarize communication activity: {communication_data}", "crm_hub_ai")
+        ai_summary = assistant.cached_reply(f"Summarize communication activity: {communication_data}", "crm_hub_ai")
     except Exception:
         ai_summary = "AI hub summary unavailable."
     return render_template("crm/communication_hub.html", data=communication_data, ai_summary=ai_summary, title="Communication Hub")
@@ -992,19 +1091,30 @@ def hub():
 @role_required("crm")
 def ai_summary():
     """Generates AI summary of CRM activity and engagement patterns."""
-    leads = _company_scoped_leads_query().order_by(Lead.created_at.desc()).limit(20).all()
+    recent_leads = (
+        _company_scoped_leads_query()
+        .with_entities(Lead.status.label("status"), Lead.created_at.label("created_at"))
+        .order_by(Lead.created_at.desc())
+        .limit(20)
+        .subquery()
+    )
+    status = func.lower(recent_leads.c.status)
+    total_leads, active_leads, closed_leads, avg_created_epoch = db.session.query(
+        func.count(),
+        func.coalesce(func.sum(case((status.in_(["active", "new", "engaged"]), 1), else_=0)), 0),
+        func.coalesce(func.sum(case((status.in_(["closed", "converted"]), 1), else_=0)), 0),
+        func.avg(extract("epoch", recent_leads.c.created_at)),
+    ).select_from(recent_leads).one()
     tasks = Task.query.order_by(Task.due_date.asc()).limit(10).all()
 
-    total_leads = len(leads)
-    active_leads = sum(1 for l in leads if l.status and l.status.lower() in ["active", "new", "engaged"])
-    closed_leads = sum(1 for l in leads if l.status and l.status.lower() in ["closed", "converted"])
-
+    now = datetime.utcnow()
     avg_age = 0
-    if leads:
-        avg_age = round(sum((datetime.utcnow() - l.created_at).days for l in leads) / len(leads), 1)
+    if avg_created_epoch is not None:
+        now_epoch = (now - datetime(1970, 1, 1)).total_seconds()
+        avg_age = round((now_epoch - float(avg_created_epoch)) / 86400, 1)
 
     pending_tasks = [t for t in tasks if t.status != "Completed"]
-    overdue_tasks = [t for t in tasks if t.due_date and t.due_date < datetime.utcnow()]
+    overdue_tasks = [t for t in tasks if t.due_date and t.due_date < now]
 
     prompt = f"""
     CRM Summary:
@@ -1017,7 +1127,7 @@ def ai_summary():
     """
 
     try:
-        ai_summary_text = assistant.generate_reply(prompt, "crm_summary")
+        ai_summary_text = assistant.cached_reply(prompt, "crm_summary")
     except Exception:
         ai_summary_text = "AI summary unavailable."
 
@@ -1059,7 +1169,14 @@ from sqlalchemy import func
 @role_required("crm", "loan_officer", "processor", "executive", "admin", "partners")
 def lead_engine():
     query = request.args.get("q", "")
-    leads = _company_scoped_leads_query().filter(Lead.name.ilike(f"%{query}%")).all() if query else []
+    leads = (
+        _company_scoped_leads_query()
+        .options(defer(Lead.message))
+        .filter(Lead.name.ilike(f"%{query}%"))
+        .order_by(Lead.created_at.desc())
+        .limit(LEAD_SEARCH_LIMIT)
+        .all()
+    ) if query else []
     return render_template("crm/leads.html", leads=leads, query=query, title="Lead Engine")
 
 # ==========================================================
@@ -1068,16 +1185,21 @@ def lead_engine():
 @crm_bp.route("/leads")
 @role_required("crm", "loan_officer", "processor", "executive", "admin", "partners")
 def leads():
-    leads = _company_scoped_leads_query().order_by(Lead.created_at.desc()).all()
-    return render_template("crm/leads.html", leads=leads, title="All Leads")
+    pagination = (
+        _company_scoped_leads_query()
+        .options(defer(Lead.message))
+        .order_by(Lead.created_at.desc())
+        .paginate(
+            page=request.args.get("page", 1, type=int),
+            per_page=LEADS_PAGE_SIZE,
+            error_out=False,
+        )
+    )
+    return render_template("crm/leads.html", leads=pagination.items, pagination=pagination, title="All Leads")
 
 @crm_bp.route("/lead_capture", methods=["POST"])
 @csrf.exempt
 def lead_capture():
-    import os
-    import requests
-    from LoanMVP.utils.safe_http import safe_call
-
     ENGINE_URL = os.getenv("RENOVATION_ENGINE_URL")
     api_key = (os.getenv("RENOVATION_API_KEY") or "").strip()
     headers = {"X-API-Key": api_key} if api_key else {}
@@ -1127,7 +1249,6 @@ def lead_capture():
         assigned_officer_id=selected_officer.id if selected_officer else None,
         assigned_to=selected_officer.user_id if selected_officer else None,
         status="New",
-        created_at=datetime.utcnow(),
     )
     db.session.add(new_lead)
     db.session.commit()
@@ -1158,7 +1279,7 @@ def partner_detail(partner_id):
     activities = []  # placeholder for system activity
     deals = []  # placeholder for connected deals
 
-    ai_summary = assistant.generate_reply(
+    ai_summary = assistant.cached_reply(
         f"Provide a professional AI summary for partner {partner.name} of type {partner.type}. Include deal trends and engagement level.",
         "crm"
     )
@@ -1189,7 +1310,7 @@ def ai_tip():
     query = request.args.get("query", "")
     context = request.args.get("context", "crm")
     try:
-        reply = assistant.generate_reply(query, context)
+        reply = assistant.cached_reply(query, context, ttl=AI_TIP_CACHE_TTL_SECONDS)
     except Exception:
         reply = "AI tip unavailable."
     return jsonify({"reply": reply})
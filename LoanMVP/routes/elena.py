@@ -66,6 +66,10 @@ LISTING_STATUSES = [
     ("withdrawn", "Withdrawn"),
 ]
 
+# Key sets for membership checks, built once instead of per request.
+PIPELINE_STAGE_KEYS = frozenset(key for key, _label in PIPELINE_STAGES)
+LISTING_STATUS_KEYS = frozenset(key for key, _label in LISTING_STATUSES)
+
 CLIENT_ROLES = [
     "realtor",
     "investor",
@@ -466,20 +470,6 @@ def dashboard_legacy():
         "followups_due": followups_due,
     }
 
-    PIPELINE_STAGES = [
-        ("new", "New"),
-        ("warm", "Warm"),
-        ("active", "Active"),
-        ("under_contract", "Under Contract"),
-        ("closed", "Closed"),
-    ]
-    LISTING_STATUSES = [
-        ("active", "Active"),
-        ("pending", "Pending"),
-        ("sold", "Sold"),
-        ("withdrawn", "Withdrawn"),
-    ]
-
     pipeline_groups = []
     for stage_key, stage_label in PIPELINE_STAGES:
         stage_query = _owned_clients_query().filter(
@@ -501,7 +491,7 @@ def dashboard_legacy():
             }
         )
 
-    canonical_keys = {s[0] for s in PIPELINE_STAGES}
+    canonical_keys = PIPELINE_STAGE_KEYS
     unstaged_filter = or_(
         ElenaClient.pipeline_stage.is_(None),
         ~ElenaClient.pipeline_stage.in_(canonical_keys),
@@ -538,7 +528,7 @@ def dashboard_legacy():
     if current_market != "All Markets":
         listings_query = listings_query.filter(ElenaListing.market == current_market)
 
-    if status_filter and status_filter in {s[0] for s in LISTING_STATUSES}:
+    if status_filter and status_filter in LISTING_STATUS_KEYS:
         listings_query = listings_query.filter_by(status=status_filter)
 
     listings = listings_query.order_by(ElenaListing.updated_at.desc()).limit(12).all()
@@ -641,13 +631,6 @@ def client_new():
 @elena_bp.route("/listings/new", methods=["GET", "POST"])
 @role_required("partner_group", "admin")
 def listing_new():
-    LISTING_STATUSES = [
-        ("active", "Active"),
-        ("pending", "Pending"),
-        ("sold", "Sold"),
-        ("withdrawn", "Withdrawn"),
-    ]
-
     def _int(val):
         try:
             return int(val) if val not in (None, "") else None
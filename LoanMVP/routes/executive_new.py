@@ -2,21 +2,28 @@ import csv
 import io
 import json
 from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from flask import Blueprint, current_app, flash, redirect, render_template, request, send_file, url_for
+from flask import Blueprint, current_app, flash, jsonify, redirect, render_template, request, send_file, url_for
+from flask import session as flask_session
 from flask_login import current_user, login_required
-from sqlalchemy import func, text
+from sqlalchemy import and_, case, func, text
 
 from LoanMVP.extensions import db
 from LoanMVP.models.admin import AccessRequest, Company, BusinessInquiry, LicenseInviteEvent, UserInvite
-from LoanMVP.models.crm_models import Lead, Message, Task
+from LoanMVP.models.crm_models import Lead, Message, Partner, Task
+from LoanMVP.models.discovery_models import DiscoveryEvent
 from LoanMVP.models.document_models import LoanDocument
 from LoanMVP.models.loan_models import BorrowerProfile, LoanApplication
+from LoanMVP.models.partner_models import PartnerConnectionRequest
+from LoanMVP.models.property import SavedProperty
 from LoanMVP.models.system_models import SystemLog
+from LoanMVP.models.training_models import UserCourseUnlock
 from LoanMVP.models.user_model import User
 from LoanMVP.models.contractor_models import ContractorBidOpportunity, ConstructionProject, BidSuggestion
 from LoanMVP.services.bid_discovery import maybe_run_bid_discovery, any_source_available
+from LoanMVP.utils.safe_http import safe_call
+from LoanMVP.utils.ttl_cache import TTLCache
 from LoanMVP.models.company_finance_models import CMFinanceEntry, UserEmailConnection
 from LoanMVP.routes import admin as admin_routes
 
@@ -108,6 +115,42 @@ def _monthly_series(records, date_attr="created_at", months_back=6):
     return labels, series
 
 
+def _tally(condition):
+    """SUM(CASE ...) counting rows matching ``condition``, 0 when none do."""
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+# Overview aggregates move slowly, so each executive scope recomputes them at
+# most once a minute; if a recompute fails the last good snapshot is served.
+# The P&L block is never cached: entries added in the Financial Hub show up
+# on the next page load.
+EXECUTIVE_STATS_CACHE_TTL_SECONDS = 60
+_executive_stats_cache = TTLCache(EXECUTIVE_STATS_CACHE_TTL_SECONDS, stale_ttl=None)
+
+
+def clear_executive_stats_cache():
+    _executive_stats_cache.clear()
+
+
+def _cached_stats(key, compute):
+    value = _executive_stats_cache.get(key)
+    if value is not None:
+        return value
+
+    try:
+        value = compute()
+    except Exception as exc:
+        db.session.rollback()
+        stale = _executive_stats_cache.get(key, allow_stale=True)
+        if stale is None:
+            raise
+        current_app.logger.warning("[executive] serving stale %s stats: %s", key[0], exc)
+        return stale
+
+    _executive_stats_cache.set(key, value)
+    return value
+
+
 def _executive_request_query():
     company_id = _executive_company_id()
     if company_id:
@@ -146,8 +189,6 @@ def dashboard():
     click-through to each business's full dashboard for the operational
     detail.
     """
-    from datetime import timedelta
-
     access_redirect = _ensure_executive_access()
     if access_redirect:
         return access_redirect
@@ -155,72 +196,96 @@ def dashboard():
     if (getattr(current_user, "email", "") or "").strip().lower() == _JAMAINE_EMAIL:
         return redirect(url_for("executive.construction_center"))
 
-    now = datetime.utcnow()
-    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    stats = _cached_stats(("company_overview", _executive_company_id()), _company_overview_stats)
 
+    first_name = getattr(current_user, "first_name", None) or \
+                 getattr(current_user, "username", None) or "there"
+
+    return render_template(
+        "executive/company_overview.html",
+        first_name=first_name,
+        now=datetime.utcnow(),
+        **stats,
+        **_company_pnl_stats(),
+    )
+
+
+def _company_overview_stats():
     # ── Ravlo snapshot (Lending + Investors) ──────────────────────────
-    from LoanMVP.models.property import SavedProperty
-    all_users = _executive_user_query().all()
-    scoped_loans = _executive_loan_query()
-    total_users = len(all_users)
-    total_loans = scoped_loans.count()
-    funded_loans = scoped_loans.filter(
-        func.lower(LoanApplication.milestone_stage).contains("funded")
-    ).count()
+    total_users = _executive_user_query().count()
+    total_loans, funded_loans = _executive_loan_query().with_entities(
+        func.count(LoanApplication.id),
+        _tally(func.lower(LoanApplication.milestone_stage).contains("funded")),
+    ).one()
     saved_props = SavedProperty.query.count()
 
     # ── Caughman Mason Construction snapshot ─────────────────────────
     partner = _cm_partner()
-    bid_opps = []
+    active_bids = won_bids = value_in_play = 0
     if partner:
+        is_active = ContractorBidOpportunity.status.in_(("reviewing", "bid_submitted"))
         try:
-            bid_opps = ContractorBidOpportunity.query.filter_by(partner_id=partner.id).all()
+            active_bids, won_bids, value_in_play = db.session.query(
+                _tally(is_active),
+                _tally(ContractorBidOpportunity.status == "won"),
+                func.coalesce(func.sum(case(
+                    (is_active, func.coalesce(ContractorBidOpportunity.estimated_value, 0)),
+                    else_=0,
+                )), 0),
+            ).filter(ContractorBidOpportunity.partner_id == partner.id).one()
         except Exception as exc:
             db.session.rollback()
             current_app.logger.warning("[company_overview] bid table not ready: %s", exc)
-    active_bids = [o for o in bid_opps if o.status in ("reviewing", "bid_submitted")]
-    won_bids = [o for o in bid_opps if o.status == "won"]
-    value_in_play = sum(o.estimated_value or 0 for o in active_bids)
+
+    return dict(
+        # Ravlo
+        total_users=total_users,
+        total_loans=total_loans,
+        funded_loans=funded_loans,
+        saved_props=saved_props,
+        # Construction
+        active_bids=active_bids,
+        won_bids=won_bids,
+        value_in_play=value_in_play,
+    )
+
+
+def _company_pnl_stats():
+    now = datetime.utcnow()
+    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
     # ── Combined P&L (this month, all Caughman Mason Holdings divisions) ──
+    totals = defaultdict(float)
     try:
-        month_entries = CMFinanceEntry.query.filter(
-            CMFinanceEntry.entry_date >= month_start.date()
-        ).all()
+        month_totals = (
+            db.session.query(
+                CMFinanceEntry.division,
+                CMFinanceEntry.entry_type,
+                func.coalesce(func.sum(CMFinanceEntry.amount), 0),
+            )
+            .filter(CMFinanceEntry.entry_date >= month_start.date())
+            .group_by(CMFinanceEntry.division, CMFinanceEntry.entry_type)
+            .all()
+        )
     except Exception as exc:
         db.session.rollback()
         current_app.logger.warning("[company_overview] finance table not ready: %s", exc)
-        month_entries = []
-
-    def _division_totals(division):
-        income = sum(e.amount for e in month_entries if e.division == division and e.entry_type == "income")
-        expense = sum(e.amount for e in month_entries if e.division == division and e.entry_type == "expense")
-        return income, expense
+        month_totals = []
+    for division, entry_type, amount in month_totals:
+        totals[(division, entry_type)] += amount
+        totals[entry_type] += amount
 
-    ravlo_income, ravlo_expense = _division_totals("lending")
-    construction_income, construction_expense = _division_totals("construction")
-    combined_income = sum(e.amount for e in month_entries if e.entry_type == "income")
-    combined_expense = sum(e.amount for e in month_entries if e.entry_type == "expense")
+    ravlo_income, ravlo_expense = totals[("lending", "income")], totals[("lending", "expense")]
+    construction_income = totals[("construction", "income")]
+    construction_expense = totals[("construction", "expense")]
+    combined_income, combined_expense = totals["income"], totals["expense"]
 
-    first_name = getattr(current_user, "first_name", None) or \
-                 getattr(current_user, "username", None) or "there"
-
-    return render_template(
-        "executive/company_overview.html",
-        first_name=first_name,
-        now=now,
+    return dict(
         # Ravlo
-        total_users=total_users,
-        total_loans=total_loans,
-        funded_loans=funded_loans,
-        saved_props=saved_props,
         ravlo_income=ravlo_income,
         ravlo_expense=ravlo_expense,
         ravlo_net=ravlo_income - ravlo_expense,
         # Construction
-        active_bids=len(active_bids),
-        won_bids=len(won_bids),
-        value_in_play=value_in_play,
         construction_income=construction_income,
         construction_expense=construction_expense,
         construction_net=construction_income - construction_expense,
@@ -231,21 +296,55 @@ def dashboard():
     )
 
 
+LOAN_PIPELINE_STAGES = {
+    "Applications Started": "application",
+    "Processing":           "processing",
+    "Underwriting":         "underwriting",
+    "Conditions":           "condition",
+    "Clear to Close":       "clear",
+    "Funded":               "funded",
+}
+PARTNER_CATEGORIES = ("Realtor", "Contractor", "Designer", "Architect",
+                      "Property Manager", "Lender", "Inspector")
+
+
 @executive_bp.route("/ravlo")
 @login_required
 def ravlo_overview():
-    from datetime import timedelta
-    from LoanMVP.models.property import SavedProperty
-    from LoanMVP.models.partner_models import PartnerConnectionRequest, ExternalPartnerLead
-    from LoanMVP.models.training_models import UserCourseUnlock
-    from LoanMVP.models.discovery_models import DiscoveryEvent
-
     access_redirect = _ensure_executive_access()
     if access_redirect:
         return access_redirect
 
-    company  = _executive_company()
-    all_users = _executive_user_query().all()
+    company = _executive_company()
+    stats = _cached_stats(("ravlo_overview", _executive_company_id()), _ravlo_overview_stats)
+
+    # The live feed holds ORM rows, so it is read per request rather than cached.
+    try:
+        discovery_feed = (
+            DiscoveryEvent.query
+            .order_by(DiscoveryEvent.created_at.desc())
+            .limit(20)
+            .all()
+        )
+    except Exception as exc:
+        db.session.rollback()
+        discovery_feed = []
+        current_app.logger.warning("discovery_events query failed (table may not exist yet): %s", exc)
+
+    first_name = getattr(current_user, "first_name", None) or \
+                 getattr(current_user, "username", None) or "there"
+
+    return render_template(
+        "executive/dashboard.html",
+        company=company,
+        first_name=first_name,
+        discovery_feed=discovery_feed,
+        **stats,
+    )
+
+
+def _ravlo_overview_stats():
+    scoped_users = _executive_user_query()
     scoped_loans = _executive_loan_query()
 
     now = datetime.utcnow()
@@ -253,59 +352,55 @@ def ravlo_overview():
     yesterday   = today_start - timedelta(days=1)
 
     # ── Business metrics ─────────────────────────────────────────────
-    total_users   = len(all_users)
-    active_today  = sum(1 for u in all_users if u.last_login and u.last_login >= today_start)
-    free_trials   = sum(1 for u in all_users if u.trial_ends_at and u.trial_ends_at > now)
-    paid_members  = sum(1 for u in all_users
-                        if (u.subscription or "").lower() not in ("free", "core", "") and not u.trial_ends_at)
-    new_overnight = sum(1 for u in all_users if u.created_at and u.created_at >= yesterday)
+    on_trial = User.trial_ends_at > now
+    (
+        total_users,
+        active_today,
+        free_trials,
+        paid_members,
+        new_overnight,
+        challenge_signups,
+    ) = scoped_users.with_entities(
+        func.count(User.id),
+        _tally(User.last_login >= today_start),
+        _tally(on_trial),
+        _tally(and_(
+            func.lower(func.coalesce(User.subscription, "")).notin_(("free", "core", "")),
+            User.trial_ends_at.is_(None),
+        )),
+        _tally(User.created_at >= yesterday),
+        _tally(and_(on_trial, func.lower(User.role) == "investor")),
+    ).one()
 
     # ── Investor OS ───────────────────────────────────────────────────
     saved_props   = SavedProperty.query.count()
     new_saves_today = SavedProperty.query.filter(SavedProperty.created_at >= today_start).count()
 
     # ── Lending OS pipeline ───────────────────────────────────────────
-    def _stage_count(stage_fragment):
-        return scoped_loans.filter(
-            func.lower(LoanApplication.milestone_stage).contains(stage_fragment.lower())
-        ).count()
-
-    loan_pipeline = {
-        "Applications Started": _stage_count("application"),
-        "Processing":           _stage_count("processing"),
-        "Underwriting":         _stage_count("underwriting"),
-        "Conditions":           _stage_count("condition"),
-        "Clear to Close":       _stage_count("clear"),
-        "Funded":               _stage_count("funded"),
-    }
-    total_loans = scoped_loans.count()
+    stage = func.lower(LoanApplication.milestone_stage)
+    total_loans, *stage_counts, loans_need_review = scoped_loans.with_entities(
+        func.count(LoanApplication.id),
+        *(_tally(stage.contains(fragment)) for fragment in LOAN_PIPELINE_STAGES.values()),
+        _tally(func.lower(LoanApplication.status).in_(["pending", "stalled", "needs review"])),
+    ).one()
+    loan_pipeline = dict(zip(LOAN_PIPELINE_STAGES, stage_counts))
 
     # ── Academy ───────────────────────────────────────────────────────
     academy_students  = UserCourseUnlock.query.with_entities(UserCourseUnlock.user_id).distinct().count()
     academy_graduates = UserCourseUnlock.query.count()
 
     # ── Partner Network ───────────────────────────────────────────────
-    partner_cats = ["Realtor", "Contractor", "Designer", "Architect",
-                    "Property Manager", "Lender", "Inspector"]
-    partner_breakdown = {}
-    for cat in partner_cats:
-        partner_breakdown[cat] = PartnerConnectionRequest.query.filter(
-            func.lower(PartnerConnectionRequest.category).contains(cat.lower())
-        ).count()
-
-    req_waiting   = PartnerConnectionRequest.query.filter(
-        PartnerConnectionRequest.status.in_(["pending", "awaiting_match"])).count()
-    req_accepted  = PartnerConnectionRequest.query.filter_by(status="accepted").count()
-    req_completed = PartnerConnectionRequest.query.filter_by(status="completed").count()
+    category = func.lower(PartnerConnectionRequest.category)
+    *category_counts, req_waiting, req_accepted, req_completed = db.session.query(
+        *(_tally(category.contains(cat.lower())) for cat in PARTNER_CATEGORIES),
+        _tally(PartnerConnectionRequest.status.in_(["pending", "awaiting_match"])),
+        _tally(PartnerConnectionRequest.status == "accepted"),
+        _tally(PartnerConnectionRequest.status == "completed"),
+    ).one()
+    partner_breakdown = dict(zip(PARTNER_CATEGORIES, category_counts))
 
     # ── Attention center ──────────────────────────────────────────────
-    loans_need_review = scoped_loans.filter(
-        func.lower(LoanApplication.status).in_(["pending", "stalled", "needs review"])
-    ).count()
     partner_waiting = req_waiting
-    challenge_signups = sum(1 for u in all_users
-                            if u.trial_ends_at and u.trial_ends_at > now
-                            and (u.role or "").lower() == "investor")
     enterprise_leads = BusinessInquiry.query.filter(
         BusinessInquiry.status == "new",
         BusinessInquiry.inquiry_type == "license_application",
@@ -328,16 +423,9 @@ def ravlo_overview():
             .all()
         )
         discovery_today = {row[0]: row[1] for row in _discovery_rows}
-        discovery_feed = (
-            DiscoveryEvent.query
-            .order_by(DiscoveryEvent.created_at.desc())
-            .limit(20)
-            .all()
-        )
     except Exception as exc:
         db.session.rollback()
         discovery_today = {}
-        discovery_feed = []
         current_app.logger.warning("discovery_events query failed (table may not exist yet): %s", exc)
 
     # ── Platform health ───────────────────────────────────────────────
@@ -346,17 +434,18 @@ def ravlo_overview():
     mission_color  = "#2cb67d" if critical_issues < 5 else "#f59e0b"
 
     # ── User growth for sparkline ─────────────────────────────────────
-    user_growth_labels, user_growth_series = _monthly_series(all_users, "created_at", 6)
-    loan_records = scoped_loans.all()
-    loan_volume_labels, loan_volume_series = _monthly_series(loan_records, "created_at", 6)
-
-    first_name = getattr(current_user, "first_name", None) or \
-                 getattr(current_user, "username", None) or "there"
+    series_year, series_month = _last_n_months(6)[0]
+    series_start = datetime(series_year, series_month, 1)
+    user_growth_labels, user_growth_series = _monthly_series(
+        scoped_users.with_entities(User.created_at).filter(User.created_at >= series_start), "created_at", 6
+    )
+    loan_volume_labels, loan_volume_series = _monthly_series(
+        scoped_loans.with_entities(LoanApplication.created_at).filter(LoanApplication.created_at >= series_start),
+        "created_at",
+        6,
+    )
 
-    return render_template(
-        "executive/dashboard.html",
-        company=company,
-        first_name=first_name,
+    return dict(
         # business
         total_users=total_users,
         active_today=active_today,
@@ -394,7 +483,6 @@ def ravlo_overview():
         loan_volume_series=loan_volume_series,
         # discovery
         discovery_today=discovery_today,
-        discovery_feed=discovery_feed,
     )
 
 
@@ -402,27 +490,21 @@ def ravlo_overview():
 @login_required
 def ai_briefing():
     """AJAX: Generate a real-time AI executive briefing."""
-    from LoanMVP.extensions import csrf
     from openai import OpenAI
-    from LoanMVP.models.property import SavedProperty
-    from LoanMVP.models.partner_models import PartnerConnectionRequest
 
     access_redirect = _ensure_executive_access()
     if access_redirect:
-        from flask import jsonify
         return jsonify({"briefing": "Access restricted."}), 403
 
-    from flask import jsonify
-    from datetime import timedelta
-
     now = datetime.utcnow()
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
     yesterday   = today_start - timedelta(days=1)
-    all_users   = _executive_user_query().all()
     scoped_loans = _executive_loan_query()
 
-    new_overnight  = sum(1 for u in all_users if u.created_at and u.created_at >= yesterday)
-    active_today   = sum(1 for u in all_users if u.last_login and u.last_login >= today_start)
+    new_overnight, active_today = _executive_user_query().with_entities(
+        _tally(User.created_at >= yesterday),
+        _tally(User.last_login >= today_start),
+    ).one()
     saves_today    = SavedProperty.query.filter(SavedProperty.created_at >= today_start).count()
     loans_total    = scoped_loans.count()
     req_waiting    = PartnerConnectionRequest.query.filter(
@@ -480,10 +562,6 @@ def construction_center():
     if access_redirect:
         return access_redirect
 
-    from datetime import date, timedelta
-    from LoanMVP.models.partner_models import PartnerConnectionRequest
-    from LoanMVP.models.crm_models import Partner
-
     now        = datetime.utcnow()
     month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
@@ -549,10 +627,8 @@ def construction_center():
         month_income = month_expense = 0.0
 
     # ── Ravlo OS snapshot (ownership view) ──────────────────────────
-    all_users    = _executive_user_query().all()
-    scoped_loans = _executive_loan_query()
-    total_users  = len(all_users)
-    total_loans  = scoped_loans.count()
+    total_users  = _executive_user_query().count()
+    total_loans  = _executive_loan_query().count()
     req_waiting  = PartnerConnectionRequest.query.filter(
         PartnerConnectionRequest.status.in_(["pending", "awaiting_match"])
     ).count()
@@ -614,7 +690,6 @@ def construction_center():
 @login_required
 def construction_ai():
     """AI Office Assistant for Jamaine — handles admin so he can stay in the field."""
-    from flask import jsonify
     from openai import OpenAI
 
     access_redirect = _ensure_executive_access()
@@ -662,11 +737,7 @@ def construction_ai():
 @login_required
 def construction_morning_brief():
     """AJAX: AI-generated construction-focused daily briefing with real project data."""
-    from flask import jsonify
-    from datetime import timedelta
     from openai import OpenAI
-    from LoanMVP.models.partner_models import PartnerConnectionRequest
-    from LoanMVP.models.crm_models import Partner
 
     access_redirect = _ensure_executive_access()
     if access_redirect:
@@ -809,8 +880,6 @@ def _gmail_flow():
 @login_required
 def email_connect():
     """Redirect to Google OAuth to connect Gmail."""
-    from flask import session as flask_session
-
     access_redirect = _ensure_executive_access()
     if access_redirect:
         return access_redirect
@@ -833,8 +902,6 @@ def email_connect():
 @login_required
 def email_callback():
     """Handle Google OAuth callback — store tokens in UserEmailConnection."""
-    from flask import session as flask_session, jsonify
-
     access_redirect = _ensure_executive_access()
     if access_redirect:
         return access_redirect
@@ -850,7 +917,6 @@ def email_callback():
 
         # Get user's email from Google
         import requests as http_requests
-        from LoanMVP.utils.safe_http import safe_call
         info_resp = safe_call(
             http_requests.get,
             "https://www.googleapis.com/oauth2/v2/userinfo",
@@ -900,7 +966,6 @@ def email_disconnect():
 @login_required
 def email_sync():
     """AJAX: Read recent Gmail messages and return an AI summary of anything construction-related."""
-    from flask import jsonify
     from openai import OpenAI
 
     access_redirect = _ensure_executive_access()
@@ -918,7 +983,6 @@ def email_sync():
         from google.oauth2.credentials import Credentials
         from google.auth.transport.requests import Request as GRequest
         import requests as http_requests
-        from LoanMVP.utils.safe_http import safe_call
 
         creds = Credentials(
             token=conn.access_token,
@@ -1004,7 +1068,6 @@ def _morning_priorities(bids, projects, persona):
     Each item: title, stage, next_action, priority (high/medium/low),
                url, deadline (str|None), assigned_to.
     """
-    from datetime import timedelta
     now        = datetime.utcnow()
     two_days   = (now + timedelta(days=2)).date()
     seven_days = (now + timedelta(days=7)).date()
@@ -1167,7 +1230,6 @@ def _can_access_bid_support(user) -> bool:
 
 
 def _cm_partner():
-    from LoanMVP.models.crm_models import Partner
     return (
         Partner.query.filter(func.lower(Partner.company) == "caughman mason construction").first()
     )
@@ -1301,8 +1363,17 @@ def analytics():
         total_loans = LoanApplication.query.filter_by(company_id=company.id).count() if hasattr(LoanApplication, "company_id") else 0
         total_docs = LoanDocument.query.filter_by(company_id=company.id).count() if hasattr(LoanDocument, "company_id") else 0
         active_borrowers = BorrowerProfile.query.filter_by(company_id=company.id).count() if hasattr(BorrowerProfile, "company_id") else 0
-        loan_rows = LoanApplication.query.filter_by(company_id=company.id).all() if hasattr(LoanApplication, "company_id") else []
-        user_rows = users_query.all()
+        loan_status_rows = (
+            db.session.query(LoanApplication.status, func.count(LoanApplication.id))
+            .filter(LoanApplication.company_id == company.id)
+            .group_by(LoanApplication.status)
+            .all()
+        ) if hasattr(LoanApplication, "company_id") else []
+        role_rows = (
+            users_query.with_entities(User.role, func.count(User.id))
+            .group_by(User.role)
+            .all()
+        )
         ai_summary = (
             f"{company.name} executive analytics: {total_users} team user(s), "
             f"{total_loans} loan file(s), {total_docs} document(s), and "
@@ -1314,20 +1385,30 @@ def analytics():
         total_loans = LoanApplication.query.count()
         total_docs = LoanDocument.query.count()
         active_borrowers = User.query.filter_by(role="borrower").count()
-        loan_rows = LoanApplication.query.all()
-        user_rows = users_query.all()
+        loan_status_rows = (
+            db.session.query(LoanApplication.status, func.count(LoanApplication.id))
+            .group_by(LoanApplication.status)
+            .all()
+        )
+        role_rows = (
+            db.session.query(User.role, func.count(User.id))
+            .group_by(User.role)
+            .all()
+        )
         ai_summary = (
             f"Platform executive analytics: {total_users} total user(s), {total_loans} loan file(s), "
             f"{total_docs} document(s), and {active_borrowers} borrower account(s)."
         )
 
+    # Counts are grouped in SQL; raw values that share a display label
+    # (e.g. "in_review" / "In Review") are merged here.
     loan_status_counts = defaultdict(int)
-    for loan in loan_rows:
-        loan_status_counts[(getattr(loan, "status", None) or "unknown").replace("_", " ").title()] += 1
+    for status, count in loan_status_rows:
+        loan_status_counts[(status or "unknown").replace("_", " ").title()] += count
 
     role_counts = defaultdict(int)
-    for user in user_rows:
-        role_counts[(getattr(user, "role", None) or "unknown").replace("_", " ").title()] += 1
+    for role, count in role_rows:
+        role_counts[(role or "unknown").replace("_", " ").title()] += count
 
     return render_template(
         "admin/analytics.html",
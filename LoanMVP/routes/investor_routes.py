@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import io
 import json
+import logging
 import uuid
 import base64
 import hashlib
@@ -11,10 +12,13 @@ import copy
 import mimetypes
 import random
 import re
-from collections import defaultdict
+import tempfile
+from collections import Counter, defaultdict
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from io import BytesIO
+from operator import itemgetter
 from typing import Any, Dict
 from urllib.parse import urlencode, urlparse, quote_plus
 
@@ -25,8 +29,9 @@ from openai import OpenAI
 from PIL import Image, ImageOps, ImageStat
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import LETTER
-from sqlalchemy import or_
+from sqlalchemy import func, or_
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import load_only, selectinload
 from sqlalchemy.orm.attributes import flag_modified
 from werkzeug.utils import secure_filename
 from werkzeug.datastructures import ImmutableMultiDict
@@ -43,11 +48,14 @@ from flask import (
     current_app,
     session,
     abort,
+    g,
 )
 from flask_login import current_user, login_required
 
 from LoanMVP.extensions import db, stripe, csrf
 from LoanMVP.utils.decorators import role_required
+from LoanMVP.utils.background import run_in_background
+from LoanMVP.utils.ttl_cache import TTLCache
 from LoanMVP.forms.investor_forms import (
     InvestorSettingsForm,
     InvestorProfileForm,
@@ -114,7 +122,7 @@ from LoanMVP.models.partner_models import PartnerRequest
 # AI / Assistants
 # -------------------------
 from LoanMVP.ai.base_ai import AIAssistant
-from LoanMVP.ai.master_ai import master_ai, CMAIEngine
+from LoanMVP.ai.master_ai import master_ai
 
 # -------------------------
 # Core Services
@@ -136,7 +144,10 @@ from LoanMVP.services.rehab_service import (
     generate_rehab_notes,
 )
 from LoanMVP.services.ai_insights import generate_ai_insights
-from LoanMVP.services.unified_resolver import resolve_property_unified
+from LoanMVP.services.unified_resolver import (
+    resolve_property_unified,
+    resolve_property_unified_cached,
+)
 from LoanMVP.services.property_tool import (
     get_property_search_result,
     PropertyAPIError,
@@ -162,6 +173,7 @@ from LoanMVP.services.dealfinder_service import (
     get_rentcast_data,
 )
 from LoanMVP.services.partner_marketplace_service import (
+    get_place_details,
     search_internal_partners,
     search_google_places,
 )
@@ -172,6 +184,7 @@ from LoanMVP.utils.pdf_utils import add_signature_to_pdf
 # Investor Helper Modules
 # -------------------------
 from LoanMVP.services.investor.investor_helpers import (
+    _EMPTY_MARKERS,
     _clean_int,
     _clean_num,
     _clean_str,
@@ -225,7 +238,6 @@ from LoanMVP.utils.emailer import send_pdf_bytes_attachment
 from LoanMVP.services.investor.investor_media_helpers import (
     _normalize_photo_urls,
     _persist_listing_photo_refs,
-    _store_saved_property_media,
     _normalize_photo_list,
     _resolve_photo,
     _saved_property_media,
@@ -274,12 +286,17 @@ from LoanMVP.services.investor.investor_saved_property_helpers import (
     _assign_if_has_attr,
     _find_existing_saved_property,
     _get_investor_profile_or_error,
+    _invalidate_saved_property_lookup,
+    _lookup_saved_property_id,
     _merge_nonempty_dict,
     _normalize_saved_property_id,
     _persist_property_core_fields,
     _profile_id_filter,
     _property_payload_from_any,
+    _resolved_property_fields,
+    _to_int,
     _upsert_saved_property_from_payload,
+    _upsert_saved_property_row,
 )
 from LoanMVP.services.investor.investor_route_helpers import (
     _annotate_deal_finder_opportunity,
@@ -330,6 +347,34 @@ from LoanMVP.utils.r2_storage import spaces_put_bytes
 investor_bp = Blueprint("investor", __name__, url_prefix="/investor")
 deal_architect_api_bp = Blueprint("deal_architect_api", __name__, url_prefix="/")
 
+logger = logging.getLogger(__name__)
+
+assistant = AIAssistant()
+
+# Page-summary prompts. Keeping them as fixed templates means identical
+# inputs always produce byte-identical prompts for the AI reply cache.
+NEXT_STEP_PROMPT = "Create a calm, professional investor-facing next step message: {next_step}"
+CONDITIONS_PROMPT = "Summarize {count} underwriting conditions and highlight what's still required."
+ANALYSIS_PROMPT = (
+    "Summarize investor analytics: {loans} loans totaling ${amount}, "
+    "{verified} verified docs, {pending} pending."
+)
+ACTIVITY_PROMPT = "Generate investor activity summary of {count} recent actions."
+
+
+def _current_investor_profile():
+    """
+    The signed-in user's InvestorProfile, loaded once per request and kept on
+    ``g``. A missing profile isn't remembered, so views that create one can
+    look it up again afterwards.
+    """
+    ip = g.get("_investor_profile")
+    if ip is None:
+        ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+        if ip is not None:
+            g._investor_profile = ip
+    return ip
+
 client = OpenAI()
 
 
@@ -488,7 +533,7 @@ def _create_budget_studio_budget_from_lines(
 
     investor_profile_id = getattr(deal, "investor_profile_id", None)
     if not investor_profile_id:
-        profile = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+        profile = _current_investor_profile()
         investor_profile_id = getattr(profile, "id", None)
 
     project_budget = None
@@ -1309,7 +1354,7 @@ def _set_deal_results(deal, results):
 
 def _fmt_money(value):
     try:
-        if value in (None, "", "None"):
+        if value in _EMPTY_MARKERS:
             return "—"
         return f"${float(value):,.0f}"
     except Exception:
@@ -1324,6 +1369,46 @@ def tutorial():
     return render_template("investor/tutorial.html")
 
 
+# Condition statuses that no longer need anything from the investor.
+_DONE_CONDITION_STATUSES = frozenset(("submitted", "cleared", "completed"))
+
+
+def _capital_next_step(ip, active_request):
+    """Conditions, next-step text and progress for the active capital request."""
+    if not ip or not active_request:
+        return [], "No active capital request. Start a new deal when ready.", 0
+
+    conditions = (
+        UnderwritingCondition.query
+        .filter_by(investor_profile_id=ip.id, loan_id=active_request.id)
+        .order_by(UnderwritingCondition.created_at.desc())
+        .all()
+    )
+
+    # One pass over the conditions for both the next step and progress.
+    pending_count = cleared_count = 0
+    first_pending = None
+    for c in conditions:
+        condition_status = (c.status or "").strip().lower()
+        if condition_status == "cleared":
+            cleared_count += 1
+        if condition_status not in _DONE_CONDITION_STATUSES:
+            pending_count += 1
+            if first_pending is None:
+                first_pending = c
+
+    if first_pending is not None:
+        next_step_text = (
+            f"You have {pending_count} pending items. "
+            f"Next: {first_pending.description}."
+        )
+    else:
+        next_step_text = "All items are in. Waiting on capital review."
+
+    progress_percent = int((cleared_count / len(conditions)) * 100) if conditions else 0
+    return conditions, next_step_text, progress_percent
+
+
 @investor_bp.route("/", methods=["GET"], endpoint="command_center")
 @investor_bp.route("/index", methods=["GET"])
 @investor_bp.route("/command", methods=["GET"])
@@ -1342,18 +1427,14 @@ def command_center():
     if next_page and next_page.startswith("/"):
         return redirect(next_page)
 
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
 
     capital_requests = []
     active_request = None
     conditions = []
-    doc_requests = []
     saved_props = []
     primary_stage = None
-
-    assistant = AIAssistant()
-    next_step_ai = None
-    next_step_text = "No active capital request. Start a new deal when ready."
+    progress_percent = 0
 
     if ip:
         # Saved properties / watchlist
@@ -1372,55 +1453,12 @@ def command_center():
             .all()
         )
 
-        # Active capital request
-        active_request = (
-            LoanApplication.query
-            .filter_by(investor_profile_id=ip.id, is_active=True)
-            .order_by(LoanApplication.created_at.desc())
-            .first()
-        )
-
-        # Document requests
-        doc_requests = (
-            LoanDocument.query
-            .filter_by(investor_profile_id=ip.id)
-            .order_by(LoanDocument.created_at.desc())
-            .all()
-        )
+        # Active capital request: the newest active one, already loaded above
+        active_request = next((req for req in capital_requests if req.is_active), None)
 
         if active_request:
-            conditions = (
-                UnderwritingCondition.query
-                .filter_by(investor_profile_id=ip.id, loan_id=active_request.id)
-                .order_by(UnderwritingCondition.created_at.desc())
-                .all()
-            )
-
             primary_stage = getattr(active_request, "status", None) or "Application"
-
-            pending_conditions = [
-                c for c in conditions
-                if (c.status or "").strip().lower() not in {"submitted", "cleared", "completed"}
-            ]
-
-            if pending_conditions:
-                next_step_text = (
-                    f"You have {len(pending_conditions)} pending items. "
-                    f"Next: {pending_conditions[0].description}."
-                )
-            else:
-                next_step_text = "All items are in. Waiting on capital review."
-
-    # Progress snapshot
-    progress_percent = 0
-    if active_request:
-        total_conditions = len(conditions)
-        cleared_conditions = len([
-            c for c in conditions
-            if (c.status or "").strip().lower() == "cleared"
-        ])
-        if total_conditions > 0:
-            progress_percent = int((cleared_conditions / total_conditions) * 100)
+        conditions, _, progress_percent = _capital_next_step(ip, active_request)
 
     # Ravlo deal intelligence
     deals = []
@@ -1465,14 +1503,6 @@ def command_center():
         "progress_percent": progress_percent,
     }
 
-    try:
-        next_step_ai = assistant.generate_reply(
-            f"Create a calm, professional investor-facing next step message: {next_step_text}",
-            "investor_next_step"
-        )
-    except Exception:
-        next_step_ai = "Next step guidance is unavailable right now."
-
     now_str = datetime.now().strftime("%b %d, %Y • %I:%M %p")
 
     return render_template(
@@ -1481,10 +1511,8 @@ def command_center():
         capital_requests=capital_requests,
         active_request=active_request,
         conditions=conditions,
-        doc_requests=doc_requests,
         saved_props=saved_props,
         snapshot=snapshot,
-        next_step_ai=next_step_ai,
         primary_stage=primary_stage,
         now_str=now_str,
         investor_profile=ip,
@@ -1498,6 +1526,33 @@ def command_center():
     )
 
 
+@investor_bp.route("/dashboard/next-step", methods=["GET"])
+@login_required
+@role_required("investor")
+def dashboard_next_step():
+    """AJAX: AI next-step message, loaded after the command center renders."""
+    ip = _current_investor_profile()
+    active_request = None
+    if ip:
+        active_request = (
+            LoanApplication.query
+            .filter_by(investor_profile_id=ip.id, is_active=True)
+            .order_by(LoanApplication.created_at.desc())
+            .first()
+        )
+    _conditions, next_step_text, _progress = _capital_next_step(ip, active_request)
+
+    try:
+        message = assistant.cached_reply(
+            NEXT_STEP_PROMPT.format_map({"next_step": next_step_text}),
+            "investor_next_step"
+        )
+    except Exception:
+        message = "Next step guidance is unavailable right now."
+
+    return jsonify({"html": str(current_app.jinja_env.filters["md"](message))})
+
+
 @investor_bp.route("/portfolio/ai-summary", methods=["POST"], endpoint="portfolio_ai_summary")
 @login_required
 @role_required("investor")
@@ -1556,7 +1611,7 @@ def resource_center():
     Investor Resource Center
     Tools, FAQs, Partners, AI Help
     """
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     if not ip:
         flash("Please complete your investor profile first.", "warning")
         return redirect(url_for("investor.create_profile"))
@@ -1625,7 +1680,7 @@ def search():
     Searches FAQs, partners, and built-in resource links.
     """
 
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     q = (request.args.get("q") or "").strip()
     q_lower = q.lower()
 
@@ -1747,7 +1802,7 @@ def search():
 @login_required
 @role_required("investor")
 def dismiss_dashboard_tour():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     if ip:
         ip.has_seen_dashboard_tour = True
         db.session.commit()
@@ -1761,7 +1816,7 @@ def dismiss_dashboard_tour():
 @login_required
 @role_required("investor")
 def account():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     active_subscription = _sync_investor_subscription_record(current_user, ip)
     if active_subscription:
         db.session.commit()
@@ -1783,7 +1838,7 @@ def account():
 @login_required
 @role_required("investor")
 def profile():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     return render_template("investor/profile.html", investor=ip)
 
 
@@ -1791,7 +1846,7 @@ def profile():
 @login_required
 @role_required("investor")
 def settings():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
 
     if request.method == "POST":
         current_user.first_name = (request.form.get("first_name") or "").strip() or current_user.first_name
@@ -1834,7 +1889,7 @@ def settings():
 @login_required
 @role_required("investor")
 def privacy():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     return render_template(
         "investor/privacy_launch.html",
         investor=current_user,
@@ -1846,7 +1901,7 @@ def privacy():
 @login_required
 @role_required("investor")
 def notifications_settings():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     return render_template(
         "investor/notifications_settings.html",
         investor=current_user,
@@ -1862,9 +1917,7 @@ def notifications_settings():
 @login_required
 @role_required("investor")
 def create_profile():
-    from LoanMVP.forms.investor_forms import InvestorProfileForm
-
-    existing = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    existing = _current_investor_profile()
 
     if existing:
         form = InvestorProfileForm(obj=existing)
@@ -1918,7 +1971,7 @@ def create_profile():
 @login_required
 @role_required("investor")
 def update_profile():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     if not ip:
         return jsonify({"status": "error", "message": "Profile not found."}), 404
 
@@ -2029,7 +2082,7 @@ def start_loan():
 @login_required
 @role_required("investor")
 def loans():
-    investor = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    investor = _current_investor_profile()
 
     if not investor:
         flash("Please complete your investor profile first.", "warning")
@@ -2057,7 +2110,7 @@ def loans():
 @login_required
 @role_required("investor")
 def refinance_studio(deal_id=None):
-    investor = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    investor = _current_investor_profile()
     if not investor:
         flash("Please create your investor profile before starting a refinance package.", "warning")
         return redirect(url_for("investor.create_profile"))
@@ -2222,7 +2275,7 @@ def refinance_studio(deal_id=None):
 @login_required
 @role_required("investor")
 def loan_summary(loan_id):
-    investor = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    investor = _current_investor_profile()
 
     if not investor:
         flash("Please complete your investor profile first.", "warning")
@@ -2259,7 +2312,7 @@ def loan_summary(loan_id):
 @login_required
 @role_required("investor")
 def loan_timeline(loan_id):
-    investor = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    investor = _current_investor_profile()
 
     if not investor:
         flash("Please complete your investor profile first.", "warning")
@@ -2293,7 +2346,7 @@ def loan_timeline(loan_id):
 @login_required
 @role_required("investor")
 def capital_application():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     if not ip:
         flash("Please create your investor profile before applying for capital.", "warning")
         return redirect(url_for("investor.create_profile"))
@@ -2329,7 +2382,7 @@ def capital_application():
 @login_required
 @role_required("investor")
 def submit_capital_application():
-    investor = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    investor = _current_investor_profile()
     if not investor:
         return jsonify({"success": False, "message": "No investor profile found."}), 404
 
@@ -2539,7 +2592,6 @@ def submit_capital_application():
     # Optional AI summary refresh
     # -----------------------------
     try:
-        assistant = AIAssistant()
         client_name = getattr(investor, "full_name", None) or borrower.full_name or "Unknown Client"
 
         loan.ai_summary = assistant.generate_reply(
@@ -2581,47 +2633,96 @@ def submit_deal_for_funding(deal_id):
     flash("Deal submitted for funding review.", "success")
     return redirect(url_for("investor.capital_application", deal_id=deal.id))
 
+_PENDING_DOC_STATUSES = frozenset(("pending", "uploaded"))
+_ACTIVE_LOAN_STATUSES = frozenset(("active", "processing"))
+_COMPLETED_LOAN_STATUSES = frozenset(("closed", "funded"))
+
+
 @investor_bp.route("/capital/status", methods=["GET"])
 @investor_bp.route("/status", methods=["GET"])
 @login_required
 @role_required("investor")
 def status():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     if not ip:
         flash("Please complete your investor profile first.", "warning")
         return redirect(url_for("investor.create_profile"))
 
-    profile_fk = _profile_id_filter(LoanApplication, ip.id)
-    doc_fk = _profile_id_filter(LoanDocument, ip.id)
+    loans, stats = _capital_status(ip)
 
-    loans = LoanApplication.query.filter_by(**profile_fk).all()
-    documents = LoanDocument.query.filter_by(**doc_fk).all()
+    return render_template(
+        "investor/status.html",
+        investor=ip,
+        loans=loans,
+        stats=stats,
+        title="Capital Status",
+    )
 
-    stats = {
-        "total_loans": len(loans),
-        "pending_docs": len([d for d in documents if (d.status or "").lower() in ["pending", "uploaded"]]),
-        "verified_docs": len([d for d in documents if (d.status or "").lower() == "verified"]),
-        "active_loans": len([l for l in loans if (l.status or "").lower() in ["active", "processing"]]),
-        "completed_loans": len([l for l in loans if (l.status or "").lower() in ["closed", "funded"]]),
-    }
 
-    assistant = AIAssistant()
+@investor_bp.route("/capital/status/ai-summary", methods=["GET"])
+@login_required
+@role_required("investor")
+def status_ai_summary():
+    """AJAX: AI capital status summary, loaded after the status page renders."""
+    ip = _current_investor_profile()
+    if not ip:
+        return jsonify({"message": None}), 404
+
+    stats = _capital_stats(ip)
     try:
-        ai_summary = assistant.generate_reply(
+        message = assistant.cached_reply(
             f"Summarize investor capital status for {ip.full_name} with: {stats}",
             "investor_status",
         )
     except Exception:
-        ai_summary = "⚠️ AI summary unavailable."
+        message = "⚠️ AI summary unavailable."
 
-    return render_template(
-        "investor/status.html",
-        investor=ip,
-        loans=loans,
-        documents=documents,
-        stats=stats,
-        ai_summary=ai_summary,
-        title="Capital Status",
+    return jsonify({"message": message})
+
+
+def _capital_status(ip):
+    """Loan cards for the status page, plus the status tallies."""
+    # The cards only show these columns; skip hydrating the rest of the row.
+    loans = (
+        LoanApplication.query
+        .filter_by(**_profile_id_filter(LoanApplication, ip.id))
+        .options(load_only(
+            LoanApplication.id,
+            LoanApplication.loan_type,
+            LoanApplication.property_address,
+            LoanApplication.status,
+        ))
+        .all()
+    )
+    return loans, _capital_stats(ip, [l.status for l in loans])
+
+
+def _capital_stats(ip, loan_statuses=None):
+    """Loan/document status tallies, counted per status in SQL."""
+    if loan_statuses is None:
+        loan_counts = _status_counts(LoanApplication, ip)
+    else:
+        loan_counts = Counter((status or "").lower() for status in loan_statuses)
+    doc_counts = _status_counts(LoanDocument, ip)
+
+    return {
+        "total_loans": sum(loan_counts.values()),
+        "pending_docs": sum(doc_counts.get(s, 0) for s in _PENDING_DOC_STATUSES),
+        "verified_docs": doc_counts.get("verified", 0),
+        "active_loans": sum(loan_counts.get(s, 0) for s in _ACTIVE_LOAN_STATUSES),
+        "completed_loans": sum(loan_counts.get(s, 0) for s in _COMPLETED_LOAN_STATUSES),
+    }
+
+
+def _status_counts(model, ip):
+    """``{lower(status): count}`` for the investor's rows — one row per status."""
+    status = func.lower(model.status)
+    return dict(
+        db.session.query(status, func.count())
+        .select_from(model)
+        .filter_by(**_profile_id_filter(model, ip.id))
+        .group_by(status)
+        .all()
     )
 
 
@@ -2634,7 +2735,7 @@ def status():
 @login_required
 @role_required("investor")
 def loan_view(loan_id):
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     loan = LoanApplication.query.get_or_404(loan_id)
 
     # Ownership check (supports both schemas)
@@ -2655,9 +2756,8 @@ def loan_view(loan_id):
         loan_id=loan.id
     ).all()
 
-    assistant = AIAssistant()
     try:
-        ai_summary = assistant.generate_reply(
+        ai_summary = assistant.cached_reply(
             f"Summarize {len(conditions)} underwriting items for investor {ip.full_name}.",
             "investor_loan_conditions",
         )
@@ -2679,7 +2779,7 @@ def loan_view(loan_id):
 @login_required
 @role_required("investor")
 def loan_edit(loan_id):
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     loan = LoanApplication.query.get_or_404(loan_id)
 
     owns = False
@@ -2729,17 +2829,23 @@ def loan_edit(loan_id):
 # 💰 INVESTOR • QUOTES + CONVERSION
 # =========================================================
 
+MOCK_QUOTE_LENDERS = (
+    {"lender_name": "Lima One Capital", "rate": 6.20, "loan_type": "30-Year Fixed", "deal_type": "Conventional"},
+    {"lender_name": "RCN Capital", "rate": 6.05, "loan_type": "FHA 30-Year", "deal_type": "Residential"},
+    {"lender_name": "LendingOne", "rate": 5.90, "loan_type": "5/1 ARM", "deal_type": "Hybrid"},
+)
+
+
 @investor_bp.route("/capital/quote", methods=["GET", "POST"])
 @investor_bp.route("/quote", methods=["GET", "POST"])
 @login_required
 @role_required("investor")
 def quote():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     if not ip:
         flash("Please complete your investor profile before requesting a quote.", "warning")
         return redirect(url_for("investor.create_profile"))
 
-    assistant = AIAssistant()
 
     if request.method == "POST":
         loan_amount = safe_float(request.form.get("loan_amount"))
@@ -2766,22 +2872,12 @@ def quote():
         except Exception:
             ai_suggestion = "⚠️ AI system unavailable. Displaying mock results."
 
-        mock_lenders = [
-            {"lender_name": "Lima One Capital", "rate": 6.20, "loan_type": "30-Year Fixed", "deal_type": "Conventional"},
-            {"lender_name": "RCN Capital", "rate": 6.05, "loan_type": "FHA 30-Year", "deal_type": "Residential"},
-            {"lender_name": "LendingOne", "rate": 5.90, "loan_type": "5/1 ARM", "deal_type": "Hybrid"},
-        ]
-
         quote_fk = _profile_id_filter(LoanQuote, ip.id)
 
-        created_quotes = []
-        for lender in mock_lenders:
-            quote_row = LoanQuote(
+        created_quotes = [
+            LoanQuote(
                 **quote_fk,
-                lender_name=lender["lender_name"],
-                rate=lender["rate"],
-                loan_type=lender["loan_type"],
-                deal_type=lender["deal_type"],
+                **lender,
                 max_ltv=ltv,
                 term_months=term_months,
                 loan_amount=loan_amount,
@@ -2795,9 +2891,12 @@ def quote():
                 response_json=None,
                 status="pending",
             )
-            db.session.add(quote_row)
-            created_quotes.append(quote_row)
-
+            for lender in MOCK_QUOTE_LENDERS
+        ]
+        # add_all lets the unit of work flush these as one batched INSERT
+        # (insertmanyvalues) while still returning the ids the results page
+        # needs for its convert-to-application links.
+        db.session.add_all(created_quotes)
         db.session.commit()
         flash("✅ Loan quotes generated successfully!", "success")
 
@@ -2823,7 +2922,7 @@ def quote():
 @role_required("investor")
 def convert_quote_to_application(quote_id):
     quote = LoanQuote.query.get_or_404(quote_id)
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     if not ip:
         flash("Please complete your investor profile before applying.", "warning")
         return redirect(url_for("investor.create_profile"))
@@ -2897,7 +2996,7 @@ def convert_quote_to_application(quote_id):
     try:
         notify_team_on_conversion(ip, quote, new_app)
     except Exception as e:
-        print("Notification error:", e)
+        logger.warning("Notification error: %s", e)
 
     flash("🎯 Quote converted and team notified!", "success")
     return redirect(url_for("investor.status"))
@@ -2908,7 +3007,7 @@ def convert_quote_to_application(quote_id):
 @login_required
 @role_required("investor")
 def get_quote_ai():
-    ai = CMAIEngine()
+    ai = master_ai
     data = request.json or {}
 
     msg = f"""
@@ -2938,12 +3037,11 @@ def get_quote_ai():
 @login_required
 @role_required("investor")
 def documents():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     docs = LoanDocument.query.filter_by(**_profile_id_filter(LoanDocument, ip.id)).all() if ip else []
 
-    assistant = AIAssistant()
     try:
-        ai_summary = assistant.generate_reply(
+        ai_summary = assistant.cached_reply(
             f"Summarize the investor’s {len(docs)} uploaded documents and highlight missing items.",
             "investor_documents"
         )
@@ -2964,7 +3062,7 @@ def documents():
 @login_required
 @role_required("investor")
 def document_requests():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     if not ip:
         return redirect(url_for("investor.create_profile"))
 
@@ -3004,9 +3102,8 @@ def document_requests():
             "file_path": getattr(cond, "file_path", None),
         })
 
-    assistant = AIAssistant()
     try:
-        ai_summary = assistant.generate_reply(
+        ai_summary = assistant.cached_reply(
             f"List {len(unified)} outstanding document requests/conditions for investor {ip.full_name}.",
             "investor_document_requests",
         )
@@ -3027,7 +3124,7 @@ def document_requests():
 @login_required
 @role_required("investor")
 def upload_document():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
 
     if request.method == "POST":
         file = request.files.get("file")
@@ -3061,7 +3158,7 @@ def upload_document():
 @login_required
 @role_required("investor")
 def upload_request():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     if not ip:
         return redirect(url_for("investor.create_profile"))
 
@@ -3131,7 +3228,7 @@ def upload_request():
 @login_required
 @role_required("investor")
 def delete_document(doc_id):
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     doc = LoanDocument.query.get_or_404(doc_id)
 
     # Ownership check (supports both schemas)
@@ -3242,7 +3339,7 @@ def download_all_documents(deal_id):
 @login_required
 @role_required("investor")
 def conditions():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
 
     loan = None
     if ip:
@@ -3254,10 +3351,9 @@ def conditions():
         cond_fk = _profile_id_filter(UnderwritingCondition, ip.id)
         conds = UnderwritingCondition.query.filter_by(**cond_fk, loan_id=loan.id).all() if cond_fk else []
 
-    assistant = AIAssistant()
     try:
-        ai_summary = assistant.generate_reply(
-            f"Summarize {len(conds)} underwriting conditions and highlight what's still required.",
+        ai_summary = assistant.cached_reply(
+            CONDITIONS_PROMPT.format_map({"count": len(conds)}),
             "investor_conditions"
         )
     except Exception:
@@ -3280,7 +3376,7 @@ def conditions():
 @role_required("investor")
 def view_condition(cond_id):
     cond = UnderwritingCondition.query.get_or_404(cond_id)
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
 
     # Ownership check (supports both schemas)
     ok = False
@@ -3307,7 +3403,7 @@ def view_condition(cond_id):
 @role_required("investor")
 def condition_history(cond_id):
     cond = UnderwritingCondition.query.get_or_404(cond_id)
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
 
     ok = False
     if ip:
@@ -3318,18 +3414,20 @@ def condition_history(cond_id):
     if not ip or not ok:
         return "Unauthorized", 403
 
-    history = []
-    if getattr(cond, "created_at", None):
-        history.append({"timestamp": cond.created_at, "text": "Condition created"})
-    if getattr(cond, "file_path", None):
-        history.append({"timestamp": getattr(cond, "updated_at", None) or cond.created_at, "text": "Document uploaded"})
-    if (getattr(cond, "status", "") or "").lower() == "submitted":
-        history.append({"timestamp": getattr(cond, "updated_at", None) or cond.created_at, "text": "Document submitted"})
-    if (getattr(cond, "status", "") or "").lower() == "cleared":
-        history.append({"timestamp": getattr(cond, "updated_at", None) or cond.created_at, "text": "Condition cleared"})
+    created_at = getattr(cond, "created_at", None)
+    ts_doc = getattr(cond, "updated_at", None) or created_at
+    status = (getattr(cond, "status", "") or "").lower()
 
-    history = [h for h in history if h.get("timestamp")]
-    history.sort(key=lambda x: x["timestamp"], reverse=True)
+    events = [
+        (created_at, "Condition created"),
+        (ts_doc if getattr(cond, "file_path", None) else None, "Document uploaded"),
+        (ts_doc if status == "submitted" else None, "Document submitted"),
+        (ts_doc if status == "cleared" else None, "Condition cleared"),
+    ]
+    history = [
+        {"timestamp": ts, "text": text}
+        for ts, text in sorted((e for e in events if e[0]), key=itemgetter(0), reverse=True)
+    ]
 
     return render_template(
         "investor/condition_history.html",
@@ -3365,7 +3463,7 @@ def investor_condition_ai(condition_id):
 @role_required("investor")
 def upload_condition(cond_id):
     cond = UnderwritingCondition.query.get_or_404(cond_id)
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
 
     ok = False
     if ip:
@@ -3521,7 +3619,7 @@ def _property_matches_asset_type(prop, asset_type):
 @login_required
 @role_required("investor")
 def property_search():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     query = (request.args.get("query") or "").strip()
     asset_type = _normalize_asset_type(request.args.get("asset_type"))
 
@@ -3538,7 +3636,7 @@ def property_search():
     photos = []
 
     if query:
-        resolved = resolve_property_unified(query)
+        resolved = resolve_property_unified_cached(query)
 
         if resolved.get("status") == "ok":
             raw_prop = resolved.get("property") or {}
@@ -3566,12 +3664,7 @@ def property_search():
 
                 if ip and property_data.get("address"):
                     try:
-                        existing = SavedProperty.query.filter(
-                            getattr(SavedProperty, "investor_profile_id", SavedProperty.borrower_profile_id) == ip.id,
-                            db.func.lower(SavedProperty.address) == property_data["address"].lower()
-                        ).first()
-                        if existing:
-                            saved_id = existing.id
+                        saved_id = _lookup_saved_property_id(ip.id, property_data["address"])
                     except Exception:
                         saved_id = None
 
@@ -3608,7 +3701,7 @@ def property_search():
 @login_required
 @role_required("investor")
 def save_property():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     if not ip:
         return jsonify({"status": "error", "message": "Profile not found."}), 400
 
@@ -3621,18 +3714,13 @@ def save_property():
     if not raw_address:
         return jsonify({"status": "error", "message": "Address required."}), 400
 
-    sqft = None
-    try:
-        if sqft_raw not in (None, "", "None"):
-            sqft = int(float(sqft_raw))
-    except Exception:
-        sqft = None
+    sqft = _to_int(sqft_raw)
 
     resolved = {}
     try:
-        resolved = resolve_property_unified(raw_address)
+        resolved = resolve_property_unified_cached(raw_address)
     except Exception as e:
-        print("SAVE_PROPERTY resolver error:", e)
+        logger.warning("save_property resolver error: %s", e)
         resolved = {}
 
     normalized_address = raw_address
@@ -3640,73 +3728,34 @@ def save_property():
 
     if resolved.get("status") == "ok":
         p = resolved.get("property") or {}
+        fields = _resolved_property_fields(p)
         normalized_address = (p.get("address") or raw_address).strip()
-        resolved_property_id = (p.get("property_id") or p.get("id") or p.get("propertyId"))
+        resolved_property_id = fields["property_id"]
         resolved_property_id = str(resolved_property_id).strip() if resolved_property_id else None
-        raw_zipcode = raw_zipcode or p.get("zip") or p.get("zipCode") or p.get("postalCode")
+        raw_zipcode = raw_zipcode or fields["zip"]
         if sqft is None:
-            try:
-                sqft_val = p.get("sqft") or p.get("squareFootage")
-                sqft = int(float(sqft_val)) if sqft_val not in (None, "", "None") else None
-            except Exception:
-                sqft = None
+            sqft = _to_int(fields["sqft"])
 
     final_property_id = raw_property_id or resolved_property_id or None
     final_property_id = _normalize_saved_property_id(final_property_id)
 
-    existing = None
-    fk = _profile_id_filter(SavedProperty, ip.id)
-
-    if final_property_id:
-        existing = SavedProperty.query.filter_by(
-            **fk,
-            property_id=final_property_id
-        ).first()
-
-    if not existing and normalized_address:
-        existing = SavedProperty.query.filter(
-            getattr(SavedProperty, "investor_profile_id", SavedProperty.borrower_profile_id) == ip.id,
-            db.func.lower(SavedProperty.address) == normalized_address.lower()
-        ).first()
-
-    if existing:
-        if not existing.address and normalized_address:
-            existing.address = normalized_address
-        if (not getattr(existing, "zipcode", None)) and raw_zipcode:
-            existing.zipcode = raw_zipcode
-        if (getattr(existing, "sqft", None) is None or getattr(existing, "sqft", 0) == 0) and sqft:
-            existing.sqft = sqft
-        if (not getattr(existing, "price", None)) and raw_price is not None:
-            existing.price = str(raw_price)
-        if (not getattr(existing, "property_id", None)) and final_property_id:
-            existing.property_id = final_property_id
-
-        if resolved:
-            _store_saved_property_media(existing, resolved, source="unified_resolver")
-
-        db.session.commit()
-        return jsonify({"status": "success", "message": "Already saved (updated details).", "saved_id": existing.id})
-
-    saved = SavedProperty(
-        **fk,
-        property_id=final_property_id,
-        address=normalized_address,
-        price=str(raw_price or ""),
-        sqft=sqft,
-        zipcode=raw_zipcode,
-        saved_at=datetime.utcnow(),
-        created_at=datetime.utcnow(),
+    saved_id, created = _upsert_saved_property_row(
+        ip.id,
+        {
+            "property_id": final_property_id,
+            "address": normalized_address,
+            "price": str(raw_price or ""),
+            "sqft": sqft,
+            "zipcode": raw_zipcode,
+        },
+        datetime.utcnow(),
     )
-
-    db.session.add(saved)
-    db.session.flush()
-
-    if resolved:
-        _store_saved_property_media(saved, resolved, source="unified_resolver")
-
     db.session.commit()
 
-    return jsonify({"status": "success", "message": "Saved.", "saved_id": saved.id})
+    if not created:
+        return jsonify({"status": "success", "message": "Already saved (updated details).", "saved_id": saved_id})
+
+    return jsonify({"status": "success", "message": "Saved.", "saved_id": saved_id})
 
 
 @investor_bp.route("/intelligence/saved", methods=["GET"])
@@ -3714,34 +3763,52 @@ def save_property():
 @login_required
 @role_required("investor")
 def saved_properties():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
-    props = SavedProperty.query.filter_by(**_profile_id_filter(SavedProperty, ip.id)).all() if ip else []
-
-    try:
-        name = ip.full_name if ip else "this investor"
-        ai_summary = AIAssistant().generate_reply(
-            f"Summarize {len(props)} saved properties for {name}. Prioritize investment potential.",
-            "investor_saved_properties",
-        )
-    except Exception:
-        ai_summary = "⚠️ AI summary unavailable."
+    ip = (
+        InvestorProfile.query
+        .options(selectinload(InvestorProfile.saved_properties))
+        .filter_by(user_id=current_user.id)
+        .first()
+    )
+    props = list(ip.saved_properties) if ip else []
 
+    # The portfolio insight is fetched from saved_properties_summary after
+    # the page renders, so the AI round-trip never blocks the list.
     return render_template(
         "investor/saved_properties.html",
         investor=ip,
         properties=props,
-        ai_summary=ai_summary,
+        ai_summary=None,
         title="Saved Properties",
         active_tab="property_search"
     )
 
 
+@investor_bp.route("/intelligence/saved/summary", methods=["GET"])
+@investor_bp.route("/api/saved_properties_summary", methods=["GET"])
+@login_required
+@role_required("investor")
+def saved_properties_summary():
+    ip = _current_investor_profile()
+    count = SavedProperty.query.filter_by(**_profile_id_filter(SavedProperty, ip.id)).count() if ip else 0
+
+    try:
+        name = ip.full_name if ip else "this investor"
+        ai_summary = assistant.cached_reply(
+            f"Summarize {count} saved properties for {name}. Prioritize investment potential.",
+            "investor_saved_properties",
+        )
+    except Exception:
+        ai_summary = "⚠️ AI summary unavailable."
+
+    return jsonify({"summary": ai_summary})
+
+
 @investor_bp.route("/intelligence/saved/manage", methods=["POST"])
 @investor_bp.route("/saved_properties/manage", methods=["POST"])
 @login_required
 @role_required("investor")
 def saved_properties_manage():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     if not ip:
         flash("Profile not found.", "danger")
         return redirect(url_for("investor.saved_properties"))
@@ -3756,8 +3823,8 @@ def saved_properties_manage():
         flash("Invalid property id.", "warning")
         return redirect(url_for("investor.saved_properties"))
 
-    prop = SavedProperty.query.filter_by(id=prop_id, **_profile_id_filter(SavedProperty, ip.id)).first()
-    if not prop:
+    prop = db.session.get(SavedProperty, prop_id)
+    if not prop or prop.investor_profile_id != ip.id:
         flash("Saved property not found.", "warning")
         return redirect(url_for("investor.saved_properties"))
 
@@ -3770,6 +3837,7 @@ def saved_properties_manage():
             flash("Notes column not added yet.", "info")
 
     elif action == "delete":
+        _invalidate_saved_property_lookup(ip.id)
         db.session.delete(prop)
         db.session.commit()
         flash("🗑️ Saved property deleted.", "success")
@@ -3782,7 +3850,7 @@ def saved_properties_manage():
 @login_required
 @role_required("investor")
 def save_property_and_analyze():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     if not ip:
         flash("Profile not found.", "danger")
         return redirect(url_for("investor.property_search"))
@@ -3796,37 +3864,30 @@ def save_property_and_analyze():
     price = request.form.get("price")
     sqft_raw = request.form.get("sqft")
 
-    sqft = None
-    try:
-        sqft = int(float(sqft_raw)) if sqft_raw not in (None, "", "None") else None
-    except Exception:
-        sqft = None
+    sqft = _to_int(sqft_raw)
 
     resolved = {}
     normalized_address = raw_address
     resolved_property_id = None
 
     try:
-        resolved = resolve_property_unified(raw_address)
+        resolved = resolve_property_unified_cached(raw_address)
     except Exception as e:
-        print("SAVE_PROPERTY_AND_ANALYZE resolver error:", e)
+        logger.warning("save_property_and_analyze resolver error: %s", e)
         resolved = {}
 
     if resolved.get("status") == "ok":
         p = resolved.get("property") or {}
+        fields = _resolved_property_fields(p)
         normalized_address = (p.get("address") or raw_address).strip()
 
-        resolved_property_id = (p.get("property_id") or p.get("id") or p.get("propertyId"))
+        resolved_property_id = fields["property_id"]
         resolved_property_id = str(resolved_property_id).strip() if resolved_property_id else None
 
-        zipcode = zipcode or p.get("zip") or p.get("zipCode") or p.get("postalCode")
+        zipcode = zipcode or fields["zip"]
 
         if sqft is None:
-            try:
-                sqft_val = p.get("sqft") or p.get("squareFootage")
-                sqft = int(float(sqft_val)) if sqft_val not in (None, "", "None") else None
-            except Exception:
-                sqft = None
+            sqft = _to_int(fields["sqft"])
 
         if (price in (None, "", "None")) and (p.get("price") is not None):
             try:
@@ -3838,37 +3899,25 @@ def save_property_and_analyze():
     final_property_id = form_pid or resolved_property_id or None
     final_property_id = _normalize_saved_property_id(final_property_id)
 
-    fk = _profile_id_filter(SavedProperty, ip.id)
-
-    existing = None
-    if final_property_id:
-        existing = SavedProperty.query.filter_by(**fk, property_id=final_property_id).first()
-
-    if not existing and normalized_address:
-        existing = SavedProperty.query.filter(
-            getattr(SavedProperty, "investor_profile_id", SavedProperty.borrower_profile_id) == ip.id,
-            db.func.lower(SavedProperty.address) == normalized_address.lower()
-        ).first()
-
-    if existing:
-        flash("✅ Property already saved — opening Deal Studio.", "info")
-        return redirect(url_for("investor.deal_workspace", prop_id=existing.id, mode="flip"))
-
-    saved = SavedProperty(
-        **fk,
-        property_id=final_property_id,
-        address=normalized_address,
-        price=str(price or ""),
-        sqft=sqft,
-        zipcode=zipcode,
-        saved_at=datetime.utcnow(),
-        created_at=datetime.utcnow(),
+    saved_id, created = _upsert_saved_property_row(
+        ip.id,
+        {
+            "property_id": final_property_id,
+            "address": normalized_address,
+            "price": str(price or ""),
+            "sqft": sqft,
+            "zipcode": zipcode,
+        },
+        datetime.utcnow(),
     )
-    db.session.add(saved)
     db.session.commit()
 
+    if not created:
+        flash("✅ Property already saved — opening Deal Studio.", "info")
+        return redirect(url_for("investor.deal_workspace", prop_id=saved_id, mode="flip"))
+
     flash("🏠 Property saved! Opening Deal Studio…", "success")
-    return redirect(url_for("investor.deal_workspace", prop_id=saved.id, mode="flip"))
+    return redirect(url_for("investor.deal_workspace", prop_id=saved_id, mode="flip"))
 
 
         
@@ -3880,21 +3929,18 @@ def property_explore_plus(prop_id):
     source = request.args.get("source", "property_tool")
     fallback_endpoint = "investor.property_search" if source == "property_search" else "investor.property_tool"
 
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     if not ip:
         flash("Profile not found.", "danger")
         return redirect(url_for(fallback_endpoint))
 
-    prop = SavedProperty.query.filter_by(
-        id=prop_id,
-        **_profile_id_filter(SavedProperty, ip.id)
-    ).first()
+    prop = db.session.get(SavedProperty, prop_id)
 
-    if not prop:
+    if not prop or prop.investor_profile_id != ip.id:
         flash("Property not found.", "danger")
         return redirect(url_for(fallback_endpoint))
 
-    resolved = resolve_property_unified(prop.address)
+    resolved = resolve_property_unified_cached(prop.address)
 
     if resolved.get("status") != "ok":
         current_app.logger.warning(
@@ -4361,7 +4407,7 @@ def api_property_tool_search():
     _effective_plan = _investor_effective_subscription_plan(current_user)
     _SEARCH_LIMIT = None if _effective_plan in ("Operator", "Enterprise") else 3
     if _SEARCH_LIMIT is not None:
-        _ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+        _ip = _current_investor_profile()
         if _ip:
             _month_start = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
             if _ip.deal_finder_search_reset_at is None or _ip.deal_finder_search_reset_at < _month_start:
@@ -4756,7 +4802,7 @@ def api_property_tool_save():
     payload = request.get_json(force=True) or {}
 
     try:
-        investor_profile = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+        investor_profile = _current_investor_profile()
         if not investor_profile:
             return jsonify({
                 "status": "error",
@@ -4774,8 +4820,9 @@ def api_property_tool_save():
                 "message": "Address is required."
             }), 400
 
+        now = datetime.utcnow()
         property_payload = _ensure_property_image_coverage(property_payload)
-        saved = _upsert_saved_property_from_payload(investor_profile, property_payload)
+        saved = _upsert_saved_property_from_payload(investor_profile, property_payload, now=now)
 
         listing_photos = _collect_property_photo_urls(property_payload)
 
@@ -4807,7 +4854,7 @@ def api_property_tool_save():
                         **property_payload,
                         "image_url": best_uploaded,
                         "listing_photos": _normalize_photo_urls(uploaded_urls, listing_photos),
-                    })
+                    }, now=now)
             except Exception as e:
                 current_app.logger.warning("Listing photo attach failed on save-only: %s", e)
 
@@ -4843,7 +4890,7 @@ def api_property_tool_save_and_analyze():
     payload = request.get_json(force=True) or {}
 
     try:
-        investor_profile = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+        investor_profile = _current_investor_profile()
         if not investor_profile:
             return jsonify({
                 "status": "error",
@@ -4861,8 +4908,9 @@ def api_property_tool_save_and_analyze():
                 "message": "Address is required."
             }), 400
 
+        now = datetime.utcnow()
         property_payload = _ensure_property_image_coverage(property_payload)
-        saved = _upsert_saved_property_from_payload(investor_profile, property_payload)
+        saved = _upsert_saved_property_from_payload(investor_profile, property_payload, now=now)
 
         comps = property_payload.get("comp_analysis") or {}
         if not isinstance(comps, dict):
@@ -5093,7 +5141,7 @@ def api_property_tool_save_and_analyze():
                 deal_results["image_url"] = wa["image_url"]
                 deal.results_json = deal_results
 
-        _persist_property_core_fields(saved, canonical_property_payload)
+        _persist_property_core_fields(saved, canonical_property_payload, now=now)
         saved_seed = _saved_property_workspace_seed(saved)
         deal.resolved_json = {
             "property": saved_seed.get("property"),
@@ -5375,7 +5423,7 @@ def deal_workspace():
     prop_id = request.args.get("prop_id", type=int)
     mode = (request.args.get("mode") or "flip").strip().lower()
 
-    investor_profile = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    investor_profile = _current_investor_profile()
 
     saved_props = []
     if investor_profile:
@@ -5783,8 +5831,7 @@ def deal_workspace():
                         deal.results_json = deal_results
                         db.session.commit()
             except Exception as exc:
-                import logging
-                logging.getLogger(__name__).warning("Ravlo ARV engine error: %s", exc)
+                logger.warning("Ravlo ARV engine error: %s", exc)
 
     return render_template(
         "investor/deal_workspace.html",
@@ -5843,7 +5890,7 @@ def deals_list():
     status_filter = (request.args.get("status") or "").strip().lower()
     strategy_filter = (request.args.get("strategy") or "").strip().lower()
 
-    investor_profile = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    investor_profile = _current_investor_profile()
 
     query = Deal.query.filter_by(user_id=current_user.id)
 
@@ -6340,7 +6387,7 @@ def deals_cards():
         .all()
     )
 
-    investor_profile = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    investor_profile = _current_investor_profile()
     deal_image_map = {}
     if deals and investor_profile:
         saved_property_ids = [d.saved_property_id for d in deals if d.saved_property_id]
@@ -6382,7 +6429,7 @@ def deals_cards():
 @login_required
 @role_required("investor")
 def create_deal():
-    investor_profile = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    investor_profile = _current_investor_profile()
 
     if request.method == "POST":
         title = (request.form.get("title") or "").strip()
@@ -6478,7 +6525,7 @@ def create_deal():
 @login_required
 @role_required("investor")
 def save_deal():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     if not ip:
         flash("Investor profile not found.", "danger")
         return redirect(url_for("investor.command_center"))
@@ -6500,7 +6547,7 @@ def save_deal():
     address = prop.get("address") or title
     city = prop.get("city")
     state = prop.get("state")
-    zip_code = prop.get("zip") or prop.get("zipCode") or prop.get("postalCode")
+    zip_code = _resolved_property_fields(prop)["zip"]
 
     purchase_price = (
         inputs_json.get("purchase_price")
@@ -7926,13 +7973,13 @@ def _strip_build_init_images(payload, *, strip_master=False):
 
 def _log_build_source_state(payload, mode):
     init_img_loaded = _build_payload_has_init_image(payload)
-    print(
-        "[build]",
-        "mode=", mode,
-        "init_img_loaded=", init_img_loaded,
-        "image_url=", bool(payload.get("image_url")),
-        "reference_image_url=", bool(payload.get("reference_image_url")),
-        "site_context_url=", bool(payload.get("site_context_url")),
+    logger.debug(
+        "[build] mode=%s init_img_loaded=%s image_url=%s reference_image_url=%s site_context_url=%s",
+        mode,
+        init_img_loaded,
+        bool(payload.get("image_url")),
+        bool(payload.get("reference_image_url")),
+        bool(payload.get("site_context_url")),
     )
 
 
@@ -7942,9 +7989,10 @@ def _log_rear_generation_settings(payload):
         or payload.get("rear_depth_scale")
         or payload.get("controlnet_scale")
     )
-    print(
-        f"[rear] pipe=depth strength={payload.get('strength')} "
-        f"depth_scale={depth_scale} preserve_camera=False preserve_composition=False"
+    logger.debug(
+        "[rear] pipe=depth strength=%s depth_scale=%s preserve_camera=False preserve_composition=False",
+        payload.get("strength"),
+        depth_scale,
     )
 
 
@@ -11889,7 +11937,7 @@ def save_build_studio():
         if not deal:
             return jsonify({"status": "error", "message": "Deal not found or not authorized."}), 404
 
-    investor_profile = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    investor_profile = _current_investor_profile()
 
     # 🔥 Pull all modes
     exterior_url = (data.get("concept_render_url") or "").strip()
@@ -12005,7 +12053,7 @@ def convert_build_project_to_deal(project_id):
         user_id=current_user.id
     ).first_or_404()
 
-    investor_profile = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    investor_profile = _current_investor_profile()
 
     deal = Deal(
         user_id=current_user.id,
@@ -13263,7 +13311,7 @@ def generate_build_costs_from_package():
         contingency = _money_value(cost_json.get("contingency"), contingency_from_items or round(subtotal * 0.10, 2))
         total_budget = _money_value(cost_json.get("total_budget"), subtotal + contingency)
 
-        investor_profile = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+        investor_profile = _current_investor_profile()
         investor_profile_id = getattr(deal, "investor_profile_id", None) or getattr(investor_profile, "id", None)
 
         budget = ProjectBudget(
@@ -13839,7 +13887,7 @@ def save_renovation_mockups(deal_id):
     if not images or not isinstance(images, list):
         return jsonify({"status": "error", "message": "No images provided."}), 400
 
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     ip_id = ip.id if ip else None
 
     saved = 0
@@ -13966,7 +14014,7 @@ def deal_share_design(deal_id):
     if not partner_ids:
         return jsonify({"status": "error", "message": "Choose at least one partner."}), 400
 
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     ip_id = ip.id if ip else None
 
     now = datetime.utcnow()
@@ -14318,7 +14366,7 @@ def export_rehab_scope(deal_id):
 @login_required
 @role_required("investor")
 def messages():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     officers = _assigned_professional_users_for_investor(ip)
 
     for officer in officers:
@@ -14373,7 +14421,7 @@ def messages():
 @login_required
 @role_required("investor")
 def send_message():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     content = (request.form.get("content") or "").strip()
     receiver_id = request.form.get("receiver_id", type=int)
 
@@ -14409,7 +14457,7 @@ def send_message():
 @login_required
 @role_required("investor")
 def ask_ai_page():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
 
     interactions = (AIAssistantInteraction.query
         .filter_by(user_id=current_user.id)
@@ -14442,13 +14490,16 @@ def ask_ai_page():
 @login_required
 @role_required("investor")
 def ask_ai_post():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     payload = request.get_json(silent=True) if request.is_json else None
     question = ((payload or {}).get("question") if payload is not None else request.form.get("question")) or ""
     parent_id = ((payload or {}).get("parent_id") if payload is not None else request.form.get("parent_id"))
 
-    assistant = AIAssistant()
-    ai_reply = assistant.generate_reply(question, "investor_ai")
+    # The next-steps prompt only needs the question, so both calls run together.
+    ai_reply, next_steps = assistant.generate_replies([
+        (question, "investor_ai"),
+        (f"Suggest next steps after answering: {question}.", "investor_next_steps"),
+    ])
 
     chat = AIAssistantInteraction(
         user_id=current_user.id,
@@ -14468,10 +14519,6 @@ def ask_ai_post():
     db.session.add(chat)
     db.session.commit()
 
-    next_steps = assistant.generate_reply(
-        f"Suggest next steps after answering: {question}.",
-        "investor_next_steps",
-    )
     upload_trigger = "document" in question.lower() or "upload" in question.lower()
 
     interactions = (AIAssistantInteraction.query
@@ -14506,7 +14553,7 @@ def ask_ai_post():
 @login_required
 @role_required("investor")
 def ai_hub():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
 
     interactions = (AIAssistantInteraction.query
         .filter_by(user_id=current_user.id)
@@ -14514,9 +14561,8 @@ def ai_hub():
         .limit(5)
         .all())
 
-    assistant = AIAssistant()
     try:
-        ai_summary = assistant.generate_reply(
+        ai_summary = assistant.cached_reply(
             f"Provide an overview of the investor’s AI activity ({len(interactions)} items).",
             "investor_ai_hub",
         )
@@ -14538,7 +14584,7 @@ def ai_hub():
 @login_required
 @role_required("investor")
 def ask_ai_response(chat_id):
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     chat = AIAssistantInteraction.query.get_or_404(chat_id)
 
     # Security: only owner can view
@@ -14646,20 +14692,32 @@ def deal_copilot_chat():
 @login_required
 @role_required("investor")
 def analysis():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
 
+    # The template lists every loan, so the rows are needed; totals come from them.
     loans = LoanApplication.query.filter_by(**_profile_id_filter(LoanApplication, ip.id)).all() if ip else []
-    total_loan_amount = sum([getattr(loan, "loan_amount", 0) or 0 for loan in loans])
+    # LoanApplication stores the requested figure in ``amount``; mirror the
+    # template's loan_amount-or-amount fallback.
+    total_loan_amount = sum(getattr(loan, "loan_amount", None) or loan.amount or 0 for loan in loans)
 
     # NOTE: your statuses are inconsistent elsewhere ("Verified"/"Pending" vs "verified"/"pending")
-    verified_docs = LoanDocument.query.filter_by(**_profile_id_filter(LoanDocument, ip.id), status="Verified").count() if ip else 0
-    pending_docs  = LoanDocument.query.filter_by(**_profile_id_filter(LoanDocument, ip.id), status="Pending").count() if ip else 0
+    doc_status_counts = dict(
+        db.session.query(LoanDocument.status, func.count(LoanDocument.id))
+        .filter_by(**_profile_id_filter(LoanDocument, ip.id))
+        .group_by(LoanDocument.status)
+        .all()
+    ) if ip else {}
+    verified_docs = doc_status_counts.get("Verified", 0)
+    pending_docs = doc_status_counts.get("Pending", 0)
 
-    assistant = AIAssistant()
     try:
-        ai_summary = assistant.generate_reply(
-            f"Summarize investor analytics: {len(loans)} loans totaling ${total_loan_amount}, "
-            f"{verified_docs} verified docs, {pending_docs} pending.",
+        ai_summary = assistant.cached_reply(
+            ANALYSIS_PROMPT.format_map({
+                "loans": len(loans),
+                "amount": total_loan_amount,
+                "verified": verified_docs,
+                "pending": pending_docs,
+            }),
             "investor_analysis",
         )
     except Exception:
@@ -14683,26 +14741,32 @@ def analysis():
     )
 
 
+ACTIVITY_PAGE_SIZE = 50
+ACTIVITY_MAX_PAGE_SIZE = 200
+
+
 @investor_bp.route("/intelligence/activity", methods=["GET"])
 @investor_bp.route("/activity", methods=["GET"])
 @login_required
 @role_required("investor")
 def activity():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     if not ip:
         flash("Profile not found.", "danger")
         return redirect(url_for("investor.command_center"))
 
+    page = max(request.args.get("page", 1, type=int) or 1, 1)
+    size = min(max(request.args.get("size", ACTIVITY_PAGE_SIZE, type=int) or ACTIVITY_PAGE_SIZE, 1), ACTIVITY_MAX_PAGE_SIZE)
+
     # BorrowerActivity model name kept for now (schema-safe)
-    activities = (BorrowerActivity.query
+    pagination = (BorrowerActivity.query
         .filter_by(**_profile_id_filter(BorrowerActivity, ip.id))
         .order_by(BorrowerActivity.timestamp.desc())
-        .all())
+        .paginate(page=page, per_page=size, error_out=False))
 
-    assistant = AIAssistant()
     try:
-        ai_summary = assistant.generate_reply(
-            f"Generate investor activity summary of {len(activities)} recent actions.",
+        ai_summary = assistant.cached_reply(
+            ACTIVITY_PROMPT.format_map({"count": pagination.total}),
             "investor_activity",
         )
     except Exception:
@@ -14711,7 +14775,8 @@ def activity():
     return render_template(
         "investor/activity.html",
         investor=ip,
-        activities=activities,
+        activities=pagination.items,
+        pagination=pagination,
         ai_summary=ai_summary,
         title="Activity",
         active_tab="activity"
@@ -14723,7 +14788,7 @@ def activity():
 @login_required
 @role_required("investor")
 def budget():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     show_archived = request.args.get("archived") == "1"
     budgets = []
     if ip:
@@ -14792,7 +14857,7 @@ def budget_studio(deal_id=None):
             design_budget_requested = True
         results["budget_seed"] = budget_seed
 
-        ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+        ip = _current_investor_profile()
         if ip:
             if budget_id:
                 existing_budget = (
@@ -15732,7 +15797,6 @@ def ai_deal_insight():
     total = data.get("total", 0)
     message = data.get("message", "")
 
-    assistant = AIAssistant()
     ai_reply = assistant.generate_reply(
         f"Evaluate deal '{name}' with ROI {roi}%, profit {profit}, total cost {total}. {message}",
         "investor_ai_deal_insight",
@@ -15749,7 +15813,7 @@ def ai_deal_insight():
 @login_required
 @role_required("investor")
 def investor_esign():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     docs = ESignedDocument.query.filter_by(**_profile_id_filter(ESignedDocument, ip.id)).all() if ip else []
     return render_template("investor/esign.html", investor=ip, docs=docs, title="E-Sign", active_tab="esign")
 
@@ -15760,6 +15824,65 @@ def investor_esign():
 
 
 
+# Multiple of 4 so every slice is a whole number of base64 quanta.
+SIGNATURE_DECODE_CHUNK_CHARS = 64 * 1024
+
+
+def _write_base64_file(encoded: str, path: str) -> None:
+    """
+    Decode ``encoded`` into ``path`` slice by slice, writing to a temp file
+    first so a failed upload never leaves a half-written signature behind.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    encoded = "".join(encoded.split())
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for start in range(0, len(encoded), SIGNATURE_DECODE_CHUNK_CHARS):
+                f.write(base64.b64decode(encoded[start:start + SIGNATURE_DECODE_CHUNK_CHARS]))
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _finalize_esign(doc_id, profile_id, signature_image_path, signed_path):
+    doc = db.session.get(ESignedDocument, doc_id)
+    # A double submit schedules this twice; only the first one stamps.
+    if not doc or doc.status == "Signed":
+        return
+
+    os.makedirs(os.path.dirname(signed_path), exist_ok=True)
+    add_signature_to_pdf(doc.pdf_original_path, signature_image_path, signed_path)
+
+    now = datetime.utcnow()
+    doc.pdf_signed_path = signed_path
+    doc.status = "Signed"
+    doc.signed_at = now
+
+    # Attach signed doc into LoanDocument (schema-safe)
+    ld = LoanDocument(
+        loan_id=getattr(doc, "loan_id", None),
+        document_name=f"{doc.document_name} (Signed)",
+        file_path=signed_path,
+        status="Uploaded",
+        created_at=now,
+    )
+    # Prefer investor_profile_id if available, else borrower_profile_id
+    if hasattr(ld, "investor_profile_id"):
+        ld.investor_profile_id = profile_id
+    else:
+        ld.borrower_profile_id = profile_id
+
+    db.session.add(ld)
+    db.session.commit()
+
+
 @investor_bp.route("/sign/<int:doc_id>", methods=["POST"])
 @investor_bp.route("/esign/sign/<int:doc_id>", methods=["POST"])
 @login_required
@@ -15768,7 +15891,7 @@ def investor_esign_sign(doc_id):
     doc = ESignedDocument.query.get_or_404(doc_id)
 
     # Security: ensure this doc belongs to the current investor (schema-safe)
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     if ip:
         owner_ok = False
         if hasattr(doc, "investor_profile_id") and doc.investor_profile_id == ip.id:
@@ -15779,41 +15902,22 @@ def investor_esign_sign(doc_id):
             return "Unauthorized", 403
 
     signature_data = request.form.get("signature_data")
-    signature_image_path = f"signatures/sign_{doc_id}.png"
+    if not signature_data or "," not in signature_data:
+        flash("Please draw your signature before submitting.", "danger")
+        return redirect(url_for("investor.investor_esign"))
 
-    if signature_data:
-        header, encoded = signature_data.split(",", 1)
-        img_bytes = base64.b64decode(encoded)
-        os.makedirs(os.path.dirname(signature_image_path), exist_ok=True)
-        with open(signature_image_path, "wb") as f:
-            f.write(img_bytes)
+    signature_image_path = f"signatures/sign_{doc_id}.png"
+    header, encoded = signature_data.split(",", 1)
+    _write_base64_file(encoded, signature_image_path)
 
     signed_path = f"signed_docs/{doc_id}_signed.pdf"
-    os.makedirs(os.path.dirname(signed_path), exist_ok=True)
-    add_signature_to_pdf(doc.file_path, signature_image_path, signed_path)
-
-    doc.file_path = signed_path
-    doc.status = "Signed"
-    db.session.commit()
-
-    # Attach signed doc into LoanDocument (schema-safe)
     ip_id = ip.id if ip else (getattr(doc, "investor_profile_id", None) or getattr(doc, "borrower_profile_id", None))
 
-    ld = LoanDocument(
-        name=f"{doc.name} (Signed)",
-        file_path=signed_path,
-        status="Uploaded",
-        uploaded_at=datetime.utcnow(),
-    )
-    # Prefer investor_profile_id if available, else borrower_profile_id
-    if hasattr(ld, "investor_profile_id"):
-        ld.investor_profile_id = ip_id
-    else:
-        ld.borrower_profile_id = ip_id
-
-    db.session.add(ld)
-    db.session.commit()
+    # Stamping the PDF is the slow part; the document flips to "Signed" once
+    # the background task has written it.
+    run_in_background(_finalize_esign, doc.id, ip_id, signature_image_path, signed_path)
 
+    flash("Signature received. Your signed document will appear shortly.", "success")
     return redirect(url_for("investor.investor_esign"))
 
 
@@ -15821,6 +15925,19 @@ def investor_esign_sign(doc_id):
 # 💳 INVESTOR • PAYMENTS / BILLING
 # =========================================================
 
+@lru_cache(maxsize=8)
+def _stripe_payment_products(raw: str) -> dict:
+    """Parse STRIPE_PAYMENT_PRODUCTS ("Type:prod_id,...") into {payment_type: product_id}."""
+    products = {}
+    for pair in raw.split(","):
+        if ":" in pair:
+            payment_type, product_id = pair.rsplit(":", 1)
+            payment_type, product_id = payment_type.strip(), product_id.strip()
+            if payment_type and product_id:
+                products[payment_type] = product_id
+    return products
+
+
 def _stripe_subscription_catalog():
     cfg = current_app.config
     plans = [
@@ -16127,7 +16244,7 @@ def choose_plan():
 @login_required
 @role_required("investor")
 def subscription():
-    investor_profile = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    investor_profile = _current_investor_profile()
     active_subscription = _sync_investor_subscription_record(current_user, investor_profile)
     if active_subscription:
         db.session.commit()
@@ -16259,22 +16376,31 @@ def checkout(payment_id):
     if getattr(payment, "user_id", None) != current_user.id:
         return "Unauthorized", 403
 
-    borrower = getattr(payment, "borrower", None)
+    # Amounts vary per payment, so the price stays inline; the product is
+    # reused when one is configured for this payment type.
+    price_data = {
+        "currency": "usd",
+        "unit_amount": int(round(float(payment.amount) * 100)),
+    }
+    product_id = _stripe_payment_products(
+        current_app.config.get("STRIPE_PAYMENT_PRODUCTS") or ""
+    ).get(payment.payment_type)
+    if product_id:
+        price_data["product"] = product_id
+    else:
+        price_data["product_data"] = {"name": payment.payment_type}
 
     checkout_session = stripe.checkout.Session.create(
         payment_method_types=["card"],
         line_items=[{
-            "price_data": {
-                "currency": "usd",
-                "product_data": {"name": payment.payment_type},
-                "unit_amount": int(float(payment.amount) * 100),
-            },
+            "price_data": price_data,
             "quantity": 1,
         }],
         mode="payment",
         success_url=url_for("investor.payment_success", _external=True) + "?session_id={CHECKOUT_SESSION_ID}",
         cancel_url=url_for("investor.payments", _external=True),
-        metadata={"payment_id": payment.id, "borrower_id": getattr(borrower, "id", None)},
+        # The FK column already holds the borrower id; no need to load the relationship.
+        metadata={"payment_id": payment.id, "borrower_id": payment.borrower_profile_id},
     )
 
     payment.stripe_payment_intent = checkout_session.payment_intent
@@ -16282,6 +16408,43 @@ def checkout(payment_id):
     return redirect(checkout_session.url, code=303)
 
 
+# A paid checkout session never changes, so once Stripe reports it paid the
+# payment intent is remembered for an hour and refreshes of the success page
+# skip the Stripe round-trip.
+STRIPE_SESSION_CACHE_TTL_SECONDS = 3600
+STRIPE_SESSION_CACHE_MAX_ENTRIES = 2048
+_paid_checkout_intents = TTLCache(
+    STRIPE_SESSION_CACHE_TTL_SECONDS,
+    max_entries=STRIPE_SESSION_CACHE_MAX_ENTRIES,
+)
+
+
+def _checkout_session_payment_intent(session_id):
+    key = f"v1:stripe:sess:{session_id}"
+    payment_intent = _paid_checkout_intents.get(key)
+    if payment_intent is not None:
+        return payment_intent
+
+    checkout_session = stripe.checkout.Session.retrieve(session_id)
+    payment_intent = checkout_session.get("payment_intent")
+    if checkout_session.get("payment_status") == "paid":
+        _paid_checkout_intents.set(key, payment_intent)
+    return payment_intent
+
+
+RECEIPT_DIR = "stripe_receipts"
+
+
+def _payment_receipt_path(payment):
+    return os.path.join(RECEIPT_DIR, f"{payment.id}_receipt.txt")
+
+
+def _write_payment_receipt(receipt_path, text):
+    os.makedirs(os.path.dirname(receipt_path), exist_ok=True)
+    with open(receipt_path, "w") as f:
+        f.write(text)
+
+
 @investor_bp.route("/billing/success", methods=["GET"])
 @investor_bp.route("/payments/success", methods=["GET"])
 @login_required
@@ -16293,10 +16456,9 @@ def payment_success():
         return redirect(url_for("investor.payments"))
 
     try:
-        checkout_session = stripe.checkout.Session.retrieve(session_id)
-        payment_intent = checkout_session.get("payment_intent")
+        payment_intent = _checkout_session_payment_intent(session_id)
     except Exception as e:
-        print("Stripe error:", e)
+        logger.warning("Stripe error: %s", e)
         flash("Unable to verify payment.", "danger")
         return redirect(url_for("investor.payments"))
 
@@ -16309,24 +16471,21 @@ def payment_success():
     if getattr(payment, "user_id", None) != current_user.id:
         return "Unauthorized", 403
 
-    payment.status = "Paid"
-    payment.paid_at = datetime.utcnow()
-    db.session.commit()
+    now = datetime.utcnow()
+    receipt_path = _payment_receipt_path(payment)
 
-    receipt_dir = "stripe_receipts"
-    os.makedirs(receipt_dir, exist_ok=True)
-    receipt_path = os.path.join(receipt_dir, f"{payment.id}_receipt.txt")
-    with open(receipt_path, "w") as f:
-        f.write(f"Payment of ${payment.amount} received for {payment.payment_type}.")
+    payment.status = "Paid"
+    payment.paid_at = now
 
-    # attach receipt as LoanDocument (schema-safe)
+    # attach receipt as LoanDocument (schema-safe); committed together with
+    # the payment update so the two rows land in one transaction.
     ld = LoanDocument(
-        loan_application_id=getattr(payment, "loan_id", None),
-        name=f"{payment.payment_type} Receipt",
+        loan_id=getattr(payment, "loan_id", None),
+        document_name=f"{payment.payment_type} Receipt",
         file_path=receipt_path,
-        doc_type="Receipt",
+        document_type="Receipt",
         status="Uploaded",
-        uploaded_at=datetime.utcnow(),
+        created_at=now,
     )
 
     pid = getattr(payment, "investor_profile_id", None) or getattr(payment, "borrower_profile_id", None)
@@ -16336,6 +16495,10 @@ def payment_success():
     else:
         ld.borrower_profile_id = pid
 
+    # Write the receipt before committing so the LoanDocument never points
+    # at a file that doesn't exist.
+    _write_payment_receipt(receipt_path, f"Payment of ${payment.amount} received for {payment.payment_type}.")
+
     db.session.add(ld)
     db.session.commit()
 
@@ -16351,14 +16514,15 @@ def payment_success():
 @login_required
 @role_required("investor")
 def market_snapshot_page():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
-    if not ip:
-        return redirect(url_for("investor.command_center"))
-
-    active_property = (SavedProperty.query
-        .filter_by(**_profile_id_filter(SavedProperty, ip.id))
-        .order_by(SavedProperty.created_at.desc())
+    # Profile and its latest saved property in one round-trip.
+    row = (db.session.query(InvestorProfile, SavedProperty)
+        .outerjoin(SavedProperty, SavedProperty.investor_profile_id == InvestorProfile.id)
+        .filter(InvestorProfile.user_id == current_user.id)
+        .order_by(SavedProperty.created_at.desc().nullslast())
         .first())
+    if not row:
+        return redirect(url_for("investor.command_center"))
+    ip, active_property = row
 
     zipcode = active_property.zipcode if active_property else None
     market_snapshot = get_market_snapshot(zipcode) if zipcode else None
@@ -16506,7 +16670,7 @@ def partners():
 @login_required
 @role_required("investor")
 def partner_detail(partner_id):
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     if not ip:
         flash("Please complete your investor profile first.", "warning")
         return redirect(url_for("investor.create_profile"))
@@ -16531,7 +16695,7 @@ def partner_detail(partner_id):
 @login_required
 @role_required("investor")
 def request_partner_intro(partner_id):
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     if not ip:
         flash("Please complete your investor profile first.", "warning")
         return redirect(url_for("investor.create_profile"))
@@ -16581,7 +16745,7 @@ def request_partner_intro(partner_id):
 @login_required
 @role_required("investor")
 def request_partner_connection(partner_id):
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     if not ip:
         flash("Please complete your investor profile first.", "warning")
         return redirect(url_for("investor.create_profile"))
@@ -16608,7 +16772,7 @@ def request_partner_connection(partner_id):
 @login_required
 @role_required("investor")
 def request_connection():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     if not ip:
         return jsonify({
             "success": False,
@@ -16677,7 +16841,7 @@ def partners_filter():
 @login_required
 @role_required("investor")
 def partner_marketplace():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
 
     service_type = (
         request.args.get("service_type")
@@ -16836,7 +17000,7 @@ def partner_marketplace():
 @login_required
 @role_required("investor")
 def create_partner_request():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
 
     if PartnerRequest is None:
         flash("Partner request workflow is not configured yet.", "warning")
@@ -16891,7 +17055,7 @@ def create_partner_request():
 @login_required
 @role_required("investor")
 def save_external_partner():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
 
     name = (request.form.get("name") or "").strip()
     service_type = (request.form.get("service_type") or "").strip()
@@ -16976,7 +17140,7 @@ def invite_external_partner(lead_id):
 @login_required
 @role_required("investor")
 def create_partner_connection_request_legacy():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
 
     partner_id = request.form.get("partner_id", type=int)
     category = (request.form.get("category") or "").strip()
@@ -17006,7 +17170,7 @@ def create_partner_connection_request_legacy():
 @login_required
 @role_required("investor")
 def save_external_partner_lead():
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
 
     name = (request.form.get("name") or "").strip()
     category = (request.form.get("category") or "").strip()
@@ -17071,7 +17235,7 @@ def save_external_partner_lead():
 @login_required
 @role_required("investor")
 def create_external_partner_request(lead_id):
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     lead = ExternalPartnerLead.query.get_or_404(lead_id)
 
     req = PartnerConnectionRequest(
@@ -17111,8 +17275,6 @@ def investor_partner_search():
     Returns combined Ravlo-network + optional external results, location-filtered.
     External results are only appended when internal results < 3 or explicitly requested.
     """
-    from LoanMVP.services.partner_marketplace_service import search_internal_partners
-
     partner_type    = request.args.get("type", "").strip()
     q               = request.args.get("q", "").strip()
     zip_code        = request.args.get("zip", "").strip() or None
@@ -17178,8 +17340,6 @@ def investor_partner_search():
 @login_required
 def investor_partner_place_details():
     """AJAX: fetch phone + website for a Google Place ID."""
-    import re
-    from LoanMVP.services.partner_marketplace_service import get_place_details
     place_id = request.args.get("place_id", "").strip()
     # Google Place IDs are alphanumeric + underscores/hyphens, 10-300 chars
     if not place_id or not re.match(r'^[A-Za-z0-9_\-]{10,300}$', place_id):
@@ -17241,7 +17401,7 @@ def investor_send_to_partner():
     zip_code = _clean_payload_str("zip")
     studio_items = data.get("studio_items") if isinstance(data.get("studio_items"), list) else []
 
-    ip = InvestorProfile.query.filter_by(user_id=current_user.id).first()
+    ip = _current_investor_profile()
     partner = None
     deal = None
     saved_property = None
@@ -17365,8 +17525,7 @@ def investor_send_to_partner():
         db.session.commit()
     except Exception as exc:
         db.session.rollback()
-        import logging
-        logging.getLogger(__name__).error("[send-to-partner] DB error: %s", exc)
+        logger.error("[send-to-partner] DB error: %s", exc)
         return jsonify({"status": "error", "message": "Could not save request"}), 500
 
     # ── Email notifications for external leads ────────────────────────────
@@ -17471,7 +17630,6 @@ def ai_suggest_description():
     )
 
     try:
-        assistant = AIAssistant()
         suggestion = assistant.generate_reply(prompt, "deal_summary_assist")
         return jsonify({"suggestion": suggestion})
     except Exception:
@@ -293,8 +293,7 @@ def build_loan_officer_dashboard_context(include_ai_summary=True):
     ai_summary = "AI summary unavailable."
     if include_ai_summary:
         try:
-            dashboard_assistant = AIAssistant()
-            ai_summary = dashboard_assistant.generate_reply(
+            ai_summary = assistant.generate_reply(
                 "Summarize loan officer performance across leads, loans, pipeline, and capital applications.",
                 "loan_officer_dashboard"
             )
@@ -777,7 +776,6 @@ def loan_search():
     }
 
     try:
-        assistant = AIAssistant()
         ai_summary = assistant.generate_reply(
             f"Summarize search results for '{query}'. Found {len(loans)} loans.",
             "loan_search_summary"
@@ -813,7 +811,6 @@ def ai_generator():
             return redirect(url_for("loan_officer.ai_generator"))
 
         try:
-            assistant = AIAssistant()
             ai_reply = assistant.generate_reply(prompt, "loan_officer_generator")
         except Exception:
             ai_reply = "AI engine unavailable."
@@ -877,7 +874,6 @@ def new_application():
         db.session.commit()
 
         try:
-            assistant = AIAssistant()
             ai_message = assistant.generate_reply(
                 f"A new {loan_type} loan of ${amount} was created for borrower ID {borrower_id} "
                 f"at {rate}% for {term_months} months, property value ${property_value}.",
@@ -1491,7 +1487,6 @@ def ai_summary():
             f"Total loans: {total_loans}, Approved: {approved}, Pending: {pending}, Leads: {total_leads}."
         )
 
-        assistant = AIAssistant()
         message = assistant.generate_reply(prompt, "loan_officer")
     except Exception:
         message = "AI Summary currently unavailable."
@@ -1761,7 +1756,6 @@ def loan_queue():
             f"Approved: {approved_loans}, Declined: {declined_loans}. "
             f"Provide one prioritization suggestion."
         )
-        assistant = AIAssistant()
         ai_summary = assistant.generate_reply(summary_prompt, "loan_officer")
     except Exception:
         ai_summary = "Summary unavailable."
@@ -2822,7 +2816,6 @@ def capital_funds(loan_id):
 
     if not getattr(loan, "ai_summary", None):
         try:
-            assistant = AIAssistant()
             client_name = (
                 getattr(investor, "full_name", None)
                 or getattr(borrower, "full_name", None)
@@ -3315,7 +3308,6 @@ def resources_chat():
     query = data.get("query", "")
 
     try:
-        assistant = AIAssistant()
         reply = assistant.generate_reply(
             f"Loan officer resource inquiry: {query}. Be concise, accurate, and instructional.",
             "loan_officer"
@@ -23,6 +23,7 @@ from LoanMVP.models.partner_models import (
 )
 
 partners_bp = Blueprint("partners", __name__, url_prefix="/partners")
+assistant = AIAssistant()
 
 
 def _partner_testing_enabled() -> bool:
@@ -1503,7 +1504,6 @@ def create_proposal():
         other_cost = request.form.get("other_cost", type=float) or 0.0
 
         if action == "generate_ai":
-            ai = AIAssistant()
 
             ai_input = f"""
 You are a professional contractor preparing a proposal for a real estate investor.
@@ -1526,7 +1526,7 @@ Write:
 Keep it clear, confident, and investor-friendly.
 """
 
-            generated_text = ai.generate_reply(ai_input, role="general")
+            generated_text = assistant.generate_reply(ai_input, role="general")
 
             prefill = {
                 "title": title or (safe_request.title if safe_request else "Service Proposal"),
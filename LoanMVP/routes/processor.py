@@ -215,7 +215,6 @@ def dashboard():
     }
 
     try:
-        assistant = AIAssistant()
         prompt = (
             f"Summarize processor workload for {getattr(current_user, 'username', 'processor')}. "
             f"There are {len(loans)} loans in the pipeline, including {len(capital_loans)} capital applications, "
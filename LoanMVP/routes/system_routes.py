@@ -8,6 +8,7 @@ from flask import (
 )
 from flask_login import current_user
 from datetime import datetime
+from sqlalchemy import case, func
 
 from LoanMVP.extensions import db, csrf
 from LoanMVP.models.system_models import System, SystemLog, AuditLog, SystemSettings
@@ -650,11 +651,16 @@ def feedback_responses():
     try:
         from LoanMVP.models.company_finance_models import FeedbackSurvey
         responses = FeedbackSurvey.query.order_by(FeedbackSurvey.submitted_at.desc()).all()
-        total = len(responses)
-        avg_nps = round(sum(r.nps_score for r in responses) / total, 1) if total else None
-        promoters   = sum(1 for r in responses if r.nps_score >= 9)
-        passives    = sum(1 for r in responses if 7 <= r.nps_score <= 8)
-        detractors  = sum(1 for r in responses if r.nps_score <= 6)
+
+        score = FeedbackSurvey.nps_score
+        total, avg_score, promoters, passives, detractors = db.session.query(
+            func.count(FeedbackSurvey.id),
+            func.avg(score),
+            func.coalesce(func.sum(case((score >= 9, 1), else_=0)), 0),
+            func.coalesce(func.sum(case((score.between(7, 8), 1), else_=0)), 0),
+            func.coalesce(func.sum(case((score <= 6, 1), else_=0)), 0),
+        ).one()
+        avg_nps = round(float(avg_score), 1) if avg_score is not None else None
         nps_index   = round(((promoters - detractors) / total) * 100) if total else None
     except Exception:
         db.session.rollback()
@@ -95,6 +95,7 @@ from LoanMVP.utils.loan_access import get_loan_or_404
 # Blueprint
 # ─────────────────────────────────────────────────────────────────────────────
 vip_bp = Blueprint("vip", __name__, url_prefix="/vip")
+assistant = AIAssistant()
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Constants
@@ -122,6 +123,10 @@ LISTING_STATUSES = [
     ("withdrawn", "Withdrawn"),
 ]
 
+# Key sets for membership checks, built once instead of per request.
+PIPELINE_STAGE_KEYS = frozenset(key for key, _label in PIPELINE_STAGES)
+LISTING_STATUS_KEYS = frozenset(key for key, _label in LISTING_STATUSES)
+
 MODULE_FIELD_MAP = {
     "crm_enabled":            "crm",
     "finances_enabled":       "finances",
@@ -811,7 +816,7 @@ def _realtor_context(profile, partner):
     }
 
     pipeline_groups = []
-    canonical_keys  = {s[0] for s in PIPELINE_STAGES}
+    canonical_keys  = PIPELINE_STAGE_KEYS
 
     for stage_key, stage_label in PIPELINE_STAGES:
         q = _scope_clients(ElenaClient.query.filter_by(pipeline_stage=stage_key))
@@ -838,7 +843,7 @@ def _realtor_context(profile, partner):
 
     status_filter = (request.args.get("listing_status") or "").strip().lower()
     listings_q    = _scope_listings(ElenaListing.query)
-    if status_filter and status_filter in {s[0] for s in LISTING_STATUSES}:
+    if status_filter and status_filter in LISTING_STATUS_KEYS:
         listings_q = listings_q.filter_by(status=status_filter)
     listings = listings_q.order_by(ElenaListing.updated_at.desc()).limit(12).all()
 
@@ -1806,6 +1811,10 @@ INSURANCE_EXPENSE_CATEGORIES = [
     ("insurance_other", "Other"),
 ]
 
+INSURANCE_PIPELINE_STAGE_KEYS = frozenset(key for key, _label in INSURANCE_PIPELINE_STAGES)
+INSURANCE_INCOME_CATEGORY_KEYS = frozenset(key for key, _label in INSURANCE_INCOME_CATEGORIES)
+INSURANCE_EXPENSE_CATEGORY_KEYS = frozenset(key for key, _label in INSURANCE_EXPENSE_CATEGORIES)
+
 
 def _insurance_social_lead_token(profile):
     if not profile:
@@ -1904,8 +1913,7 @@ def _upsert_insurance_social_contact(profile, payload):
     source = _insurance_source_key(_social_payload_field(payload, "source", "platform", "lead_source", "social_source"))
     line = _insurance_line_key(_social_payload_field(payload, "coverage_line", "line", "insurance_type", "product"))
     stage = (_social_payload_field(payload, "pipeline_stage", "stage") or "new_lead").strip().lower()
-    valid_stages = {key for key, _label in INSURANCE_PIPELINE_STAGES}
-    if stage not in valid_stages:
+    if stage not in INSURANCE_PIPELINE_STAGE_KEYS:
         stage = "new_lead"
 
     campaign = _social_payload_field(payload, "campaign", "campaign_name")
@@ -2339,8 +2347,7 @@ def insurance_finance_add_income():
         return redirect(url_for("vip.insurance_finance"))
 
     category = (request.form.get("category") or "insurance_commission").strip().lower()
-    valid_categories = {key for key, _label in INSURANCE_INCOME_CATEGORIES}
-    if category not in valid_categories:
+    if category not in INSURANCE_INCOME_CATEGORY_KEYS:
         category = "insurance_other"
 
     contact_id = request.form.get("contact_id", type=int)
@@ -2377,8 +2384,7 @@ def insurance_finance_add_expense():
         return redirect(url_for("vip.insurance_finance"))
 
     category = (request.form.get("category") or "insurance_marketing").strip().lower()
-    valid_categories = {key for key, _label in INSURANCE_EXPENSE_CATEGORIES}
-    if category not in valid_categories:
+    if category not in INSURANCE_EXPENSE_CATEGORY_KEYS:
         category = "insurance_other"
 
     contact_id = request.form.get("contact_id", type=int)
@@ -2873,8 +2879,7 @@ def insurance_ai_draft_email():
         "Return the email as JSON with keys: subject, body_html (with basic HTML formatting)"
     )
 
-    ai = AIAssistant()
-    raw = ai.generate_reply(prompt, "insurance")
+    raw = assistant.generate_reply(prompt, "insurance")
 
     try:
         import re as _re
@@ -4365,6 +4370,7 @@ _LISTING_STATUSES = [
     ("sold",      "Sold"),
     ("withdrawn", "Withdrawn"),
 ]
+_LISTING_STATUS_KEYS = frozenset(key for key, _label in _LISTING_STATUSES)
 
 _PRESENTATION_STATUSES = [
     ("draft", "Draft"),
@@ -4436,7 +4442,7 @@ def _new_share_slug():
     but we still re-roll on the off chance one occurs."""
     for _ in range(5):
         slug = _pysecrets.token_urlsafe(12)
-        if not RealtorListingPresentation.query.filter_by(share_slug=slug).first():
+        if db.session.query(RealtorListingPresentation.id).filter_by(share_slug=slug).first() is None:
             return slug
     return _pysecrets.token_urlsafe(24)
 
@@ -4872,7 +4878,7 @@ def realtor_listings():
     elif current_market and current_market != ALL_MARKETS and len(available_markets) == 1:
         q = q.filter(ElenaListing.market == current_market)
 
-    if status_filter and status_filter in {s[0] for s in _LISTING_STATUSES}:
+    if status_filter and status_filter in _LISTING_STATUS_KEYS:
         q = q.filter(ElenaListing.status == status_filter)
 
     if county_filter:
@@ -4984,7 +4990,7 @@ def realtor_listing_status(listing_id):
     if not listing:
         return redirect(url_for("vip.realtor_listings"))
     status = (request.form.get("status") or "").strip().lower()
-    if status in {s[0] for s in _LISTING_STATUSES}:
+    if status in _LISTING_STATUS_KEYS:
         listing.status = status
         db.session.commit()
         flash("Listing status updated.", "success")
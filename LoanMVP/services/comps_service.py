@@ -194,10 +194,11 @@ def get_saved_property_comps(user_id, property_id=None, saved_property_id=None,
     zipcode = prop.zipcode or ""
 
     # ✅ Use saved snapshot first (if fresh)
-    resolved = None
-    if getattr(prop, "resolved_json", None):
+    resolved = getattr(prop, "resolved_json", None) or None
+    if isinstance(resolved, str):
+        # rows written before resolved_json became a JSON column
         try:
-            resolved = json.loads(prop.resolved_json)
+            resolved = json.loads(resolved)
         except Exception:
             resolved = None
 
@@ -211,7 +212,7 @@ def get_saved_property_comps(user_id, property_id=None, saved_property_id=None,
 
         # update snapshot (if columns exist)
         try:
-            prop.resolved_json = json.dumps(resolved)
+            prop.resolved_json = resolved
             prop.resolved_at = datetime.utcnow()
             db.session.commit()
         except Exception:
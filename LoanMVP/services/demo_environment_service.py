@@ -155,7 +155,7 @@ def ensure_demo_environment():
         db.session.flush()
 
     # Sample loans across the pipeline, assigned across officer/processor/underwriter
-    if LoanApplication.query.filter_by(company_id=company.id).count() == 0:
+    if db.session.query(LoanApplication.id).filter_by(company_id=company.id).first() is None:
         sample_loans = [
             dict(status="Submitted", milestone_stage="Application Started", amount=285000, property_address="410 Palmview Ave, Tampa, FL"),
             dict(status="In Review", milestone_stage="Processing", amount=340000, property_address="88 Ridgecrest Dr, Orlando, FL"),
@@ -177,14 +177,14 @@ def ensure_demo_environment():
             ))
 
     # Investor sample saved properties + deals
-    if SavedProperty.query.filter_by(investor_profile_id=investor_profile.id).count() == 0:
+    if db.session.query(SavedProperty.id).filter_by(investor_profile_id=investor_profile.id).first() is None:
         for addr, zipc in (
             ("214 Sunset Palm Dr, Tampa, FL", "33602"),
             ("77 Ocean Breeze Way, Sarasota, FL", "34236"),
         ):
             db.session.add(SavedProperty(investor_profile_id=investor_profile.id, address=addr, zipcode=zipc))
 
-    if Deal.query.filter_by(user_id=investor_user.id).count() == 0:
+    if db.session.query(Deal.id).filter_by(user_id=investor_user.id).first() is None:
         db.session.add(Deal(
             user_id=investor_user.id,
             investor_profile_id=investor_profile.id,
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import json
+import re
 from decimal import Decimal, InvalidOperation
 
+# Blank-value markers shared by the parsing helpers below. Only used inside
+# their try blocks, where an unhashable value falls through to the default.
+_EMPTY_MARKERS = frozenset((None, "", "None"))
+
 
 def _first_non_empty(*values):
     for value in values:
@@ -41,7 +46,7 @@ def _clean_int(value):
 
 def _safe_float(value):
     try:
-        if value in (None, "", "None"):
+        if value in _EMPTY_MARKERS:
             return None
         if isinstance(value, (int, float)):
             return float(value)
@@ -95,7 +100,7 @@ def _json_default():
 
 def _normalize_int(value):
     try:
-        return int(value) if value not in (None, "", "None") else None
+        return int(value) if value not in _EMPTY_MARKERS else None
     except Exception:
         return None
 
@@ -114,7 +119,7 @@ def _normalize_percentage(value):
 
 def safe_float(value, default=0.0):
     try:
-        if value in (None, "", "None"):
+        if value in _EMPTY_MARKERS:
             return float(default)
         return float(value)
     except (TypeError, ValueError):
@@ -135,7 +140,7 @@ def safe_int(value, default=0, min_v=None, max_v=None):
 
 def safe_decimal(value, default="0.00"):
     try:
-        if value in (None, "", "None"):
+        if value in _EMPTY_MARKERS:
             return Decimal(default)
         return Decimal(str(value))
     except (InvalidOperation, TypeError, ValueError):
@@ -144,34 +149,19 @@ def safe_decimal(value, default="0.00"):
 
 def fmt_money(value, blank="—"):
     try:
-        if value in (None, "", "None"):
+        if value in _EMPTY_MARKERS:
             return blank
         return f"${Decimal(str(value)):,.2f}"
     except Exception:
         return blank
 
 
+# One whole comma/semicolon-separated integer token per match; malformed
+# tokens ("12abc", "1.5") are skipped, same as the old int() try/except.
+_ID_TOKEN_RE = re.compile(r"(?:^|[,;])\s*([+-]?\d+)\s*(?=[,;]|$)")
+
+
 def split_ids(csv_string: str):
     if not csv_string:
         return []
-
-    parts = csv_string.replace(";", ",").split(",")
-    cleaned = []
-
-    for p in parts:
-        p = p.strip()
-        if not p:
-            continue
-        try:
-            cleaned.append(int(p))
-        except Exception:
-            continue
-
-    seen = set()
-    result = []
-    for i in cleaned:
-        if i not in seen:
-            seen.add(i)
-            result.append(i)
-
-    return result
\ No newline at end of file
+    return list(dict.fromkeys(int(token) for token in _ID_TOKEN_RE.findall(csv_string)))
\ No newline at end of file
@@ -6,7 +6,9 @@ import uuid
 import mimetypes
 import base64
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse, parse_qs
 
 from LoanMVP.utils.safe_http import safe_call
@@ -23,7 +25,7 @@ try:
 except ModuleNotFoundError:
     boto3 = None
 
-from flask import current_app
+from flask import current_app, has_app_context
 
 
 def _photo_score(url: str | None) -> int:
@@ -247,6 +249,15 @@ _BROWSER_HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 
+# Listing photos and studio images mostly come from a handful of CDN hosts,
+# so one keep-alive pool per worker skips a TCP/TLS handshake per image.
+_image_session = requests.Session()
+_image_session.headers.update(_BROWSER_HEADERS)
+_image_session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+_image_session.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+IMAGE_DOWNLOAD_MAX_WORKERS = 8
+
 
 _LISTING_PAGE_RULES: list[tuple[str, str]] = [
     # (hostname_suffix, path_substring)
@@ -309,7 +320,7 @@ def download_image_bytes(url: str) -> bytes | None:
         logger.info("Skipping non-image URL: %s", url[:200])
         return None
     try:
-        res = safe_call(requests.get, url, timeout=15, headers=_BROWSER_HEADERS)
+        res = safe_call(_image_session.get, url, timeout=15)
         if not res.ok:
             logger.info("Image download returned %s for %s", res.status_code, url[:200])
             return None
@@ -326,18 +337,44 @@ def download_image_bytes(url: str) -> bytes | None:
     return None
 
 
-def to_png_bytes(image_bytes: bytes) -> bytes:
-    img = Image.open(BytesIO(image_bytes)).convert("RGBA")
+def _reencode(image_bytes: bytes, fmt: str, mode: str, **save_kwargs) -> bytes:
+    # Image.open only reads the header, so a source that is already in the
+    # target format and mode is returned untouched without decoding pixels,
+    # and convert() is skipped when it would only make a full-size copy.
+    img = Image.open(BytesIO(image_bytes))
+    if img.format == fmt and img.mode == mode:
+        return image_bytes
+    if img.mode != mode:
+        img = img.convert(mode)
     out = BytesIO()
-    img.save(out, format="PNG")
+    img.save(out, format=fmt, **save_kwargs)
     return out.getvalue()
 
 
+def download_image_bytes_many(urls: list[str]) -> list[bytes | None]:
+    """download_image_bytes() for several URLs at once, results in input order."""
+    urls = list(urls)
+    if len(urls) <= 1:
+        return [download_image_bytes(url) for url in urls]
+
+    app = current_app._get_current_object() if has_app_context() else None
+
+    def _fetch(url):
+        if app is None:
+            return download_image_bytes(url)
+        with app.app_context():
+            return download_image_bytes(url)
+
+    with ThreadPoolExecutor(max_workers=min(IMAGE_DOWNLOAD_MAX_WORKERS, len(urls))) as pool:
+        return list(pool.map(_fetch, urls))
+
+
+def to_png_bytes(image_bytes: bytes) -> bytes:
+    return _reencode(image_bytes, "PNG", "RGBA")
+
+
 def to_webp_bytes(image_bytes: bytes) -> bytes:
-    img = Image.open(BytesIO(image_bytes)).convert("RGB")
-    out = BytesIO()
-    img.save(out, format="WEBP", quality=85)
-    return out.getvalue()
+    return _reencode(image_bytes, "WEBP", "RGB", quality=85)
 
 
 def upload_listing_photos_to_spaces(photos: list[str], prefix="listing") -> list[str]:
@@ -352,9 +389,8 @@ def upload_listing_photos_to_spaces(photos: list[str], prefix="listing") -> list
 
     uploaded_urls = []
 
-    for url in photos:
+    for url, raw in zip(photos, download_image_bytes_many(photos)):
         try:
-            raw = download_image_bytes(url)
             if not raw:
                 continue
 
@@ -6,6 +6,7 @@ from datetime import datetime
 
 from flask import current_app
 from flask_login import current_user
+from sqlalchemy.orm.attributes import flag_modified
 
 from LoanMVP.extensions import db
 from LoanMVP.models.borrowers import Deal
@@ -17,8 +18,13 @@ from LoanMVP.services.investor.investor_helpers import (
     _safe_int,
 )
 from LoanMVP.services.investor.investor_saved_property_helpers import (
+    _SAVED_PROPERTY_HAS_RESOLVED_JSON,
+    _find_saved_property_match,
+    _invalidate_saved_property_lookup,
     _profile_id_filter,
+    _to_int,
 )
+from LoanMVP.services.property_cache import _squash_address
 from LoanMVP.services.investor.investor_deal_analysis_helpers import (
     _build_deal_architect_payload,
     _attach_deal_architect_signals,
@@ -30,8 +36,6 @@ def _deal_results(deal):
 
 
 def _set_deal_results(deal, results):
-    from sqlalchemy.orm.attributes import flag_modified
-
     deal.results_json = copy.deepcopy(results or {})
     flag_modified(deal, "results_json")
 
@@ -456,7 +460,7 @@ def _project_studio_upsert_deal(
     market_snapshot: dict | None = None,
     deal_id: int | None = None,
 ):
-    address = (snapshot.get("address") or "").strip()
+    address = _squash_address(snapshot.get("address"))
     if not investor_profile or not address or not selected_card or not selected_scope or not scope_budget:
         return None
 
@@ -466,25 +470,16 @@ def _project_studio_upsert_deal(
     state = (snapshot.get("state") or "").strip() or None
     sqft = snapshot.get("sqft") or snapshot.get("square_feet")
 
-    try:
-        sqft = int(float(sqft)) if sqft not in (None, "", "None") else None
-    except Exception:
-        sqft = None
+    sqft = _to_int(sqft)
 
+    now = datetime.utcnow()
     fk = _profile_id_filter(SavedProperty, investor_profile.id)
-    saved_property = None
-
-    if property_id:
-        saved_property = SavedProperty.query.filter_by(
-            **fk,
-            property_id=str(property_id),
-        ).first()
-
-    if not saved_property:
-        saved_property = SavedProperty.query.filter(
-            getattr(SavedProperty, "investor_profile_id", SavedProperty.borrower_profile_id) == investor_profile.id,
-            db.func.lower(SavedProperty.address) == address.lower(),
-        ).first()
+    _invalidate_saved_property_lookup(investor_profile.id)
+    saved_property = _find_saved_property_match(
+        investor_profile.id,
+        str(property_id) if property_id else None,
+        address,
+    )
 
     if not saved_property:
         saved_property = SavedProperty(
@@ -494,8 +489,8 @@ def _project_studio_upsert_deal(
             price=str(snapshot.get("listing_price") or snapshot.get("price") or ""),
             sqft=sqft,
             zipcode=zipcode,
-            saved_at=datetime.utcnow(),
-            created_at=datetime.utcnow(),
+            saved_at=now,
+            created_at=now,
         )
         db.session.add(saved_property)
         db.session.flush()
@@ -505,7 +500,7 @@ def _project_studio_upsert_deal(
         saved_property.price = str(snapshot.get("listing_price") or snapshot.get("price") or saved_property.price or "")
         saved_property.sqft = sqft or saved_property.sqft
         saved_property.zipcode = zipcode or saved_property.zipcode
-        saved_property.saved_at = datetime.utcnow()
+        saved_property.saved_at = now
 
     saved_property_payload = {
         "property": {
@@ -523,9 +518,9 @@ def _project_studio_upsert_deal(
         },
     }
 
-    if hasattr(saved_property, "resolved_json"):
-        saved_property.resolved_json = json.dumps(saved_property_payload)
-        saved_property.resolved_at = datetime.utcnow()
+    if _SAVED_PROPERTY_HAS_RESOLVED_JSON:
+        saved_property.resolved_json = saved_property_payload
+        saved_property.resolved_at = now
 
     deal = None
     if deal_id:
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-import json
 import hashlib
+import logging
 from datetime import datetime
+from functools import lru_cache
 
 from flask import jsonify
 from flask_login import current_user
+from sqlalchemy import case, false, func, literal_column, or_, true
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm.attributes import flag_modified
 
 from LoanMVP.extensions import db
 from LoanMVP.models.investor_models import InvestorProfile
@@ -22,10 +27,19 @@ from LoanMVP.services.investor.investor_media_helpers import (
     _normalize_photo_urls,
     _resolve_photo,
 )
+from LoanMVP.services.property_cache import _canon_addr, _squash_address
+from LoanMVP.utils.ttl_cache import TTLCache
+
+_log = logging.getLogger(__name__)
 
 
 SAVED_PROPERTY_ID_MAX_LENGTH = 50
 
+# The SavedProperty schema is fixed for the life of the process, so resolve
+# these capability checks once instead of walking the descriptors per save.
+_SAVED_PROPERTY_HAS_RESOLVED_JSON = hasattr(SavedProperty, "resolved_json")
+_SAVED_PROPERTY_HAS_RESOLVED_AT = hasattr(SavedProperty, "resolved_at")
+
 
 def _profile_id_filter(model, profile_id):
     if hasattr(model, "investor_profile_id"):
@@ -35,6 +49,83 @@ def _profile_id_filter(model, profile_id):
     return {}
 
 
+# property_search asks "is this address already saved?" on every GET. An
+# investor's saved set is small, so their whole {address_lower: id} map is
+# loaded once and reused for a couple of minutes; paths that save or delete
+# a property drop the investor's map.
+SAVED_LOOKUP_TTL_SECONDS = 120
+SAVED_LOOKUP_MAX_ENTRIES = 2_000
+_saved_lookup_cache = TTLCache(SAVED_LOOKUP_TTL_SECONDS, max_entries=SAVED_LOOKUP_MAX_ENTRIES)
+
+
+def _saved_address_map(profile_id):
+    address_map = _saved_lookup_cache.get(profile_id)
+    if address_map is not None:
+        return address_map
+
+    rows = (
+        db.session.query(SavedProperty.address_lower, SavedProperty.id)
+        .filter(
+            getattr(SavedProperty, "investor_profile_id", SavedProperty.borrower_profile_id) == profile_id,
+        )
+        .order_by(SavedProperty.id)
+        .all()
+    )
+    address_map = {}
+    for address_lower, saved_id in rows:
+        if address_lower:
+            # Rows saved before addresses were squashed may still carry
+            # doubled spaces, so key them the same way lookups are keyed.
+            address_map.setdefault(_canon_addr(address_lower), saved_id)
+
+    _saved_lookup_cache.set(profile_id, address_map)
+    return address_map
+
+
+def _lookup_saved_property_id(profile_id, address):
+    return _saved_address_map(profile_id).get(_canon_addr(address))
+
+
+def _invalidate_saved_property_lookup(profile_id):
+    _saved_lookup_cache.pop(profile_id)
+
+
+# Provider payloads name the same field several ways; the first populated
+# alias wins, in the order listed.
+_RESOLVED_PROPERTY_ALIASES = {
+    "property_id": ("property_id", "id", "propertyId"),
+    "zip": ("zip", "zipCode", "postalCode"),
+    "sqft": ("sqft", "squareFootage"),
+}
+
+
+_BLANK_ALIAS_VALUES = (None, "", "None")
+
+
+def _to_int(value):
+    """Parse a sqft-style value; digit-only strings skip the float() hop."""
+    if value in _BLANK_ALIAS_VALUES:
+        return None
+    text = str(value).strip()
+    try:
+        return int(text) if text.lstrip("-").isdigit() else int(float(text))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _first(d, *keys, default=None):
+    """Return the first populated value among ``keys``, stopping at the first hit."""
+    return next((d[k] for k in keys if d.get(k) not in _BLANK_ALIAS_VALUES), default)
+
+
+def _resolved_property_fields(prop) -> dict:
+    """Pick each canonical field from a resolved property in a single walk."""
+    return {
+        target: _first(prop, *aliases) or None
+        for target, aliases in _RESOLVED_PROPERTY_ALIASES.items()
+    }
+
+
 def _property_payload_from_any(payload) -> dict:
     raw = _safe_json_loads_local(payload, default={})
     if not isinstance(raw, dict):
@@ -71,30 +162,135 @@ def _get_investor_profile_or_error():
     return ip, None
 
 
+def _find_saved_property_match(profile_id, property_id=None, address=None):
+    """
+    Find an investor's saved property by property_id or address in a single
+    round-trip. A property_id hit is preferred over an address-only hit.
+    """
+    if not property_id and not address:
+        return None
+
+    property_id_match = (SavedProperty.property_id == property_id) if property_id else false()
+    address_match = (SavedProperty.address_lower == _canon_addr(address)) if address else false()
+
+    query = SavedProperty.query.filter(
+        getattr(SavedProperty, "investor_profile_id", SavedProperty.borrower_profile_id) == profile_id,
+        or_(property_id_match, address_match),
+    )
+    if property_id and address:
+        query = query.order_by(case((property_id_match, 0), else_=1))
+
+    return query.first()
+
+
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+# Columns an upsert may fill in on an existing row; values already present
+# on the saved property always win.
+_UPSERT_FILL_COLUMNS = ("address", "property_id", "price", "zipcode")
+
+
+def _fill_blank_saved_property_fields(existing, values):
+    for column in _UPSERT_FILL_COLUMNS:
+        if not getattr(existing, column, None) and values.get(column):
+            setattr(existing, column, values[column])
+    if not getattr(existing, "sqft", None) and values.get("sqft"):
+        existing.sqft = values["sqft"]
+
+
+def _is_missing_upsert_arbiter(exc):
+    """True when ON CONFLICT failed because no matching unique index exists."""
+    orig = getattr(exc, "orig", None)
+    sqlstate = getattr(orig, "pgcode", None) or getattr(orig, "sqlstate", None)
+    if sqlstate == "42P10":  # invalid_column_reference
+        return True
+    return "ON CONFLICT clause does not match" in str(orig)
+
+
+def _upsert_saved_property_row(profile_id, values, now):
+    """
+    Save a property for an investor, or fill in the blank fields of their
+    existing row, and return ``(saved_id, created)``.
+
+    An existing row is matched by property_id first and then by address,
+    so a property saved under a differently formatted address is not
+    duplicated. When neither matches, the row is written with
+    INSERT ... ON CONFLICT (investor_profile_id, address_lower) DO UPDATE on
+    Postgres/SQLite, so a concurrent save of the same address still lands on
+    one row. Falls back to a plain ORM insert on other dialects or when the
+    unique index hasn't been migrated yet.
+    """
+    fk = _profile_id_filter(SavedProperty, profile_id)
+    values = {**values, "address": _squash_address(values.get("address")) or None}
+    row = {**fk, **values, "saved_at": now, "created_at": now}
+    _invalidate_saved_property_lookup(profile_id)
+
+    existing = _find_saved_property_match(profile_id, values.get("property_id"), values.get("address"))
+    if existing:
+        _fill_blank_saved_property_fields(existing, values)
+        return existing.id, False
+
+    dialect = db.session.get_bind().dialect.name
+    insert = _UPSERT_INSERTS.get(dialect)
+    if insert is not None and "investor_profile_id" in fk:
+        table = SavedProperty.__table__
+        stmt = insert(table).values(**row)
+        excluded = stmt.excluded
+
+        set_ = {
+            column: func.coalesce(func.nullif(table.c[column], ""), excluded[column])
+            for column in _UPSERT_FILL_COLUMNS
+        }
+        set_["sqft"] = func.coalesce(func.nullif(table.c.sqft, 0), excluded.sqft)
+
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.investor_profile_id, table.c.address_lower],
+            set_=set_,
+        )
+        # Postgres reports whether the row was inserted (xmax = 0) or hit the
+        # conflict arm; SQLite can't tell, and the lookup above already found
+        # no row, so an insert is assumed there.
+        inserted = literal_column("xmax = 0") if dialect == "postgresql" else true()
+        stmt = stmt.returning(table.c.id, inserted)
+
+        try:
+            with db.session.begin_nested():
+                saved_id, created = db.session.execute(stmt).one()
+            return saved_id, bool(created)
+        except DBAPIError as exc:
+            # Only a database that hasn't run the unique-index migration yet
+            # falls back to the ORM path; anything else is a real failure.
+            if not _is_missing_upsert_arbiter(exc):
+                raise
+            _log.warning(
+                "saved property upsert fell back to a plain insert; "
+                "unique index on (investor_profile_id, address_lower) is missing: %s",
+                exc.orig,
+            )
+
+    saved = SavedProperty(**row)
+    db.session.add(saved)
+    db.session.flush()
+    return saved.id, True
+
+
 def _find_existing_saved_property(ip, payload):
     address = _clean_str(payload.get("address"))
     property_id = _normalize_saved_property_id(payload.get("property_id") or payload.get("attom_id"))
 
-    fk = _profile_id_filter(SavedProperty, ip.id)
-    existing = None
+    return _find_saved_property_match(ip.id, property_id, address)
 
-    if property_id:
-        existing = SavedProperty.query.filter_by(
-            **fk,
-            property_id=property_id
-        ).first()
 
-    if not existing and address:
-        existing = SavedProperty.query.filter(
-            getattr(SavedProperty, "investor_profile_id", SavedProperty.borrower_profile_id) == ip.id,
-            db.func.lower(SavedProperty.address) == address.lower()
-        ).first()
-
-    return existing
+@lru_cache(maxsize=None)
+def _model_has_attr(model_cls, field_name):
+    return hasattr(model_cls, field_name)
 
 
 def _assign_if_has_attr(model_obj, field_name, value):
-    if hasattr(model_obj, field_name) and value is not None:
+    if value is not None and _model_has_attr(type(model_obj), field_name):
         setattr(model_obj, field_name, value)
 
 
@@ -120,15 +316,17 @@ def _normalize_saved_property_id(value):
     return f"pid_{digest[:SAVED_PROPERTY_ID_MAX_LENGTH - 4]}"
 
 
-def _persist_property_core_fields(saved, payload):
+def _persist_property_core_fields(saved, payload, now=None):
     """
     Persist richer canonical fields when the SavedProperty model supports them.
     This is intentionally defensive so it works with your current schema.
+    Pass ``now`` to stamp every timestamp with the caller's request time.
     """
-    address = _clean_str(payload.get("address"))
+    now = now or datetime.utcnow()
+    address = _squash_address(_clean_str(payload.get("address"))) or None
     city = _clean_str(payload.get("city"))
     state = _clean_str(payload.get("state"))
-    zipcode = _clean_str(payload.get("zip") or payload.get("zip_code"))
+    zipcode = _clean_str(_first(payload, "zip", "zip_code"))
     property_id = _normalize_saved_property_id(payload.get("property_id") or payload.get("attom_id"))
 
     purchase_price = _clean_num(
@@ -148,7 +346,7 @@ def _persist_property_core_fields(saved, payload):
     monthly_rent = _clean_num(payload.get("monthly_rent") or payload.get("monthly_rent_estimate"))
     last_sale_price = _clean_num(payload.get("last_sale_price"))
 
-    sqft = _clean_int(payload.get("sqft") or payload.get("square_feet"))
+    sqft = _clean_int(_first(payload, "sqft", "square_feet"))
     lot_size_sqft = _clean_int(payload.get("lot_size_sqft"))
     beds = _clean_num(payload.get("beds"))
     baths = _clean_num(payload.get("baths"))
@@ -246,10 +444,10 @@ def _persist_property_core_fields(saved, payload):
     # status / timestamps if present on model
     _assign_if_has_attr(saved, "analysis_status", "pending")
     _assign_if_has_attr(saved, "budget_status", "pending")
-    _assign_if_has_attr(saved, "last_synced_at", datetime.utcnow())
-    _assign_if_has_attr(saved, "updated_at", datetime.utcnow())
+    _assign_if_has_attr(saved, "last_synced_at", now)
+    _assign_if_has_attr(saved, "updated_at", now)
 
-    if hasattr(saved, "resolved_json"):
+    if _SAVED_PROPERTY_HAS_RESOLVED_JSON:
         resolved = _safe_json_loads_local(getattr(saved, "resolved_json", None), default={})
         if not isinstance(resolved, dict):
             resolved = {}
@@ -359,13 +557,17 @@ def _persist_property_core_fields(saved, payload):
         if isinstance(payload.get("recommendation"), dict) and payload.get("recommendation"):
             resolved["recommendation"] = payload.get("recommendation")
 
-        saved.resolved_json = json.dumps(resolved)
-        if hasattr(saved, "resolved_at"):
-            saved.resolved_at = datetime.utcnow()
+        # resolved may be the same dict already loaded on the row, so flag
+        # the in-place edits explicitly.
+        saved.resolved_json = resolved
+        flag_modified(saved, "resolved_json")
+        if _SAVED_PROPERTY_HAS_RESOLVED_AT:
+            saved.resolved_at = now
 
 
-def _upsert_saved_property_from_payload(ip, payload):
-    address = _clean_str(payload.get("address"))
+def _upsert_saved_property_from_payload(ip, payload, now=None):
+    now = now or datetime.utcnow()
+    address = _squash_address(_clean_str(payload.get("address")))
     if not address:
         raise ValueError("Address is required.")
 
@@ -375,13 +577,14 @@ def _upsert_saved_property_from_payload(ip, payload):
         or payload.get("display_value")
         or payload.get("last_sale_price")
     )
-    sqft = _clean_int(payload.get("sqft") or payload.get("square_feet"))
-    zipcode = _clean_str(payload.get("zip") or payload.get("zip_code"))
+    sqft = _clean_int(_first(payload, "sqft", "square_feet"))
+    zipcode = _clean_str(_first(payload, "zip", "zip_code"))
     property_id = _normalize_saved_property_id(payload.get("property_id") or payload.get("attom_id"))
     image_url = _clean_str(payload.get("image_url"))
 
     existing = _find_existing_saved_property(ip, payload)
     fk = _profile_id_filter(SavedProperty, ip.id)
+    _invalidate_saved_property_lookup(ip.id)
 
     if not existing:
         create_kwargs = {
@@ -390,8 +593,8 @@ def _upsert_saved_property_from_payload(ip, payload):
             "address": address,
             "price": str(purchase_price or ""),
             "sqft": sqft,
-            "saved_at": datetime.utcnow(),
-            "created_at": datetime.utcnow(),
+            "saved_at": now,
+            "created_at": now,
         }
 
         if hasattr(SavedProperty, "zipcode"):
@@ -406,5 +609,5 @@ def _upsert_saved_property_from_payload(ip, payload):
         db.session.add(existing)
         db.session.flush()
 
-    _persist_property_core_fields(existing, payload)
+    _persist_property_core_fields(existing, payload, now=now)
     return existing
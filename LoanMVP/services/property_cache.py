@@ -1,21 +1,32 @@
-import time
+import re
+import unicodedata
+
+from LoanMVP.utils.ttl_cache import TTLCache
 
-_cache = {}
 TTL_SECONDS = 60 * 10  # 10 minutes
+MAX_ENTRIES = 4096
+_cache = TTLCache(TTL_SECONDS, max_entries=MAX_ENTRIES)
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _squash_address(address: str) -> str:
+    """NFKC-fold an address and collapse its whitespace, keeping case for display."""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", address or "")).strip()
+
+
+def _canon_addr(address: str) -> str:
+    """Case-folded form of ``_squash_address`` used for dedup and cache keys."""
+    return _squash_address(address).lower()
+
+
+def _cache_key(address: str) -> str:
+    return _canon_addr(address)
+
 
 def get_cached_property(address: str):
-    key = address.strip().lower()
-    entry = _cache.get(key)
-    if not entry:
-        return None
-    if time.time() > entry["expires_at"]:
-        _cache.pop(key, None)
-        return None
-    return entry["value"]
+    return _cache.get(_cache_key(address))
 
 def set_cached_property(address: str, value: dict):
-    key = address.strip().lower()
-    _cache[key] = {
-        "value": value,
-        "expires_at": time.time() + TTL_SECONDS,
-    }
+    _cache.set(_cache_key(address), value)
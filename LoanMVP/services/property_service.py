@@ -1,9 +1,24 @@
 from flask import current_app
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from LoanMVP.utils.safe_http import safe_call
 
 
+# One keep-alive pool per worker so repeated ATTOM lookups skip the
+# TCP/TLS handshake.
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    ),
+)
+
+
 class PropertyToolError(Exception):
     pass
 
@@ -101,7 +116,7 @@ def _attom_get(path: str, params: dict | None = None) -> dict:
     url = f"{_attom_base_url()}/{path.lstrip('/')}"
     try:
         res = safe_call(
-            requests.get,
+            _session.get,
             url,
             headers=_attom_headers(),
             params=params or {},
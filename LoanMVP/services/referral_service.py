@@ -20,7 +20,7 @@ def get_or_create_referral_code(user: User) -> str:
 
     for _ in range(5):
         candidate = _generate_referral_code()
-        if not User.query.filter_by(referral_code=candidate).first():
+        if db.session.query(User.id).filter_by(referral_code=candidate).first() is None:
             user.referral_code = candidate
             db.session.commit()
             return candidate
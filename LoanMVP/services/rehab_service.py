@@ -19,6 +19,51 @@ except Exception:  # pragma: no cover - defensive: never break this module
     get_learned_multiplier = None
 
 
+# National-average rate tables. They never change at runtime, so they are
+# built once here rather than on every estimate/optimizer iteration.
+REHAB_BASE_COSTS = {"light": 15, "medium": 30, "heavy": 50}
+
+REHAB_ITEM_COSTS = {
+    "kitchen":  {"light": 8000, "medium": 15000, "heavy": 25000},
+    "bathroom": {"light": 4000, "medium":  8000, "heavy": 15000},
+    "flooring": {"light": 3000, "medium":  6000, "heavy": 12000},
+    "paint":    {"light": 2000, "medium":  4000, "heavy":  8000},
+    "roof":     {"light": 3000, "medium":  7000, "heavy": 12000},
+    "hvac":     {"light": 2000, "medium":  5000, "heavy":  9000},
+}
+
+REHAB_BASE_WEEKS = {"light": 2, "medium": 4, "heavy": 8}
+
+REHAB_ITEM_WEEKS = {
+    "kitchen": {"light": 1, "medium": 2, "heavy": 4},
+    "bathroom": {"light": 1, "medium": 2, "heavy": 3},
+    "flooring": {"light": 1, "medium": 1, "heavy": 2},
+    "paint": {"light": 1, "medium": 1, "heavy": 2},
+    "roof": {"light": 1, "medium": 2, "heavy": 3},
+    "hvac": {"light": 1, "medium": 2, "heavy": 3},
+}
+
+MATERIAL_RATES = {
+    "flooring": {"light": 1.50, "medium": 2.50, "heavy": 5.00},
+    "paint": {"light": 0.50, "medium": 1.00, "heavy": 1.50},
+    "tile": {"light": 2.00, "medium": 4.00, "heavy": 7.00},
+}
+
+FIXED_MATERIALS = {
+    "kitchen": {"light": 1500, "medium": 3500, "heavy": 8000},
+    "bathroom": {"light": 800, "medium": 2000, "heavy": 4500},
+}
+
+REHAB_DOWNGRADE_ORDER = (
+    ("kitchen", ["heavy", "medium", "light", ""]),
+    ("bathroom", ["heavy", "medium", "light", ""]),
+    ("flooring", ["heavy", "medium", "light", ""]),
+    ("paint", ["heavy", "medium", "light", ""]),
+    ("roof", ["heavy", "medium", "light", ""]),
+    ("hvac", ["heavy", "medium", "light", ""]),
+)
+
+
 def _to_number(x, default=0.0):
     """Convert ints/floats and common numeric strings ('$250,000') to float."""
     if x is None:
@@ -36,6 +81,18 @@ def _to_number(x, default=0.0):
     return default
 
 
+def _rehab_local_index(zip_code, state, scope):
+    if describe_learned_index is None:
+        return {"factor": 1.0}
+    try:
+        return describe_learned_index(
+            zip_code=zip_code, state=state,
+            category="rehab", scope=scope,
+        )
+    except Exception:
+        return {"factor": 1.0}
+
+
 def estimate_rehab_cost(
     property_sqft,
     scope="medium",
@@ -43,6 +100,7 @@ def estimate_rehab_cost(
     *,
     zip_code=None,
     state=None,
+    local_index=None,
 ):
     """Estimate rehab cost for a property.
 
@@ -50,21 +108,12 @@ def estimate_rehab_cost(
     per-line-item cost is multiplied by the local cost index (RSMeans seed
     blended with real ``CostObservation`` data for the ZIP3/state). When no
     location is given, behaves exactly like the legacy national-average
-    estimator.
+    estimator. Callers that re-estimate the same location and scope can pass
+    a previously fetched ``local_index`` to skip the lookup.
     """
-    base_costs = {"light": 15, "medium": 30, "heavy": 50}
-    base = base_costs.get(scope, 30)
+    base = REHAB_BASE_COSTS.get(scope, 30)
 
-    if describe_learned_index is not None:
-        try:
-            local = describe_learned_index(
-                zip_code=zip_code, state=state,
-                category="rehab", scope=scope,
-            )
-        except Exception:
-            local = {"factor": 1.0}
-    else:
-        local = {"factor": 1.0}
+    local = local_index if local_index is not None else _rehab_local_index(zip_code, state, scope)
     multiplier = float(local.get("factor") or 1.0)
 
     sqft = _to_number(property_sqft, 0.0)
@@ -82,21 +131,12 @@ def estimate_rehab_cost(
         "local_index":  local,              # full describe_learned_index() dict
     }
 
-    default_items = {
-        "kitchen":  {"light": 8000, "medium": 15000, "heavy": 25000},
-        "bathroom": {"light": 4000, "medium":  8000, "heavy": 15000},
-        "flooring": {"light": 3000, "medium":  6000, "heavy": 12000},
-        "paint":    {"light": 2000, "medium":  4000, "heavy":  8000},
-        "roof":     {"light": 3000, "medium":  7000, "heavy": 12000},
-        "hvac":     {"light": 2000, "medium":  5000, "heavy":  9000},
-    }
-
     total = base_total
 
     if items:
         for key, level in items.items():
-            if key in default_items and level:
-                national_cost = _to_number(default_items[key].get(level, 0), 0.0)
+            if key in REHAB_ITEM_COSTS and level:
+                national_cost = _to_number(REHAB_ITEM_COSTS[key].get(level, 0), 0.0)
                 local_cost = national_cost * multiplier
                 breakdown["items"][key] = {
                     "level": level,
@@ -155,24 +195,14 @@ def generate_rehab_risk_flags(results, comps):
 
 
 def estimate_rehab_timeline(items, scope):
-    base_weeks = {"light": 2, "medium": 4, "heavy": 8}
-    timeline = _to_number(base_weeks.get(scope, 4), 0.0)
-
-    item_weeks = {
-        "kitchen": {"light": 1, "medium": 2, "heavy": 4},
-        "bathroom": {"light": 1, "medium": 2, "heavy": 3},
-        "flooring": {"light": 1, "medium": 1, "heavy": 2},
-        "paint": {"light": 1, "medium": 1, "heavy": 2},
-        "roof": {"light": 1, "medium": 2, "heavy": 3},
-        "hvac": {"light": 1, "medium": 2, "heavy": 3},
-    }
+    timeline = _to_number(REHAB_BASE_WEEKS.get(scope, 4), 0.0)
 
     breakdown = {}
     items = items or {}
 
     for key, level in items.items():
-        if key in item_weeks and level:
-            weeks = _to_number(item_weeks[key].get(level, 0), 0.0)
+        if key in REHAB_ITEM_WEEKS and level:
+            weeks = _to_number(REHAB_ITEM_WEEKS[key].get(level, 0), 0.0)
             breakdown[key] = weeks
             timeline += weeks
 
@@ -183,31 +213,20 @@ def estimate_rehab_timeline(items, scope):
 def estimate_material_costs(property_sqft, items):
     sqft = _to_number(property_sqft, 0.0)
 
-    material_rates = {
-        "flooring": {"light": 1.50, "medium": 2.50, "heavy": 5.00},
-        "paint": {"light": 0.50, "medium": 1.00, "heavy": 1.50},
-        "tile": {"light": 2.00, "medium": 4.00, "heavy": 7.00},
-    }
-
-    fixed_materials = {
-        "kitchen": {"light": 1500, "medium": 3500, "heavy": 8000},
-        "bathroom": {"light": 800, "medium": 2000, "heavy": 4500},
-    }
-
     breakdown = {}
     total = 0.0
     items = items or {}
 
     for key, level in items.items():
-        if key in material_rates and level:
-            rate = _to_number(material_rates[key].get(level, 0), 0.0)
+        if key in MATERIAL_RATES and level:
+            rate = _to_number(MATERIAL_RATES[key].get(level, 0), 0.0)
             cost = sqft * rate
             breakdown[key] = cost
             total += cost
 
     for key, level in items.items():
-        if key in fixed_materials and level:
-            cost = _to_number(fixed_materials[key].get(level, 0), 0.0)
+        if key in FIXED_MATERIALS and level:
+            cost = _to_number(FIXED_MATERIALS[key].get(level, 0), 0.0)
             breakdown[key] = breakdown.get(key, 0.0) + cost
             total += cost
 
@@ -281,10 +300,17 @@ def optimize_rehab_to_budget(target_budget, items, scope, sqft, *, zip_code=None
     target_budget = _to_number(target_budget, 0.0)
     sqft = _to_number(sqft, 0.0)
 
+    # Each downgrade step re-estimates at the same location, so the local
+    # cost index (a CostObservation query) is fetched once per scope.
+    local_indexes = {}
+
     def calc():
+        if current_scope not in local_indexes:
+            local_indexes[current_scope] = _rehab_local_index(zip_code, state, current_scope)
         rehab = estimate_rehab_cost(
             sqft, current_scope, optimized,
             zip_code=zip_code, state=state,
+            local_index=local_indexes[current_scope],
         )
         return _to_number(rehab["total"], 0.0), rehab
 
@@ -293,16 +319,7 @@ def optimize_rehab_to_budget(target_budget, items, scope, sqft, *, zip_code=None
     if target_budget and total <= target_budget:
         return optimized, rehab_data
 
-    downgrade_order = [
-        ("kitchen", ["heavy", "medium", "light", ""]),
-        ("bathroom", ["heavy", "medium", "light", ""]),
-        ("flooring", ["heavy", "medium", "light", ""]),
-        ("paint", ["heavy", "medium", "light", ""]),
-        ("roof", ["heavy", "medium", "light", ""]),
-        ("hvac", ["heavy", "medium", "light", ""]),
-    ]
-
-    for key, levels in downgrade_order:
+    for key, levels in REHAB_DOWNGRADE_ORDER:
         if key in optimized:
             current_level = optimized[key]
             if current_level in levels:
@@ -1,7 +1,10 @@
+import copy
 import time
 import re
 import hashlib
 
+from flask import current_app
+
 from LoanMVP.services.ai_summary import generate_property_summary
 from LoanMVP.services.attom_service import (
     build_attom_dealfinder_profile,
@@ -10,9 +13,13 @@ from LoanMVP.services.attom_service import (
 
 from LoanMVP.services.rentcast_provider import fetch_rentcast_data
 from LoanMVP.services.attom_provider import fetch_attom_data
-
-_CACHE = {}
-_TTL = 60 * 60 * 6  # 6 hours
+from LoanMVP.services.property_cache import get_cached_property, set_cached_property
+from LoanMVP.services.property_service import (
+    _attom_get,
+    _calculate_market_snapshot,
+    _extract_attom_properties,
+    _normalize_attom_subject,
+)
 
 
 def resolve_property_unified(address: str, *, beds=None, baths=None, sqft=None, property_type=None) -> dict:
@@ -133,6 +140,35 @@ def resolve_property_unified(address: str, *, beds=None, baths=None, sqft=None,
         }
 
 
+def _property_cache_enabled() -> bool:
+    try:
+        return bool(current_app.config.get("ENABLE_PROPERTY_CACHE", True))
+    except RuntimeError:
+        return True
+
+
+def resolve_property_unified_cached(address: str) -> dict:
+    """
+    resolve_property_unified() behind the short-lived property cache.
+
+    Investors routinely hit Save and then Save & Analyze on the same address,
+    so repeat lookups are served from memory instead of the provider API.
+    Only successful resolves are cached, and callers always get their own
+    copy so they can mutate the result freely.
+    """
+    if not _property_cache_enabled():
+        return resolve_property_unified(address)
+
+    cached = get_cached_property(address)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    resolved = resolve_property_unified(address)
+    if resolved.get("status") == "ok":
+        set_cached_property(address, copy.deepcopy(resolved))
+    return resolved
+
+
 def resolve_property(address, city, state):
     # 1. RentCast (valuation, rent, comps)
     rentcast = fetch_rentcast_data(address, city, state)
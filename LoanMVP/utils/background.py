@@ -0,0 +1,32 @@
+import logging
+
+from flask import current_app
+
+from LoanMVP.extensions import db
+
+logger = logging.getLogger(__name__)
+
+
+def run_in_background(fn, *args):
+    """
+    Run ``fn(*args)`` after the response on the Socket.IO background worker
+    (a thread or greenlet, depending on the async mode), inside an app
+    context. Falls back to running inline when Socket.IO isn't attached.
+    """
+    app = current_app._get_current_object()
+
+    def runner():
+        with app.app_context():
+            try:
+                fn(*args)
+            except Exception:
+                db.session.rollback()
+                logger.exception("Background task %s failed", getattr(fn, "__name__", fn))
+            finally:
+                db.session.remove()
+
+    socketio = getattr(app, "socketio", None)
+    if socketio is None:
+        runner()
+    else:
+        socketio.start_background_task(runner)
@@ -0,0 +1,37 @@
+import csv
+import io
+
+from flask import Response, stream_with_context
+
+CSV_FLUSH_BYTES = 64 * 1024
+
+
+def iter_csv(header, rows, flush_bytes=CSV_FLUSH_BYTES):
+    """
+    Yield ``header`` and ``rows`` as CSV text in chunks of roughly
+    ``flush_bytes``, so an export never holds the whole file in memory.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush():
+        data = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return data
+
+    writer.writerow(header)
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= flush_bytes:
+            yield flush()
+    yield flush()
+
+
+def csv_download(filename, header, rows):
+    """Stream ``rows`` to the client as an attached CSV file."""
+    return Response(
+        stream_with_context(iter_csv(header, rows)),
+        mimetype="text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
@@ -92,6 +92,26 @@ def admin_role_label(role: str) -> str:
 def role_required(*roles):
     roles = {normalize_role(r) for r in roles}
 
+    # The allowed set only depends on the decorator arguments, so expand the
+    # role groups once when the view is decorated rather than on every request.
+    expanded_roles = set()
+    for role in roles:
+        if role == "admin_group":
+            expanded_roles.update(ADMIN_ROLES)
+        elif role == "staff_group":
+            expanded_roles.update(STAFF_ROLES)
+        elif role == "partner_group":
+            expanded_roles.update(PARTNER_ROLES)
+        else:
+            expanded_roles.add(role)
+    expanded_roles = frozenset(expanded_roles)
+
+    allows_full_loan_officer = (
+        "partner_group" in roles
+        or "loan_officer" in roles
+        or bool(expanded_roles & PARTNER_ROLES)
+    )
+
     def decorator(fn):
         @wraps(fn)
         def decorated_view(*args, **kwargs):
@@ -104,23 +124,8 @@ def role_required(*roles):
             if user_role in {"platform_admin", "master_admin", "executive"}:
                 return fn(*args, **kwargs)
 
-            expanded_roles = set()
-            for role in roles:
-                if role == "admin_group":
-                    expanded_roles.update(ADMIN_ROLES)
-                elif role == "staff_group":
-                    expanded_roles.update(STAFF_ROLES)
-                elif role == "partner_group":
-                    expanded_roles.update(PARTNER_ROLES)
-                else:
-                    expanded_roles.add(role)
-
             if user_role not in expanded_roles:
-                if has_full_loan_officer_access(current_user) and (
-                    "partner_group" in roles
-                    or "loan_officer" in roles
-                    or bool(expanded_roles & PARTNER_ROLES)
-                ):
+                if allows_full_loan_officer and has_full_loan_officer_access(current_user):
                     return fn(*args, **kwargs)
 
                 flash("Your account doesn’t have access to that page yet.", "warning")
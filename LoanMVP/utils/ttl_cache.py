@@ -0,0 +1,58 @@
+import time
+
+
+class TTLCache:
+    """
+    Small in-process cache whose entries expire ``ttl`` seconds after they are
+    written. When ``max_entries`` is set, writing past the limit evicts the
+    oldest write. Expired entries are kept for a further ``stale_ttl`` seconds
+    (or until overwritten, when ``stale_ttl`` is None) so callers can fall
+    back to the last good value with ``get(key, allow_stale=True)``.
+    """
+
+    def __init__(self, ttl, max_entries=None, stale_ttl=0):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stale_ttl = stale_ttl
+        self._entries = {}
+
+    def get(self, key, default=None, allow_stale=False):
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        now = time.time()
+        if now > entry["expires_at"]:
+            stale_until = entry["stale_until"]
+            if stale_until is not None and now > stale_until:
+                self._entries.pop(key, None)
+                return default
+            if not allow_stale:
+                return default
+        return entry["value"]
+
+    def set(self, key, value, ttl=None):
+        self._entries.pop(key, None)
+        if self.max_entries and len(self._entries) >= self.max_entries:
+            # dicts keep insertion order, so the first key is the oldest write
+            self._entries.pop(next(iter(self._entries)), None)
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = {
+            "value": value,
+            "expires_at": expires_at,
+            "stale_until": None if self.stale_ttl is None else expires_at + self.stale_ttl,
+        }
+
+    def expire(self, key):
+        """Mark ``key`` expired now; it stays readable as a stale value."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry["expires_at"] = time.time() - 1
+
+    def pop(self, key):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
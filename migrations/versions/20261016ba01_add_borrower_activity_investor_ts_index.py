@@ -0,0 +1,64 @@
+"""Add (investor_profile_id, timestamp DESC) index on borrower_activity
+
+Revision ID: 20261016ba01
+Revises: 20261016ld01
+Create Date: 2026-10-16 14:00:00.000000
+
+The investor activity page now reads one page of an investor's activity,
+newest first, with LIMIT/OFFSET. This index matches that filter and sort
+order, so Postgres can stop after the page instead of sorting the
+investor's whole history. Built CONCURRENTLY on Postgres so the deploy
+doesn't lock borrower_activity against writes.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261016ba01"
+down_revision = "20261016ld01"
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = "ix_borrower_activity_investor_ts"
+
+
+def _insp():
+    return sa.inspect(op.get_bind())
+
+
+def _has_index(table, index_name):
+    try:
+        return any(ix["name"] == index_name for ix in _insp().get_indexes(table))
+    except Exception:
+        return False
+
+
+def upgrade():
+    if _has_index("borrower_activity", INDEX_NAME):
+        return
+
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+                "ON borrower_activity (investor_profile_id, \"timestamp\" DESC)"
+            )
+    else:
+        op.create_index(
+            INDEX_NAME,
+            "borrower_activity",
+            ["investor_profile_id", sa.text("\"timestamp\" DESC")],
+        )
+
+
+def downgrade():
+    if not _has_index("borrower_activity", INDEX_NAME):
+        return
+
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
+    else:
+        op.drop_index(INDEX_NAME, table_name="borrower_activity")
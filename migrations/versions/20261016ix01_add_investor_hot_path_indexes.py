@@ -0,0 +1,85 @@
+"""Add composite indexes for the investor portal's hot filters
+
+Revision ID: 20261016ix01
+Revises: 20261016ba01
+Create Date: 2026-10-16 15:00:00.000000
+
+Investor views filter these tables by investor_profile_id, or by user_id for
+payments, plus a second column or sort key:
+
+- loan_application (investor_profile_id, is_active): the active capital request
+- underwriting_condition (investor_profile_id, loan_id): conditions on that loan
+- payment_record (user_id, timestamp DESC): billing history, newest first
+- esigned_document (investor_profile_id): the e-sign list
+- saved_properties (investor_profile_id, created_at DESC): latest saved property
+
+Without them, Postgres seq-scans as the tables grow. Built CONCURRENTLY on
+Postgres so the deploy doesn't lock writes.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261016ix01"
+down_revision = "20261016ba01"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = (
+    ("ix_loan_application_investor_active", "loan_application", ("investor_profile_id", "is_active")),
+    ("ix_underwriting_condition_investor_loan", "underwriting_condition", ("investor_profile_id", "loan_id")),
+    ("ix_payment_record_user_ts", "payment_record", ("user_id", "\"timestamp\" DESC")),
+    ("ix_esigned_document_investor", "esigned_document", ("investor_profile_id",)),
+    ("ix_saved_properties_investor_created", "saved_properties", ("investor_profile_id", "created_at DESC")),
+)
+
+
+def _insp():
+    return sa.inspect(op.get_bind())
+
+
+def _has_table(table):
+    try:
+        return _insp().has_table(table)
+    except Exception:
+        return False
+
+
+def _has_index(table, index_name):
+    try:
+        return any(ix["name"] == index_name for ix in _insp().get_indexes(table))
+    except Exception:
+        return False
+
+
+def upgrade():
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+
+    for index_name, table, columns in INDEXES:
+        if not _has_table(table) or _has_index(table, index_name):
+            continue
+
+        if is_postgres:
+            with op.get_context().autocommit_block():
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+                    f"ON {table} ({', '.join(columns)})"
+                )
+        else:
+            op.create_index(index_name, table, [sa.text(column) for column in columns])
+
+
+def downgrade():
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+
+    for index_name, table, _columns in reversed(INDEXES):
+        if not _has_table(table) or not _has_index(table, index_name):
+            continue
+
+        if is_postgres:
+            with op.get_context().autocommit_block():
+                op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+        else:
+            op.drop_index(index_name, table_name=table)
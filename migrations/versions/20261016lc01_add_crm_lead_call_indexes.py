@@ -0,0 +1,80 @@
+"""Add CRM lead and call log indexes
+
+Revision ID: 20261016lc01
+Revises: 20261016lt01
+Create Date: 2026-10-16 18:30:00.000000
+
+CRM dashboards filter leads by assigned officer or status and list them
+newest first, and call lists are per user, newest first:
+
+- lead (assigned_officer_id, created_at DESC)
+- lead (status, created_at DESC)
+- call_log (user_id, created_at DESC)
+
+Built CONCURRENTLY on Postgres so the deploy doesn't lock writes.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261016lc01"
+down_revision = "20261016lt01"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = (
+    ("ix_lead_officer_created", "lead", ("assigned_officer_id", "created_at DESC")),
+    ("ix_lead_status_created", "lead", ("status", "created_at DESC")),
+    ("ix_call_log_user_created", "call_log", ("user_id", "created_at DESC")),
+)
+
+
+def _insp():
+    return sa.inspect(op.get_bind())
+
+
+def _has_table(table):
+    try:
+        return _insp().has_table(table)
+    except Exception:
+        return False
+
+
+def _has_index(table, index_name):
+    try:
+        return any(ix["name"] == index_name for ix in _insp().get_indexes(table))
+    except Exception:
+        return False
+
+
+def upgrade():
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+
+    for index_name, table, columns in INDEXES:
+        if not _has_table(table) or _has_index(table, index_name):
+            continue
+
+        if is_postgres:
+            with op.get_context().autocommit_block():
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+                    f"ON {table} ({', '.join(columns)})"
+                )
+        else:
+            op.create_index(index_name, table, [sa.text(column) for column in columns])
+
+
+def downgrade():
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+
+    for index_name, table, _columns in reversed(INDEXES):
+        if not _has_table(table) or not _has_index(table, index_name):
+            continue
+
+        if is_postgres:
+            with op.get_context().autocommit_block():
+                op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+        else:
+            op.drop_index(index_name, table_name=table)
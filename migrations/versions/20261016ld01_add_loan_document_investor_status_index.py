@@ -0,0 +1,59 @@
+"""Add (investor_profile_id, status) index on loan_document
+
+Revision ID: 20261016ld01
+Revises: 20261016sp04
+Create Date: 2026-10-16 13:00:00.000000
+
+The investor analysis page counts an investor's documents per status with
+one ``GROUP BY status`` over ``investor_profile_id = :id``. A composite index
+lets Postgres answer that from a single index range scan. Built CONCURRENTLY
+on Postgres so the deploy doesn't lock loan_document against writes.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261016ld01"
+down_revision = "20261016sp04"
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = "ix_loan_document_investor_status"
+
+
+def _insp():
+    return sa.inspect(op.get_bind())
+
+
+def _has_index(table, index_name):
+    try:
+        return any(ix["name"] == index_name for ix in _insp().get_indexes(table))
+    except Exception:
+        return False
+
+
+def upgrade():
+    if _has_index("loan_document", INDEX_NAME):
+        return
+
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+                "ON loan_document (investor_profile_id, status)"
+            )
+    else:
+        op.create_index(INDEX_NAME, "loan_document", ["investor_profile_id", "status"])
+
+
+def downgrade():
+    if not _has_index("loan_document", INDEX_NAME):
+        return
+
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
+    else:
+        op.drop_index(INDEX_NAME, table_name="loan_document")
@@ -0,0 +1,73 @@
+"""Add trigram GIN index on lead.name
+
+Revision ID: 20261016lt01
+Revises: 20261016ix01
+Create Date: 2026-10-16 18:00:00.000000
+
+The CRM lead engine searches lead names with ILIKE '%term%'. A leading
+wildcard can't use a btree index, so on Postgres this adds a pg_trgm GIN
+index that serves substring matches. Other dialects keep the plain scan.
+Built CONCURRENTLY so the deploy doesn't lock the lead table. Kept out of
+the Lead model because it depends on the pg_trgm extension.
+
+Creating an extension needs elevated privileges that managed Postgres app
+roles usually lack, so this migration doesn't try. If pg_trgm isn't
+installed the index is skipped with a notice; an operator can run
+``CREATE EXTENSION pg_trgm`` and then create the index by hand (or downgrade
+and re-upgrade this revision).
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261016lt01"
+down_revision = "20261016ix01"
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = "ix_lead_name_trgm"
+
+
+def _insp():
+    return sa.inspect(op.get_bind())
+
+
+def _has_index(table, index_name):
+    try:
+        return any(ix["name"] == index_name for ix in _insp().get_indexes(table))
+    except Exception:
+        return False
+
+
+def _has_pg_trgm():
+    return op.get_bind().execute(
+        sa.text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+    ).first() is not None
+
+
+def upgrade():
+    if op.get_bind().dialect.name != "postgresql" or _has_index("lead", INDEX_NAME):
+        return
+
+    if not _has_pg_trgm():
+        print(
+            f"[{revision}] pg_trgm extension is not installed; skipping {INDEX_NAME}. "
+            "Lead name search still works, without the trigram index."
+        )
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+            "ON lead USING gin (name gin_trgm_ops)"
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql" or not _has_index("lead", INDEX_NAME):
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
@@ -0,0 +1,91 @@
+"""Add profile + created_at indexes for the borrower and capital dashboards
+
+Revision ID: 20261016pc01
+Revises: 20261016lc01
+Create Date: 2026-10-16 20:00:00.000000
+
+The borrower dashboard and the investor command center list a profile's
+rows newest first, and the borrower dashboard loads the conditions on its
+active loan:
+
+- loan_application (borrower_profile_id, created_at DESC)
+- loan_application (investor_profile_id, created_at DESC)
+- loan_document (borrower_profile_id, created_at DESC)
+- underwriting_condition (borrower_profile_id, loan_id, created_at DESC)
+
+With the sort key in the index, Postgres returns these rows already in
+order instead of sorting them. The investor side's (investor_profile_id,
+is_active) and (investor_profile_id, loan_id) indexes already exist
+(20261016ix01). Built CONCURRENTLY on Postgres so the deploy doesn't lock
+writes.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261016pc01"
+down_revision = "20261016lc01"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = (
+    ("ix_loan_application_borrower_created", "loan_application", ("borrower_profile_id", "created_at DESC")),
+    ("ix_loan_application_investor_created", "loan_application", ("investor_profile_id", "created_at DESC")),
+    ("ix_loan_document_borrower_created", "loan_document", ("borrower_profile_id", "created_at DESC")),
+    (
+        "ix_underwriting_condition_borrower_loan_created",
+        "underwriting_condition",
+        ("borrower_profile_id", "loan_id", "created_at DESC"),
+    ),
+)
+
+
+def _insp():
+    return sa.inspect(op.get_bind())
+
+
+def _has_table(table):
+    try:
+        return _insp().has_table(table)
+    except Exception:
+        return False
+
+
+def _has_index(table, index_name):
+    try:
+        return any(ix["name"] == index_name for ix in _insp().get_indexes(table))
+    except Exception:
+        return False
+
+
+def upgrade():
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+
+    for index_name, table, columns in INDEXES:
+        if not _has_table(table) or _has_index(table, index_name):
+            continue
+
+        if is_postgres:
+            with op.get_context().autocommit_block():
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+                    f"ON {table} ({', '.join(columns)})"
+                )
+        else:
+            op.create_index(index_name, table, [sa.text(column) for column in columns])
+
+
+def downgrade():
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+
+    for index_name, table, _columns in reversed(INDEXES):
+        if not _has_table(table) or not _has_index(table, index_name):
+            continue
+
+        if is_postgres:
+            with op.get_context().autocommit_block():
+                op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+        else:
+            op.drop_index(index_name, table_name=table)
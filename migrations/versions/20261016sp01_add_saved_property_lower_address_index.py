@@ -0,0 +1,67 @@
+"""Add functional (investor_profile_id, lower(address)) index on saved_properties
+
+Revision ID: 20261016sp01
+Revises: 20260714nt01
+Create Date: 2026-10-16 09:00:00.000000
+
+property_search, save_property, save_property_and_analyze and the
+property-tool save endpoints all dedupe with
+``investor_profile_id = :id AND lower(address) = :addr``. A plain index on
+address can't serve a LOWER() predicate, so Postgres fell back to scanning
+the investor's whole saved inventory on every request. The composite
+functional index mirrors the WHERE clause column order so both predicates
+are satisfied from the index. Built CONCURRENTLY on Postgres so the deploy
+doesn't take a write lock on saved_properties.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261016sp01"
+down_revision = "20260714nt01"
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = "ix_saved_properties_investor_lower_address"
+
+
+def _insp():
+    return sa.inspect(op.get_bind())
+
+
+def _has_index(table, index_name):
+    try:
+        return any(ix["name"] == index_name for ix in _insp().get_indexes(table))
+    except Exception:
+        return False
+
+
+def upgrade():
+    if _has_index("saved_properties", INDEX_NAME):
+        return
+
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+                "ON saved_properties (investor_profile_id, lower(address))"
+            )
+    else:
+        op.create_index(
+            INDEX_NAME,
+            "saved_properties",
+            ["investor_profile_id", sa.text("lower(address)")],
+        )
+
+
+def downgrade():
+    if not _has_index("saved_properties", INDEX_NAME):
+        return
+
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
+    else:
+        op.drop_index(INDEX_NAME, table_name="saved_properties")
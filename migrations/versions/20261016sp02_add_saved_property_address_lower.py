@@ -0,0 +1,107 @@
+"""Add generated address_lower column to saved_properties
+
+Revision ID: 20261016sp02
+Revises: 20261016sp01
+Create Date: 2026-10-16 10:00:00.000000
+
+Stores lower(address) once as a STORED generated column and indexes
+(investor_profile_id, address_lower), so the saved-property duplicate
+checks become a plain equality btree probe instead of applying LOWER()
+to the indexed side. Supersedes the functional index added in
+20261016sp01, which is dropped here to avoid double index maintenance on
+every insert.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261016sp02"
+down_revision = "20261016sp01"
+branch_labels = None
+depends_on = None
+
+
+OLD_INDEX_NAME = "ix_saved_properties_investor_lower_address"
+INDEX_NAME = "ix_saved_properties_investor_address_lower"
+
+
+def _insp():
+    return sa.inspect(op.get_bind())
+
+
+def _has_column(table, column):
+    try:
+        return any(c["name"] == column for c in _insp().get_columns(table))
+    except Exception:
+        return False
+
+
+def _has_index(table, index_name):
+    try:
+        return any(ix["name"] == index_name for ix in _insp().get_indexes(table))
+    except Exception:
+        return False
+
+
+def _is_postgres():
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade():
+    if not _has_column("saved_properties", "address_lower"):
+        if _is_postgres():
+            op.execute(
+                "ALTER TABLE saved_properties ADD COLUMN IF NOT EXISTS address_lower "
+                "VARCHAR(255) GENERATED ALWAYS AS (lower(address)) STORED"
+            )
+        else:
+            # SQLite can't ALTER TABLE ADD a STORED generated column, so
+            # force a batch table rebuild.
+            with op.batch_alter_table("saved_properties", recreate="always") as batch_op:
+                batch_op.add_column(
+                    sa.Column(
+                        "address_lower",
+                        sa.String(length=255),
+                        sa.Computed("lower(address)", persisted=True),
+                    )
+                )
+
+    if not _has_index("saved_properties", INDEX_NAME):
+        if _is_postgres():
+            with op.get_context().autocommit_block():
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+                    "ON saved_properties (investor_profile_id, address_lower)"
+                )
+        else:
+            op.create_index(INDEX_NAME, "saved_properties", ["investor_profile_id", "address_lower"])
+
+    if _has_index("saved_properties", OLD_INDEX_NAME):
+        if _is_postgres():
+            with op.get_context().autocommit_block():
+                op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {OLD_INDEX_NAME}")
+        else:
+            op.drop_index(OLD_INDEX_NAME, table_name="saved_properties")
+
+
+def downgrade():
+    if not _has_index("saved_properties", OLD_INDEX_NAME):
+        if _is_postgres():
+            op.execute(
+                f"CREATE INDEX IF NOT EXISTS {OLD_INDEX_NAME} "
+                "ON saved_properties (investor_profile_id, lower(address))"
+            )
+        else:
+            op.create_index(
+                OLD_INDEX_NAME,
+                "saved_properties",
+                ["investor_profile_id", sa.text("lower(address)")],
+            )
+
+    if _has_index("saved_properties", INDEX_NAME):
+        op.drop_index(INDEX_NAME, table_name="saved_properties")
+
+    if _has_column("saved_properties", "address_lower"):
+        with op.batch_alter_table("saved_properties") as batch_op:
+            batch_op.drop_column("address_lower")
@@ -0,0 +1,61 @@
+"""Squash whitespace in saved_properties.address
+
+Revision ID: 20261016sp02b
+Revises: 20261016sp02
+Create Date: 2026-10-16 10:30:00.000000
+
+Saved-property lookups now key on the canonical address (trimmed, runs of
+whitespace collapsed to one space), but rows saved before that still carry
+doubled spaces, so their address_lower never equals the canonical key and
+the ON CONFLICT arbiter added in 20261016sp03 can't see them. Rewrite the
+stored addresses to the squashed form first; address_lower is a generated
+column and follows along.
+
+Data-only; downgrade leaves the squashed addresses in place.
+"""
+
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261016sp02b"
+down_revision = "20261016sp02"
+branch_labels = None
+depends_on = None
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _is_postgres():
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade():
+    if _is_postgres():
+        op.execute(
+            "UPDATE saved_properties "
+            "SET address = regexp_replace(btrim(address), '\\s+', ' ', 'g') "
+            "WHERE address IS NOT NULL "
+            "AND address <> regexp_replace(btrim(address), '\\s+', ' ', 'g')"
+        )
+        return
+
+    # SQLite has no regexp_replace, so squash the few dev rows in Python.
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(
+        "SELECT id, address FROM saved_properties WHERE address IS NOT NULL"
+    )).fetchall()
+    for saved_id, address in rows:
+        squashed = _WHITESPACE_RE.sub(" ", address.strip())
+        if squashed != address:
+            bind.execute(
+                sa.text("UPDATE saved_properties SET address = :address WHERE id = :id"),
+                {"address": squashed, "id": saved_id},
+            )
+
+
+def downgrade():
+    pass
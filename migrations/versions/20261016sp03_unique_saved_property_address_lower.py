@@ -0,0 +1,135 @@
+"""Make (investor_profile_id, address_lower) unique on saved_properties
+
+Revision ID: 20261016sp03
+Revises: 20261016sp02b
+Create Date: 2026-10-16 11:00:00.000000
+
+save_property and save_property_and_analyze now upsert with
+INSERT ... ON CONFLICT (investor_profile_id, address_lower) DO UPDATE,
+which needs a unique index as its arbiter. The routes already treated
+one address per investor as the dedup rule, so the unique index replaces
+the plain lookup index from 20261016sp02.
+
+Any duplicate rows already in the table are merged first: the oldest row
+(MIN(id)) per (investor_profile_id, address_lower) is kept, references
+from deals, renovation mockups and partner requests are repointed to it,
+and the rest are deleted. On Postgres the unique index is built
+CONCURRENTLY so the release-time upgrade doesn't block saves.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261016sp03"
+down_revision = "20261016sp02b"
+branch_labels = None
+depends_on = None
+
+
+OLD_INDEX_NAME = "ix_saved_properties_investor_address_lower"
+INDEX_NAME = "uq_saved_properties_investor_address_lower"
+
+
+def _insp():
+    return sa.inspect(op.get_bind())
+
+
+def _has_index(table, index_name):
+    try:
+        return any(ix["name"] == index_name for ix in _insp().get_indexes(table))
+    except Exception:
+        return False
+
+
+# Tables whose saved_property_id points at saved_properties.id.
+REFERENCING_TABLES = (
+    "deals",
+    "renovation_mockup",
+    "partner_connection_requests",
+    "partner_requests",
+)
+
+
+def _has_column(table, column):
+    try:
+        return any(c["name"] == column for c in _insp().get_columns(table))
+    except Exception:
+        return False
+
+
+def _is_postgres():
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def _duplicate_ids():
+    """Map each duplicate saved_properties.id to the id being kept."""
+    rows = op.get_bind().execute(sa.text(
+        "SELECT s.id, k.keep_id FROM saved_properties s "
+        "JOIN ("
+        "  SELECT investor_profile_id, address_lower, MIN(id) AS keep_id "
+        "  FROM saved_properties "
+        "  WHERE investor_profile_id IS NOT NULL AND address_lower IS NOT NULL "
+        "  GROUP BY investor_profile_id, address_lower "
+        "  HAVING COUNT(*) > 1"
+        ") k ON k.investor_profile_id = s.investor_profile_id "
+        "AND k.address_lower = s.address_lower "
+        "WHERE s.id <> k.keep_id"
+    )).fetchall()
+    return {dup_id: keep_id for dup_id, keep_id in rows}
+
+
+def _dedupe():
+    duplicates = _duplicate_ids()
+    if not duplicates:
+        return
+
+    bind = op.get_bind()
+    params = [{"dup_id": dup_id, "keep_id": keep_id} for dup_id, keep_id in duplicates.items()]
+    for table in REFERENCING_TABLES:
+        if _has_column(table, "saved_property_id"):
+            bind.execute(
+                sa.text(f"UPDATE {table} SET saved_property_id = :keep_id WHERE saved_property_id = :dup_id"),
+                params,
+            )
+    bind.execute(
+        sa.text("DELETE FROM saved_properties WHERE id = :dup_id"),
+        [{"dup_id": dup_id} for dup_id in duplicates],
+    )
+    print(f"[{revision}] merged {len(duplicates)} duplicate saved_properties rows")
+
+
+def upgrade():
+    if _has_index("saved_properties", INDEX_NAME):
+        return
+
+    _dedupe()
+
+    if _is_postgres():
+        with op.get_context().autocommit_block():
+            op.execute(
+                f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+                "ON saved_properties (investor_profile_id, address_lower)"
+            )
+    else:
+        op.create_index(
+            INDEX_NAME,
+            "saved_properties",
+            ["investor_profile_id", "address_lower"],
+            unique=True,
+        )
+
+    if _has_index("saved_properties", OLD_INDEX_NAME):
+        if _is_postgres():
+            with op.get_context().autocommit_block():
+                op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {OLD_INDEX_NAME}")
+        else:
+            op.drop_index(OLD_INDEX_NAME, table_name="saved_properties")
+
+
+def downgrade():
+    if not _has_index("saved_properties", OLD_INDEX_NAME):
+        op.create_index(OLD_INDEX_NAME, "saved_properties", ["investor_profile_id", "address_lower"])
+
+    if _has_index("saved_properties", INDEX_NAME):
+        op.drop_index(INDEX_NAME, table_name="saved_properties")
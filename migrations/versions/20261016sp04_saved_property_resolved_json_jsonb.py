@@ -0,0 +1,43 @@
+"""Store saved_properties.resolved_json as JSONB
+
+Revision ID: 20261016sp04
+Revises: 20261016sp03
+Create Date: 2026-10-16 12:00:00.000000
+
+resolved_json held the unified-resolver payload as TEXT written with
+json.dumps() on every save. As JSONB the save paths assign the dict
+directly (psycopg2 adapts it), storage is binary and the payload can be
+indexed or queried later. Existing rows were always written by
+json.dumps(), so a straight cast is safe; blank strings become NULL.
+Non-Postgres databases keep their existing column, which SQLAlchemy's
+JSON type reads and writes as text.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261016sp04"
+down_revision = "20261016sp03"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        "ALTER TABLE saved_properties ALTER COLUMN resolved_json TYPE JSONB "
+        "USING CASE WHEN btrim(resolved_json) = '' THEN NULL ELSE resolved_json::jsonb END"
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        "ALTER TABLE saved_properties ALTER COLUMN resolved_json TYPE TEXT "
+        "USING resolved_json::text"
+    )
@@ -0,0 +1,95 @@
+"""AIAssistant.cached_reply() (base_ai.py) answers repeated prompts from the
+reply cache, collapses concurrent misses for one prompt into a single
+OpenAI call, and falls back to the last good reply when a refresh fails.
+"""
+import threading
+import time
+
+import pytest
+
+from LoanMVP.ai import base_ai
+from LoanMVP.ai.base_ai import AI_ERROR_REPLY, AIAssistant
+
+
+@pytest.fixture(autouse=True)
+def _empty_reply_cache():
+    base_ai._reply_cache.clear()
+    yield
+    base_ai._reply_cache.clear()
+
+
+def _assistant(monkeypatch, replies):
+    """An assistant whose generate_reply returns ``replies`` in order."""
+    calls = []
+    replies = iter(replies)
+
+    def fake_generate_reply(message, role="general"):
+        calls.append((message, role))
+        return next(replies)
+
+    assistant = AIAssistant()
+    monkeypatch.setattr(assistant, "generate_reply", fake_generate_reply)
+    return assistant, calls
+
+
+def test_repeated_prompt_is_served_from_cache(monkeypatch):
+    assistant, calls = _assistant(monkeypatch, ["first"])
+
+    assert assistant.cached_reply("Summarize 3 loans.", "investor") == "first"
+    assert assistant.cached_reply("Summarize   3 loans.", "investor") == "first"
+    assert len(calls) == 1
+
+
+def test_roles_are_cached_separately(monkeypatch):
+    assistant, calls = _assistant(monkeypatch, ["investor reply", "borrower reply"])
+
+    assert assistant.cached_reply("Same prompt", "investor") == "investor reply"
+    assert assistant.cached_reply("Same prompt", "borrower") == "borrower reply"
+    assert len(calls) == 2
+
+
+def test_errors_are_not_cached_and_fall_back_to_stale_reply(monkeypatch):
+    assistant, calls = _assistant(monkeypatch, ["good", AI_ERROR_REPLY, "fresh"])
+
+    assert assistant.cached_reply("Prompt", "investor", ttl=60) == "good"
+    key = base_ai._reply_cache_key("Prompt", "investor")
+    base_ai._reply_cache.expire(key)  # expired, still within the stale window
+
+    assert assistant.cached_reply("Prompt", "investor") == "good"
+    assert assistant.cached_reply("Prompt", "investor") == "fresh"
+    assert len(calls) == 3
+
+
+def test_error_without_a_previous_reply_is_returned(monkeypatch):
+    assistant, _calls = _assistant(monkeypatch, [AI_ERROR_REPLY])
+
+    assert assistant.cached_reply("Prompt", "investor") == AI_ERROR_REPLY
+    assert base_ai._reply_cache.get(base_ai._reply_cache_key("Prompt", "investor")) is None
+
+
+def test_concurrent_misses_make_a_single_call(monkeypatch):
+    calls = []
+    release = threading.Event()
+
+    def slow_generate_reply(message, role="general"):
+        calls.append(message)
+        release.wait(timeout=5)
+        return "shared"
+
+    assistant = AIAssistant()
+    monkeypatch.setattr(assistant, "generate_reply", slow_generate_reply)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(assistant.cached_reply("Prompt", "investor")))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.2)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == ["shared"] * 5
+    assert len(calls) == 1
@@ -0,0 +1,68 @@
+"""AIAssistant's outbound throttling (base_ai.py): the request-rate token
+bucket makes callers wait locally once its burst is spent, and the
+concurrency semaphore caps how many OpenAI calls are in flight at once.
+"""
+import threading
+import time
+from types import SimpleNamespace
+
+from LoanMVP.ai import base_ai
+from LoanMVP.ai.base_ai import AIAssistant
+
+
+def test_rate_limiter_allows_a_burst_then_paces_callers(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(base_ai.time, "monotonic", lambda: 1000.0)
+    monkeypatch.setattr(base_ai.time, "sleep", sleeps.append)
+
+    limiter = base_ai._RequestRateLimiter(60)  # one request per second
+    for _ in range(60):
+        limiter.acquire()
+    assert sleeps == []
+
+    limiter.acquire()
+    limiter.acquire()
+    assert sleeps == [1.0, 2.0]
+
+
+def test_rate_limiter_refills_over_time(monkeypatch):
+    clock = [1000.0]
+    sleeps = []
+    monkeypatch.setattr(base_ai.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(base_ai.time, "sleep", sleeps.append)
+
+    limiter = base_ai._RequestRateLimiter(60)
+    for _ in range(60):
+        limiter.acquire()
+    clock[0] += 5  # five tokens back
+
+    for _ in range(5):
+        limiter.acquire()
+    assert sleeps == []
+
+
+def test_concurrent_generate_reply_calls_are_capped(monkeypatch):
+    in_flight = 0
+    peak = 0
+    guard = threading.Lock()
+
+    def create(**kwargs):
+        nonlocal in_flight, peak
+        with guard:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with guard:
+            in_flight -= 1
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))])
+
+    fake_client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(base_ai, "_client", fake_client)
+    monkeypatch.setattr(base_ai, "_llm_slots", threading.BoundedSemaphore(2))
+    monkeypatch.setattr(base_ai, "_llm_rate_limiter", base_ai._RequestRateLimiter(10_000))
+
+    assistant = AIAssistant()
+    replies = assistant.generate_replies([(f"Prompt {i}", "general") for i in range(6)])
+
+    assert replies == ["ok"] * 6
+    assert peak == 2
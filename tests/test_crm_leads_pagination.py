@@ -0,0 +1,55 @@
+"""/crm/leads pages the user's leads newest first, LEADS_PAGE_SIZE at a
+time, with prev/next links to the rest of the list.
+"""
+from datetime import datetime, timedelta
+
+from LoanMVP.models.admin import Company
+from LoanMVP.models.crm_models import Lead
+from LoanMVP.models.user_model import User
+from LoanMVP.routes import crm_comm_routes
+
+from tests.conftest import login_as
+
+
+def _make_crm_user_with_leads(db_session, count):
+    company = Company(name="Leads Co", is_active=True)
+    db_session.add(company)
+    db_session.commit()
+
+    user = User(email="crm-pager@example.com", role="crm", is_active=True, company_id=company.id)
+    db_session.add(user)
+    db_session.commit()
+
+    start = datetime(2026, 1, 1)
+    db_session.add_all([
+        Lead(name=f"Lead {i:02d}", assigned_to=user.id, created_at=start + timedelta(minutes=i))
+        for i in range(count)
+    ])
+    db_session.commit()
+    return user
+
+
+def test_leads_page_one_shows_newest_and_links_to_next(db_session, client, monkeypatch):
+    monkeypatch.setattr(crm_comm_routes, "LEADS_PAGE_SIZE", 2)
+    user = _make_crm_user_with_leads(db_session, 5)
+    login_as(client, user)
+
+    resp = client.get("/crm/leads")
+
+    assert resp.status_code == 200
+    assert b"Lead 04" in resp.data
+    assert b"Lead 03" in resp.data
+    assert b"Lead 02" not in resp.data
+    assert b"Page 1 of 3" in resp.data
+    assert b"page=2" in resp.data
+
+
+def test_leads_out_of_range_page_is_empty_not_an_error(db_session, client, monkeypatch):
+    monkeypatch.setattr(crm_comm_routes, "LEADS_PAGE_SIZE", 2)
+    user = _make_crm_user_with_leads(db_session, 3)
+    login_as(client, user)
+
+    resp = client.get("/crm/leads?page=9")
+
+    assert resp.status_code == 200
+    assert b"Lead 00" not in resp.data
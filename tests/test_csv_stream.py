@@ -0,0 +1,20 @@
+"""iter_csv() (utils/csv_stream.py) streams a header plus rows as CSV text
+in bounded chunks that join back into the full file.
+"""
+from LoanMVP.utils.csv_stream import iter_csv
+
+
+def test_chunks_join_into_the_full_csv():
+    rows = ([i, f"name {i}"] for i in range(3))
+
+    assert "".join(iter_csv(["ID", "Name"], rows)) == "ID,Name\r\n0,name 0\r\n1,name 1\r\n2,name 2\r\n"
+
+
+def test_large_exports_are_flushed_in_several_chunks():
+    rows = ([i, "x" * 50] for i in range(100))
+
+    chunks = list(iter_csv(["ID", "Pad"], rows, flush_bytes=1024))
+
+    assert len(chunks) > 1
+    assert all(len(chunk) < 1024 + 100 for chunk in chunks)
+    assert "".join(chunks).count("\r\n") == 101
@@ -8,12 +8,24 @@ Jamaine still lands on his construction-only command center.
 """
 from datetime import date
 
+import pytest
+
 from LoanMVP.models.company_finance_models import CMFinanceEntry
 from LoanMVP.models.user_model import User
+from LoanMVP.routes.executive_new import clear_executive_stats_cache
 
 from tests.conftest import login_as
 
 
+@pytest.fixture(autouse=True)
+def _fresh_stats_cache():
+    # The overview counts are cached per company for a minute; each test
+    # builds its own data, so start every test from an empty cache.
+    clear_executive_stats_cache()
+    yield
+    clear_executive_stats_cache()
+
+
 def _make_executive(db_session, email="letoya@ravlohq.com"):
     user = User(email=email, role="executive", is_active=True)
     db_session.add(user)
@@ -78,3 +90,34 @@ def test_combined_pnl_sums_ravlo_and_construction_divisions(db_session, client):
     assert b"1,000" in resp.data
     assert b"5,000" in resp.data
     assert b"6,000" in resp.data
+
+
+def test_pnl_reflects_entries_added_after_a_cached_render(db_session, client):
+    exec_user = _make_executive(db_session)
+    login_as(client, exec_user)
+    assert client.get("/executive/dashboard").status_code == 200
+
+    db_session.add(CMFinanceEntry(
+        division="construction", entry_type="income", amount=7000, entry_date=date.today().replace(day=1),
+    ))
+    db_session.commit()
+
+    resp = client.get("/executive/dashboard")
+
+    assert b"7,000" in resp.data
+
+
+def test_cached_stats_serves_last_snapshot_when_recompute_fails(app):
+    from LoanMVP.routes import executive_new
+
+    def _fail():
+        raise RuntimeError("db down")
+
+    with app.app_context():
+        assert executive_new._cached_stats(("test", None), lambda: {"total_users": 3}) == {"total_users": 3}
+        executive_new._executive_stats_cache.expire(("test", None))
+
+        assert executive_new._cached_stats(("test", None), _fail) == {"total_users": 3}
+
+        with pytest.raises(RuntimeError):
+            executive_new._cached_stats(("other", None), _fail)
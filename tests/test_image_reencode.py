@@ -0,0 +1,32 @@
+"""to_png_bytes() / to_webp_bytes() (investor_media_helpers.py) hand back the
+original bytes when the source is already in the target format and mode,
+and only re-encode when a conversion is actually needed.
+"""
+from io import BytesIO
+
+from PIL import Image
+
+from LoanMVP.services.investor import investor_media_helpers as media
+
+
+def _encode(mode, fmt, **kwargs):
+    out = BytesIO()
+    Image.new(mode, (32, 32), "red").save(out, format=fmt, **kwargs)
+    return out.getvalue()
+
+
+def test_to_png_bytes_passes_rgba_png_through_unchanged():
+    raw = _encode("RGBA", "PNG")
+    assert media.to_png_bytes(raw) is raw
+
+
+def test_to_png_bytes_converts_jpeg_to_rgba_png():
+    png = media.to_png_bytes(_encode("RGB", "JPEG"))
+    img = Image.open(BytesIO(png))
+    assert (img.format, img.mode) == ("PNG", "RGBA")
+
+
+def test_to_webp_bytes_converts_rgba_png_to_rgb_webp():
+    webp = media.to_webp_bytes(_encode("RGBA", "PNG"))
+    img = Image.open(BytesIO(webp))
+    assert (img.format, img.mode) == ("WEBP", "RGB")
@@ -0,0 +1,88 @@
+"""The investor activity feed (/investor/activity) pages through the
+investor's BorrowerActivity rows newest first, and links to the older and
+newer pages instead of silently cutting the feed off.
+"""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from LoanMVP.models.activity_models import BorrowerActivity
+from LoanMVP.models.admin import Company
+from LoanMVP.models.investor_models import InvestorProfile
+from LoanMVP.models.loan_models import BorrowerProfile
+from LoanMVP.models.user_model import User
+from LoanMVP.routes import investor_routes
+
+from tests.conftest import login_as
+
+
+@pytest.fixture(autouse=True)
+def _stub_ai_summary(monkeypatch):
+    stub = SimpleNamespace(cached_reply=lambda *args, **kwargs: "Activity summary.")
+    monkeypatch.setattr(investor_routes, "assistant", stub)
+
+
+def _make_investor_with_activity(db_session, count):
+    company = Company(name="Activity Co", is_active=True, subscription_tier="team", max_users=10)
+    db_session.add(company)
+    db_session.commit()
+
+    user = User(email="activity-investor@example.com", role="investor", is_active=True, company_id=company.id)
+    db_session.add(user)
+    db_session.commit()
+
+    profile = InvestorProfile(user_id=user.id, full_name="Ivy Vestor")
+    borrower = BorrowerProfile(user_id=user.id, full_name="Ivy Vestor")
+    db_session.add_all([profile, borrower])
+    db_session.commit()
+
+    start = datetime(2026, 1, 1)
+    db_session.add_all([
+        BorrowerActivity(
+            borrower_profile_id=borrower.id,
+            investor_profile_id=profile.id,
+            action=f"Action {i:02d}",
+            timestamp=start + timedelta(minutes=i),
+        )
+        for i in range(count)
+    ])
+    db_session.commit()
+    return user
+
+
+def test_first_page_shows_newest_entries_and_an_older_link(db_session, client):
+    user = _make_investor_with_activity(db_session, 5)
+    login_as(client, user)
+
+    resp = client.get("/investor/activity?size=2")
+
+    assert resp.status_code == 200
+    assert b"Action 04" in resp.data
+    assert b"Action 03" in resp.data
+    assert b"Action 02" not in resp.data
+    assert b"Page 1 of 3" in resp.data
+    assert b"page=2" in resp.data
+
+
+def test_last_page_reaches_the_oldest_entry(db_session, client):
+    user = _make_investor_with_activity(db_session, 5)
+    login_as(client, user)
+
+    resp = client.get("/investor/activity?size=2&page=3")
+
+    assert resp.status_code == 200
+    assert b"Action 00" in resp.data
+    assert b"Action 01" not in resp.data
+    assert b"Page 3 of 3" in resp.data
+
+
+def test_single_page_has_no_pager(db_session, client):
+    user = _make_investor_with_activity(db_session, 3)
+    login_as(client, user)
+
+    resp = client.get("/investor/activity")
+
+    assert resp.status_code == 200
+    assert b"Action 00" in resp.data
+    assert b"Page 1 of" not in resp.data
@@ -0,0 +1,70 @@
+"""Investor e-sign (/investor/esign/sign/<id>): a submit without a drawn
+signature is rejected instead of being reported as received, and stamping
+a document that is already signed (a double submit) is a no-op.
+"""
+from LoanMVP.extensions import db
+from LoanMVP.models.admin import Company
+from LoanMVP.models.document_models import ESignedDocument, LoanDocument
+from LoanMVP.models.investor_models import InvestorProfile
+from LoanMVP.models.loan_models import BorrowerProfile, LoanApplication
+from LoanMVP.models.user_model import User
+from LoanMVP.routes import investor_routes
+
+from tests.conftest import login_as
+
+
+def _make_investor_with_doc(db_session, status="pending"):
+    company = Company(name="Sign Co", is_active=True, subscription_tier="team", max_users=10)
+    db_session.add(company)
+    db_session.commit()
+
+    user = User(email="signer@example.com", role="investor", is_active=True, company_id=company.id)
+    db_session.add(user)
+    db_session.commit()
+
+    profile = InvestorProfile(user_id=user.id, full_name="Ivy Vestor")
+    borrower = BorrowerProfile(user_id=user.id, full_name="Ivy Vestor")
+    db_session.add_all([profile, borrower])
+    db_session.commit()
+
+    loan = LoanApplication(company_id=company.id, borrower_profile_id=borrower.id, amount=250000)
+    db_session.add(loan)
+    db_session.commit()
+
+    doc = ESignedDocument(
+        borrower_profile_id=borrower.id,
+        investor_profile_id=profile.id,
+        loan_id=loan.id,
+        document_name="Term Sheet",
+        provider="Ravlo",
+        status=status,
+    )
+    db_session.add(doc)
+    db_session.commit()
+    return user, profile, doc
+
+
+def test_submit_without_signature_is_rejected(db_session, client, monkeypatch):
+    scheduled = []
+    monkeypatch.setattr(investor_routes, "run_in_background", lambda *args: scheduled.append(args))
+    user, _profile, doc = _make_investor_with_doc(db_session)
+    login_as(client, user)
+
+    resp = client.post(f"/investor/esign/sign/{doc.id}", data={})
+
+    assert resp.status_code == 302
+    with client.session_transaction() as sess:
+        assert sess["_flashes"] == [("danger", "Please draw your signature before submitting.")]
+    assert scheduled == []
+
+
+def test_finalizing_an_already_signed_document_is_a_no_op(db_session, monkeypatch):
+    stamped = []
+    monkeypatch.setattr(investor_routes, "add_signature_to_pdf", lambda *args: stamped.append(args))
+    _user, profile, doc = _make_investor_with_doc(db_session, status="Signed")
+    before = db.session.query(LoanDocument).count()
+
+    investor_routes._finalize_esign(doc.id, profile.id, "signatures/sign.png", "signed_docs/signed.pdf")
+
+    assert stamped == []
+    assert db.session.query(LoanDocument).count() == before
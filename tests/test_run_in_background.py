@@ -0,0 +1,56 @@
+"""run_in_background() (utils/background.py) hands post-response work such as
+e-sign PDF stamping to the Socket.IO background worker
+inside an app context, runs it inline when Socket.IO isn't attached, and
+never lets a failing task escape into the request.
+"""
+from types import SimpleNamespace
+
+from flask import current_app
+
+from LoanMVP.utils.background import run_in_background
+
+
+def test_task_is_handed_to_the_socketio_worker(app, monkeypatch):
+    started = []
+    monkeypatch.setattr(app, "socketio", SimpleNamespace(start_background_task=started.append), raising=False)
+    seen = []
+
+    with app.test_request_context():
+        run_in_background(seen.append, "receipt")
+        assert seen == []  # not run during the request
+
+    assert len(started) == 1
+    started[0]()
+    assert seen == ["receipt"]
+
+
+def test_task_runs_inside_an_app_context(app, monkeypatch):
+    started = []
+    monkeypatch.setattr(app, "socketio", SimpleNamespace(start_background_task=started.append), raising=False)
+    names = []
+
+    with app.test_request_context():
+        run_in_background(lambda: names.append(current_app.name))
+
+    started[0]()
+    assert names == [app.name]
+
+
+def test_runs_inline_without_socketio(app, monkeypatch):
+    monkeypatch.setattr(app, "socketio", None, raising=False)
+    seen = []
+
+    with app.test_request_context():
+        run_in_background(seen.append, "inline")
+
+    assert seen == ["inline"]
+
+
+def test_failing_task_is_logged_not_raised(app, monkeypatch):
+    monkeypatch.setattr(app, "socketio", None, raising=False)
+
+    def boom():
+        raise RuntimeError("stamping failed")
+
+    with app.test_request_context():
+        run_in_background(boom)  # must not raise
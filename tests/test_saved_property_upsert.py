@@ -0,0 +1,96 @@
+"""_upsert_saved_property_row() (investor_saved_property_helpers.py) saves a
+property once per investor: a repeat save of the same address, or of the
+same property_id under a differently formatted address, fills in the
+existing row instead of inserting a duplicate.
+"""
+from datetime import datetime
+from types import SimpleNamespace
+
+from LoanMVP.models.admin import Company
+from LoanMVP.models.investor_models import InvestorProfile
+from LoanMVP.models.property import SavedProperty
+from LoanMVP.models.user_model import User
+from LoanMVP.services.investor.investor_saved_property_helpers import (
+    _is_missing_upsert_arbiter,
+    _upsert_saved_property_row,
+)
+
+
+def _make_investor(db_session, email="saver@example.com"):
+    company = Company(name="Upsert Co", is_active=True)
+    db_session.add(company)
+    db_session.commit()
+
+    user = User(email=email, role="investor", is_active=True, company_id=company.id)
+    db_session.add(user)
+    db_session.commit()
+
+    profile = InvestorProfile(user_id=user.id, full_name="Ivy Vestor")
+    db_session.add(profile)
+    db_session.commit()
+    return profile
+
+
+def _save(db_session, profile, **values):
+    values.setdefault("property_id", None)
+    values.setdefault("price", "")
+    values.setdefault("sqft", None)
+    values.setdefault("zipcode", None)
+    result = _upsert_saved_property_row(profile.id, values, datetime.utcnow())
+    db_session.commit()
+    return result
+
+
+def test_first_save_inserts_a_row(db_session):
+    profile = _make_investor(db_session)
+
+    saved_id, created = _save(db_session, profile, address="12 Palm Ave", price="250000")
+
+    assert created is True
+    saved = db_session.get(SavedProperty, saved_id)
+    assert (saved.address, saved.price) == ("12 Palm Ave", "250000")
+
+
+def test_repeat_address_fills_blanks_on_the_existing_row(db_session):
+    profile = _make_investor(db_session)
+    first_id, _ = _save(db_session, profile, address="12 Palm Ave")
+
+    saved_id, created = _save(db_session, profile, address="12  PALM AVE", price="260000", sqft=1400)
+
+    assert (saved_id, created) == (first_id, False)
+    assert SavedProperty.query.filter_by(investor_profile_id=profile.id).count() == 1
+    saved = db_session.get(SavedProperty, saved_id)
+    assert (saved.price, saved.sqft) == ("260000", 1400)
+
+
+def test_property_id_match_wins_over_a_different_address(db_session):
+    profile = _make_investor(db_session)
+    first_id, _ = _save(db_session, profile, address="12 Palm Ave", property_id="attom-1")
+
+    saved_id, created = _save(db_session, profile, address="12 Palm Avenue, Tampa FL", property_id="attom-1")
+
+    assert (saved_id, created) == (first_id, False)
+    assert SavedProperty.query.filter_by(investor_profile_id=profile.id).count() == 1
+
+
+def test_other_investors_rows_are_not_matched(db_session):
+    owner = _make_investor(db_session, "owner@example.com")
+    other = _make_investor(db_session, "other@example.com")
+    owner_id, _ = _save(db_session, owner, address="12 Palm Ave", property_id="attom-1")
+
+    saved_id, created = _save(db_session, other, address="12 Palm Ave", property_id="attom-1")
+
+    assert created is True
+    assert saved_id != owner_id
+
+
+def test_only_a_missing_unique_index_is_treated_as_fallback():
+    missing_pg = SimpleNamespace(orig=SimpleNamespace(pgcode="42P10"))
+    missing_sqlite = SimpleNamespace(
+        orig=Exception("ON CONFLICT clause does not match any PRIMARY KEY or UNIQUE constraint")
+    )
+    deadlock = SimpleNamespace(orig=SimpleNamespace(pgcode="40P01"))
+
+    assert _is_missing_upsert_arbiter(missing_pg) is True
+    assert _is_missing_upsert_arbiter(missing_sqlite) is True
+    assert _is_missing_upsert_arbiter(deadlock) is False
@@ -0,0 +1,18 @@
+"""split_ids() (investor_helpers.py) parses comma/semicolon-separated id
+lists from form fields, skipping malformed tokens and de-duplicating while
+keeping first-seen order.
+"""
+from LoanMVP.services.investor.investor_helpers import split_ids
+
+
+def test_split_ids_handles_mixed_separators_and_duplicates():
+    assert split_ids("3; 1, 3 ,2;;1") == [3, 1, 2]
+
+
+def test_split_ids_skips_malformed_tokens():
+    assert split_ids("12abc, 4, 1.5, 5 6, 7") == [4, 7]
+
+
+def test_split_ids_empty_input():
+    assert split_ids("") == []
+    assert split_ids(None) == []
@@ -0,0 +1,59 @@
+"""TTLCache (utils/ttl_cache.py) expires entries after their TTL, evicts the
+oldest write past max_entries, and keeps expired entries readable as stale
+values for stale_ttl seconds.
+"""
+from LoanMVP.utils import ttl_cache
+from LoanMVP.utils.ttl_cache import TTLCache
+
+
+def _freeze(monkeypatch, clock):
+    monkeypatch.setattr(ttl_cache.time, "time", lambda: clock[0])
+
+
+def test_entries_expire_after_their_ttl(monkeypatch):
+    clock = [1000.0]
+    _freeze(monkeypatch, clock)
+    cache = TTLCache(60)
+
+    cache.set("k", "v")
+    assert cache.get("k") == "v"
+
+    clock[0] += 61
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_oldest_write_is_evicted_past_max_entries():
+    cache = TTLCache(60, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 3)  # rewriting moves "a" to the newest slot
+    cache.set("c", 4)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (3, 4)
+
+
+def test_stale_reads_until_the_stale_window_ends(monkeypatch):
+    clock = [1000.0]
+    _freeze(monkeypatch, clock)
+    cache = TTLCache(60, stale_ttl=300)
+    cache.set("k", "v")
+
+    clock[0] += 120
+    assert cache.get("k") is None
+    assert cache.get("k", allow_stale=True) == "v"
+
+    clock[0] += 300
+    assert cache.get("k", allow_stale=True) is None
+
+
+def test_stale_ttl_none_keeps_expired_entries_until_overwritten(monkeypatch):
+    clock = [1000.0]
+    _freeze(monkeypatch, clock)
+    cache = TTLCache(60, stale_ttl=None)
+    cache.set("k", "v")
+
+    clock[0] += 10_000
+    assert cache.get("k") is None
+    assert cache.get("k", allow_stale=True) == "v"